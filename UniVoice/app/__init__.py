@@ -1,23 +1,52 @@
 import os
 from flask import Flask
+from werkzeug.middleware.proxy_fix import ProxyFix
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
+from flask_migrate import Migrate
 from authlib.integrations.flask_client import OAuth  # <--- 1. NEW IMPORT
+from app.cache import ReferenceCache
+from app.events import Events
+from app.tasks import TaskRunner
+from app.profiling import Profiler
+from app.rendering import RenderCache
+from app.ratelimit import RateLimiter
+from app.database import init_engine, RoutingSession
+from config import Config
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})  # GETs may read from a replica
 login_manager = LoginManager()
+migrate = Migrate()
 oauth = OAuth()  # <--- 2. INITIALIZE
+reference_cache = ReferenceCache()
+events = Events()
+tasks = TaskRunner()
+profiler = Profiler()
+render_cache = RenderCache()
+limiter = RateLimiter()
 
-def create_app():
+def create_app(config_object=None):
     app = Flask(__name__)
     
-    # Config
-    app.config['SECRET_KEY'] = 'dev-secret-key'
-    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///site.db')
-    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # Config: every setting and its default is in config.Config (environment variables)
+    app.config.from_object(config_object or Config)
+
+    # Behind PROXY_FIX reverse proxies, request.remote_addr is the real client
+    if app.config['PROXY_FIX']:
+        hops = app.config['PROXY_FIX']
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=hops, x_proto=hops)
 
     # Init Plugins
-    db.init_app(app)
+    init_engine(app, db)  # db.init_app with pool settings / SQLite pragmas
+    from app.search import include_object
+    migrate.init_app(app, db, include_object=include_object)
+    reference_cache.init_app(app)
+    events.init_app(app)
+    tasks.init_app(app, db)
+    profiler.init_app(app, db)
+    render_cache.init_app(app)
+    limiter.init_app(app)
+    from app import jobs  # registers the background jobs
     login_manager.init_app(app)
     login_manager.login_view = 'main.login' 
 
@@ -34,11 +63,19 @@ def create_app():
     # Register Blueprints
     from app.routes import main
     app.register_blueprint(main)
+    from app.api import api
+    app.register_blueprint(api)
+
+    # CLI Commands
+    from app.commands import register_commands
+    register_commands(app)
 
     # User Loader
-    from app.models import User
+    # current_user is a cached identity snapshot (see app/identity.py),
+    # so role checks and dashboard headers don't need a users query.
+    from app.identity import load_identity
     @login_manager.user_loader
     def load_user(user_id):
-        return User.query.get(int(user_id))
+        return load_identity(user_id)
 
     return app
\ No newline at end of file
@@ -0,0 +1,194 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from itertools import chain
+from app import db
+from app.models import Complaint, ArchivedComplaint, ComplaintDailyStat, ComplaintStatus
+
+# Incremental rollup of complaint activity per (hostel, category, status, day).
+#
+# record_created / record_transition are called in the same transaction as
+# the change they count, so the rollup never disagrees with a committed write.
+# Reports then read O(days x hostels x categories) rows instead of every complaint.
+# Deleting a complaint does not remove it from past days; rebuild() recounts
+# from the complaints that still exist.
+
+# Statuses a complaint can be filed in (see the student dashboard)
+INITIAL_STATUSES = (ComplaintStatus.PENDING, ComplaintStatus.FLAGGED)
+
+KEY = ('hostel_id', 'category', 'status', 'day')
+COUNTERS = ('created_count', 'transition_count', 'age_seconds')
+
+
+def _value(enum_or_str):
+    return getattr(enum_or_str, 'value', enum_or_str)
+
+
+def _upsert(hostel_id, category, status, day, **counters):
+    """
+    Adds `counters` to the row for the key, creating it if needed (one statement).
+    """
+    values = {'hostel_id': hostel_id, 'category': _value(category), 'status': _value(status), 'day': day}
+    values.update({name: counters.get(name, 0) for name in COUNTERS})
+
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        insert = None
+
+    table = ComplaintDailyStat.__table__
+    if insert is not None:
+        stmt = insert(table).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(KEY),
+            set_={name: table.c[name] + stmt.excluded[name] for name in COUNTERS},
+        )
+        db.session.execute(stmt)
+        return
+
+    # Other databases: update, then insert if the row didn't exist yet
+    result = db.session.execute(
+        db.update(table)
+        .where(*[table.c[k] == values[k] for k in KEY])
+        .values({name: table.c[name] + values[name] for name in COUNTERS})
+    )
+    if result.rowcount == 0:
+        db.session.execute(db.insert(table).values(**values))
+
+
+def record_created(complaint):
+    """
+    Counts a new complaint. Call after flush, so created_at is set.
+    """
+    _upsert(complaint.hostel_id, complaint.category, complaint.status,
+            (complaint.created_at or datetime.utcnow()).date(), created_count=1)
+
+
+def record_transition(complaint, new_status, at=None):
+    """
+    Counts `complaint` moving into `new_status` at `at`, with its age at that moment.
+    """
+    at = at or datetime.utcnow()
+    age = int((at - complaint.created_at).total_seconds()) if complaint.created_at else 0
+    _upsert(complaint.hostel_id, complaint.category, new_status, at.date(),
+            transition_count=1, age_seconds=max(age, 0))
+
+
+def record_transitions(complaints, new_status, at=None):
+    """
+    record_transition for many complaints, with one upsert per (hostel, category).
+    Anything with hostel_id, category and created_at works, e.g. query rows.
+    """
+    at = at or datetime.utcnow()
+    totals = defaultdict(lambda: [0, 0])
+    for complaint in complaints:
+        age = int((at - complaint.created_at).total_seconds()) if complaint.created_at else 0
+        entry = totals[(complaint.hostel_id, _value(complaint.category))]
+        entry[0] += 1
+        entry[1] += max(age, 0)
+    for (hostel_id, category), (count, age_seconds) in totals.items():
+        _upsert(hostel_id, category, new_status, at.date(), transition_count=count, age_seconds=age_seconds)
+
+
+def rebuild(batch_size=5000):
+    """
+    Recomputes the whole rollup from the complaints and archived_complaints
+    tables in one streaming pass.
+    History is approximated: every complaint is counted as filed (pending or
+    flagged) and, if it has moved on, as entering its current status at
+    resolved_at (or updated_at).
+    """
+    totals = defaultdict(lambda: [0, 0, 0])
+    rows = chain.from_iterable(
+        db.session.query(
+            model.hostel_id, model.category, model.status, model.is_abusive,
+            model.created_at, model.resolved_at, model.updated_at,
+        ).yield_per(batch_size)
+        for model in (Complaint, ArchivedComplaint)
+    )
+
+    for hostel_id, category, status, is_abusive, created_at, resolved_at, updated_at in rows:
+        created_at = created_at or updated_at or datetime.utcnow()
+        initial = ComplaintStatus.FLAGGED if is_abusive else ComplaintStatus.PENDING
+        totals[(hostel_id, category.value, initial.value, created_at.date())][0] += 1
+
+        if status and status != initial:
+            moved_at = resolved_at if status == ComplaintStatus.RESOLVED and resolved_at else (updated_at or created_at)
+            entry = totals[(hostel_id, category.value, status.value, moved_at.date())]
+            entry[1] += 1
+            entry[2] += max(int((moved_at - created_at).total_seconds()), 0)
+
+    db.session.execute(db.delete(ComplaintDailyStat))
+    mappings = [
+        dict(zip(KEY + COUNTERS, key + tuple(counts)))
+        for key, counts in totals.items()
+    ]
+    for i in range(0, len(mappings), batch_size):
+        db.session.execute(db.insert(ComplaintDailyStat), mappings[i:i + batch_size])
+    db.session.commit()
+    return len(mappings)
+
+
+# --- REPORTS ---
+
+def default_range(days=30):
+    today = datetime.utcnow().date()
+    return today - timedelta(days=days - 1), today
+
+
+def _filtered(query, start, end, hostel_id=None, category=None):
+    query = query.filter(ComplaintDailyStat.day >= start, ComplaintDailyStat.day <= end)
+    if hostel_id is not None:
+        query = query.filter(ComplaintDailyStat.hostel_id == int(hostel_id))
+    if category:
+        query = query.filter(ComplaintDailyStat.category == _value(category))
+    return query
+
+
+def _metrics(created, resolved, rejected, resolve_seconds):
+    return {
+        'created': int(created or 0),
+        'resolved': int(resolved or 0),
+        'rejected': int(rejected or 0),
+        'avg_resolution_hours': round(resolve_seconds / resolved / 3600, 2) if resolved else None,
+    }
+
+
+def _aggregates():
+    stat = ComplaintDailyStat
+    is_resolved = stat.status == ComplaintStatus.RESOLVED.value
+    return (
+        db.func.sum(stat.created_count),
+        db.func.sum(db.case((is_resolved, stat.transition_count), else_=0)),
+        db.func.sum(db.case((stat.status == ComplaintStatus.REJECTED.value, stat.transition_count), else_=0)),
+        db.func.sum(db.case((is_resolved, stat.age_seconds), else_=0)),
+    )
+
+
+def daily(start, end, hostel_id=None, category=None):
+    """
+    One entry per day with activity: volume filed, resolved/rejected, average time to resolve.
+    """
+    query = db.session.query(ComplaintDailyStat.day, *_aggregates())
+    query = _filtered(query, start, end, hostel_id, category) \
+        .group_by(ComplaintDailyStat.day).order_by(ComplaintDailyStat.day)
+    return [dict(day=day, **_metrics(*totals)) for day, *totals in query]
+
+
+SUMMARY_GROUPS = {
+    'hostel': ComplaintDailyStat.hostel_id,
+    'category': ComplaintDailyStat.category,
+}
+
+
+def summary(start, end, group_by='category', hostel_id=None, category=None):
+    """
+    Totals over the range, grouped by hostel or category.
+    e.g. summary(start, end, 'category', hostel_id=3)['electric']['avg_resolution_hours']
+    """
+    column = SUMMARY_GROUPS[group_by]
+    query = db.session.query(column, *_aggregates())
+    query = _filtered(query, start, end, hostel_id, category).group_by(column)
+    return {key: _metrics(*totals) for key, *totals in query}
\ No newline at end of file
@@ -0,0 +1,11 @@
+from flask import Blueprint
+
+# Versioned JSON API for the React frontend (univoice-frontend).
+# Shapes follow univoice-frontend/src/types/index.ts: camelCase keys, string ids.
+api = Blueprint('api', __name__, url_prefix='/api/v1')
+
+from .utils import compress_response
+api.after_request(compress_response)
+
+# Import the routes so they get registered with the Blueprint
+from . import complaints, users, hostels, analytics
@@ -0,0 +1,82 @@
+from datetime import date
+from flask import request
+from flask_login import current_user
+from app import analytics
+from app.models import UserRole, Category
+from . import api
+from .utils import api_login_required, error, json_with_etag
+
+# Reports read the complaint_daily_stats rollup (app/analytics.py),
+# so their cost grows with the number of days, not complaints.
+MAX_RANGE_DAYS = 366
+
+
+def _metrics_json(metrics):
+    return {
+        'created': metrics['created'],
+        'resolved': metrics['resolved'],
+        'rejected': metrics['rejected'],
+        'avgResolutionHours': metrics['avg_resolution_hours'],
+    }
+
+
+def _params():
+    """
+    (start, end, hostel_id, category) from ?from=&to=&hostelId=&category=.
+    Wardens are always limited to their own hostel, and get nothing without one.
+    """
+    if current_user.role not in (UserRole.ADMIN, UserRole.WARDEN):
+        error('Forbidden', 403)
+
+    start, end = analytics.default_range()
+    try:
+        if request.args.get('from'):
+            start = date.fromisoformat(request.args['from'])
+        if request.args.get('to'):
+            end = date.fromisoformat(request.args['to'])
+        category = Category(request.args['category']).value if request.args.get('category') else None
+    except ValueError:
+        error('Invalid date or category', 400)
+    if start > end or (end - start).days >= MAX_RANGE_DAYS:
+        error(f'Date range must be 1-{MAX_RANGE_DAYS} days', 400)
+
+    hostel_id = request.args.get('hostelId', type=int)
+    if current_user.role == UserRole.WARDEN:
+        if current_user.hostel_id is None:
+            error('Forbidden', 403)
+        hostel_id = current_user.hostel_id
+    return start, end, hostel_id, category
+
+
+@api.route('/analytics/daily')
+@api_login_required
+def analytics_daily():
+    """
+    GET /api/v1/analytics/daily?from=2025-01-01&to=2025-01-31&hostelId=&category=
+    """
+    start, end, hostel_id, category = _params()
+    rows = analytics.daily(start, end, hostel_id, category)
+    return json_with_etag({
+        'from': start.isoformat(),
+        'to': end.isoformat(),
+        'data': [dict(day=row['day'].isoformat(), **_metrics_json(row)) for row in rows],
+    })
+
+
+@api.route('/analytics/summary')
+@api_login_required
+def analytics_summary():
+    """
+    GET /api/v1/analytics/summary?groupBy=category|hostel&from=&to=&hostelId=&category=
+    """
+    start, end, hostel_id, category = _params()
+    group_by = request.args.get('groupBy', 'category')
+    if group_by not in analytics.SUMMARY_GROUPS:
+        error('groupBy must be "category" or "hostel"', 400)
+    totals = analytics.summary(start, end, group_by, hostel_id, category)
+    return json_with_etag({
+        'from': start.isoformat(),
+        'to': end.isoformat(),
+        'groupBy': group_by,
+        'data': [dict(key=str(key), **_metrics_json(metrics)) for key, metrics in sorted(totals.items())],
+    })
\ No newline at end of file
@@ -0,0 +1,96 @@
+from flask import request
+from flask_login import current_user
+from app import db
+from app.models import User, UserRole, Complaint, ComplaintStatus, Category
+from app.listing import apply_keyset, encode_cursor, get_per_page
+from app.stats import BUCKETS
+from . import api
+from .serializers import COMPLAINT_FIELDS, serialize
+from .utils import api_login_required, error, parse_fields, parse_per_page, make_etag, not_modified, json_with_etag
+
+
+def scoped_complaints(user):
+    """
+    The complaints `user` may read: own (student), hostel (warden),
+    mentees' (mentor) or everything (admin).
+    """
+    query = Complaint.query
+    if user.role == UserRole.STUDENT:
+        return query.filter(Complaint.user_id == user.id)
+    if user.role == UserRole.WARDEN:
+        return query.filter(Complaint.hostel_id == user.hostel_id)
+    if user.role == UserRole.MENTOR:
+        mentees = db.select(User.id).where(User.mentor_id == user.id)
+        return query.filter(Complaint.user_id.in_(mentees))
+    if user.role == UserRole.ADMIN:
+        return query
+    return None
+
+
+def _apply_filters(query):
+    args = request.args
+    try:
+        if args.get('status'):
+            query = query.filter(Complaint.status == ComplaintStatus(args['status']))
+        if args.get('category'):
+            query = query.filter(Complaint.category == Category(args['category']))
+    except ValueError:
+        error('Invalid status or category', 400)
+    if args.get('hostelId'):
+        query = query.filter(Complaint.hostel_id == args.get('hostelId', type=int))
+    if args.get('section'):
+        if args['section'] not in BUCKETS:
+            error('Invalid section', 400)
+        query = query.filter(BUCKETS[args['section']])
+    return query
+
+
+@api.route('/complaints')
+@api_login_required
+def list_complaints():
+    """
+    GET /api/v1/complaints?status=&category=&hostelId=&section=&fields=&per_page=&cursor=
+
+    The page's (id, created_at, updated_at) keys are read first; when they
+    match the client's ETag the answer is a 304 and no rows are loaded.
+    """
+    query = scoped_complaints(current_user)
+    if query is None:
+        error('Forbidden', 403)
+    query = _apply_filters(query)
+
+    fields = parse_fields(COMPLAINT_FIELDS)
+    per_page = parse_per_page(get_per_page())
+    cursor = request.args.get('cursor')
+
+    keys = apply_keyset(
+        query.with_entities(Complaint.id, Complaint.created_at, Complaint.updated_at), cursor, per_page
+    ).all()
+    etag = make_etag(current_user.id, fields, keys)
+    cached = not_modified(etag)
+    if cached:
+        return cached
+
+    next_cursor = encode_cursor(keys[per_page - 1]) if len(keys) > per_page else None
+    ids = [k.id for k in keys[:per_page]]
+    by_id = {c.id: c for c in Complaint.query.filter(Complaint.id.in_(ids))} if ids else {}
+
+    return json_with_etag({
+        'data': [serialize(by_id[i], fields, COMPLAINT_FIELDS) for i in ids if i in by_id],
+        'nextCursor': next_cursor,
+    }, etag)
+
+
+@api.route('/complaints/<int:complaint_id>')
+@api_login_required
+def get_complaint(complaint_id):
+    query = scoped_complaints(current_user)
+    if query is None:
+        error('Forbidden', 403)
+    complaint = query.filter(Complaint.id == complaint_id).first()
+    if complaint is None:
+        error('Not found', 404)
+
+    fields = parse_fields(COMPLAINT_FIELDS)
+    etag = make_etag(current_user.id, fields, complaint.id, complaint.updated_at)
+    return not_modified(etag) or json_with_etag(serialize(complaint, fields, COMPLAINT_FIELDS), etag)
@@ -0,0 +1,20 @@
+from app import reference
+from . import api
+from .serializers import HOSTEL_FIELDS, serialize
+from .utils import api_login_required, error, parse_fields, json_with_etag
+
+
+@api.route('/hostels')
+@api_login_required
+def list_hostels():
+    fields = parse_fields(HOSTEL_FIELDS)
+    return json_with_etag({'data': [serialize(h, fields, HOSTEL_FIELDS) for h in reference.get_hostels()]})
+
+
+@api.route('/hostels/<int:hostel_id>')
+@api_login_required
+def get_hostel(hostel_id):
+    hostel = reference.get_hostel(hostel_id)
+    if hostel is None:
+        error('Not found', 404)
+    return json_with_etag(serialize(hostel, parse_fields(HOSTEL_FIELDS), HOSTEL_FIELDS))
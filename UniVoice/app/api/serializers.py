@@ -0,0 +1,46 @@
+def _iso(value):
+    return value.isoformat() if value else None
+
+
+def _id(value):
+    return str(value) if value is not None else None
+
+
+# field name -> getter; the keys are what ?fields= may ask for
+COMPLAINT_FIELDS = {
+    'id': lambda c: str(c.id),
+    'heading': lambda c: c.heading,
+    'description': lambda c: c.description,
+    'category': lambda c: c.category.value,
+    'createdAt': lambda c: _iso(c.created_at),
+    'resolvedAt': lambda c: _iso(c.resolved_at),
+    'updatedAt': lambda c: _iso(c.updated_at),
+    'status': lambda c: c.status.value if c.status else None,
+    'isUrgent': lambda c: bool(c.is_urgent),
+    'isAbusive': lambda c: bool(c.is_abusive),
+    'mentorComment': lambda c: c.mentor_comment,
+    'wardenComment': lambda c: c.warden_comment,
+    'userId': lambda c: str(c.user_id),
+    'hostelId': lambda c: str(c.hostel_id),
+}
+
+USER_FIELDS = {
+    'id': lambda u: str(u.id),
+    'email': lambda u: u.email,
+    'name': lambda u: u.name,
+    'role': lambda u: u.role.value,
+    'hostelId': lambda u: _id(u.hostel_id),
+    'roomNumber': lambda u: u.room_number,
+    'mentorId': lambda u: _id(u.mentor_id),
+}
+
+HOSTEL_FIELDS = {
+    'id': lambda h: str(h.id),
+    'name': lambda h: h.name,
+    'gender': lambda h: h.gender,
+    'totalRooms': lambda h: h.total_rooms,
+}
+
+
+def serialize(obj, fields, getters):
+    return {name: getters[name](obj) for name in fields}
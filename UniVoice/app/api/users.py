@@ -0,0 +1,72 @@
+from flask import request
+from flask_login import current_user
+from app.models import User, UserRole
+from . import api
+from .serializers import USER_FIELDS, serialize
+from .utils import api_login_required, error, parse_fields, parse_per_page, json_with_etag
+
+
+def scoped_users(user):
+    """
+    Admins see everyone, wardens their hostel, mentors their mentees.
+    """
+    if user.role == UserRole.ADMIN:
+        return User.query
+    if user.role == UserRole.WARDEN:
+        return User.query.filter(User.hostel_id == user.hostel_id)
+    if user.role == UserRole.MENTOR:
+        return User.query.filter(User.mentor_id == user.id)
+    return None
+
+
+@api.route('/users/me')
+@api_login_required
+def get_me():
+    fields = parse_fields(USER_FIELDS)
+    return json_with_etag(serialize(current_user, fields, USER_FIELDS))
+
+
+@api.route('/users')
+@api_login_required
+def list_users():
+    """
+    GET /api/v1/users?role=&hostelId=&fields=&per_page=&cursor=
+    Keyset-paged by id; `cursor` is the last id of the previous page.
+    """
+    query = scoped_users(current_user)
+    if query is None:
+        error('Forbidden', 403)
+
+    if request.args.get('role'):
+        try:
+            query = query.filter(User.role == UserRole(request.args['role']))
+        except ValueError:
+            error('Invalid role', 400)
+    if request.args.get('hostelId'):
+        query = query.filter(User.hostel_id == request.args.get('hostelId', type=int))
+
+    fields = parse_fields(USER_FIELDS)
+    per_page = parse_per_page(100)
+    after = request.args.get('cursor', type=int)
+    if after:
+        query = query.filter(User.id > after)
+
+    rows = query.order_by(User.id).limit(per_page + 1).all()
+    next_cursor = str(rows[per_page - 1].id) if len(rows) > per_page else None
+
+    return json_with_etag({
+        'data': [serialize(u, fields, USER_FIELDS) for u in rows[:per_page]],
+        'nextCursor': next_cursor,
+    })
+
+
+@api.route('/users/<int:user_id>')
+@api_login_required
+def get_user(user_id):
+    if user_id == current_user.id:
+        return get_me()
+    query = scoped_users(current_user)
+    user = query.filter(User.id == user_id).first() if query is not None else None
+    if user is None:
+        error('Not found', 404)
+    return json_with_etag(serialize(user, parse_fields(USER_FIELDS), USER_FIELDS))
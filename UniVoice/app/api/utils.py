@@ -0,0 +1,122 @@
+import gzip
+import hashlib
+from functools import wraps
+from flask import jsonify, request, abort
+from flask_login import current_user
+
+try:
+    import brotli  # optional: only used when installed and the client accepts br
+except ImportError:
+    brotli = None
+
+# Responses smaller than this aren't worth compressing
+MIN_COMPRESS_SIZE = 512
+
+
+# --- AUTH ---
+
+def api_login_required(view):
+    """
+    Like login_required, but answers 401 JSON instead of redirecting to the login page.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not current_user.is_authenticated:
+            return jsonify({'error': 'Authentication required'}), 401
+        return view(*args, **kwargs)
+    return wrapper
+
+
+def error(message, status):
+    response = jsonify({'error': message})
+    response.status_code = status
+    abort(response)
+
+
+# --- SPARSE FIELDSETS ---
+
+def parse_fields(getters):
+    """
+    Fields requested with ?fields=a,b,c (all fields when absent).
+    Unknown names are a 400.
+    """
+    raw = request.args.get('fields')
+    if not raw:
+        return list(getters)
+    fields = [f.strip() for f in raw.split(',') if f.strip()]
+    unknown = [f for f in fields if f not in getters]
+    if unknown:
+        error(f"Unknown field(s): {', '.join(unknown)}", 400)
+    return fields
+
+
+def parse_per_page(default, maximum=200):
+    try:
+        return max(1, min(int(request.args.get('per_page', default)), maximum))
+    except ValueError:
+        error('per_page must be a number', 400)
+
+
+# --- CONDITIONAL GET ---
+
+def make_etag(*parts):
+    """
+    Weak ETag over `parts`: the representation may be gzip/brotli encoded,
+    so only semantic equivalence is promised.
+    """
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+    return digest
+
+
+def not_modified(etag):
+    """
+    304 response if the client's If-None-Match already has `etag`, else None.
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = jsonify()
+        response.status_code = 304
+        response.set_etag(etag, weak=True)
+        response.data = b''
+        return response
+    return None
+
+
+def json_with_etag(payload, etag=None):
+    """
+    JSON response carrying a weak ETag. Without a precomputed `etag`,
+    the body itself is hashed and a matching If-None-Match yields 304.
+    """
+    response = jsonify(payload)
+    if etag is None:
+        etag = hashlib.sha1(response.get_data()).hexdigest()
+        cached = not_modified(etag)
+        if cached:
+            return cached
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+# --- COMPRESSION ---
+
+def compress_response(response):
+    """
+    after_request hook: brotli or gzip depending on Accept-Encoding.
+    """
+    response.vary.add('Accept-Encoding')
+    if (response.status_code != 200 or response.direct_passthrough
+            or 'Content-Encoding' in response.headers):
+        return response
+
+    data = response.get_data()
+    if len(data) < MIN_COMPRESS_SIZE:
+        return response
+
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        response.set_data(brotli.compress(data, quality=5))
+        response.headers['Content-Encoding'] = 'br'
+    elif accepted['gzip']:
+        response.set_data(gzip.compress(data, compresslevel=6))
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
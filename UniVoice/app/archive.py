@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+from app import db
+from app.models import Complaint, ArchivedComplaint, ComplaintBucket, ComplaintStatus, Notification
+
+# Moves old closed complaints out of the hot `complaints` table.
+#
+# A complaint is archived once it has been resolved or rejected for longer
+# than ARCHIVE_AFTER_DAYS. Each batch is copied with INSERT ... SELECT into
+# archived_complaints (same id) and deleted from complaints in one
+# transaction, so a row is always in exactly one of the two tables. The
+# search triggers move it between the two full-text indexes as it goes.
+#
+# The daily analytics rollup is not touched: it already counted the
+# complaint, and analytics.rebuild() reads both tables.
+
+ARCHIVABLE_STATUSES = (ComplaintStatus.RESOLVED, ComplaintStatus.REJECTED)
+
+# Columns copied as-is; archived_at is added on the way
+COPIED_COLUMNS = [c.name for c in Complaint.__table__.columns]
+
+
+def archivable(cutoff):
+    """
+    Filter for closed complaints last touched before `cutoff`.
+    """
+    closed_at = db.func.coalesce(Complaint.resolved_at, Complaint.updated_at, Complaint.created_at)
+    return db.and_(Complaint.status.in_(ARCHIVABLE_STATUSES), closed_at < cutoff)
+
+
+def archive_complaints(older_than_days, batch_size=1000, dry_run=False, progress=None):
+    """
+    Archives closed complaints older than `older_than_days`, oldest ids first.
+    Returns how many were (or, with `dry_run`, would be) archived.
+    """
+    now = datetime.utcnow()
+    condition = archivable(now - timedelta(days=older_than_days))
+    if dry_run:
+        return db.session.query(db.func.count(Complaint.id)).filter(condition).scalar()
+
+    complaints = Complaint.__table__
+    archived = ArchivedComplaint.__table__
+    moved = 0
+    while True:
+        ids = [i for (i,) in db.session.query(Complaint.id).filter(condition)
+               .order_by(Complaint.id).limit(batch_size)]
+        if not ids:
+            break
+        # Duplicates go along with their parent issue (they were closed with it)
+        ids += [i for (i,) in db.session.query(Complaint.id)
+                .filter(Complaint.parent_id.in_(ids), condition, Complaint.id.notin_(ids))]
+
+        select = db.select(*[complaints.c[name] for name in COPIED_COLUMNS], db.literal(now)) \
+            .where(complaints.c.id.in_(ids))
+        db.session.execute(archived.insert().from_select(COPIED_COLUMNS + ['archived_at'], select))
+        # Same as the foreign key's ON DELETE SET NULL, which SQLite does not enforce by default
+        db.session.execute(db.update(Notification).where(Notification.complaint_id.in_(ids))
+                           .values(complaint_id=None))
+        db.session.execute(db.update(Complaint).where(Complaint.parent_id.in_(ids), Complaint.id.notin_(ids))
+                           .values(parent_id=None))
+        db.session.execute(db.delete(ComplaintBucket).where(ComplaintBucket.complaint_id.in_(ids)))
+        db.session.execute(complaints.delete().where(complaints.c.id.in_(ids)))
+        db.session.commit()
+
+        moved += len(ids)
+        if progress:
+            progress(moved)
+    return moved
+
+
+def student_history(user_id):
+    """
+    All of a student's complaints, active and archived, newest first.
+    """
+    active = Complaint.query.filter_by(user_id=user_id).all()
+    archived = ArchivedComplaint.query.filter_by(user_id=user_id).all()
+    return sorted(active + archived, key=lambda c: c.created_at or datetime.min, reverse=True)
\ No newline at end of file
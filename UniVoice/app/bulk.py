@@ -0,0 +1,178 @@
+from datetime import datetime
+from app import db, tasks
+from app.models import Complaint, ComplaintBucket, ComplaintStatus, Notification, User
+from app.analytics import record_transitions
+from app.live import complaint_event, publish, publish_complaint, STATUS_CHANGED, COMMENT_UPDATED, COMPLAINT_DELETED
+
+# Warden and admin actions on many complaints at once.
+#
+# A bulk action names complaints by id, by a filter, or both, always inside a
+# `scope` (the SQL conditions the caller may touch, e.g. the warden's hostel).
+# One SELECT reads the matching rows, so side effects know each row's old
+# status; one UPDATE or DELETE per CHUNK ids then applies the change, with the
+# scope repeated in its WHERE clause. Rows outside the scope are never
+# touched, and are reported as 'not_found' so other hostels can't be probed.
+#
+# Duplicates (see app/duplicates.py) follow their parent on updates, as on
+# the single-complaint form. Deleting a parent detaches its reports.
+
+CHUNK = 500
+
+UPDATED, UNCHANGED, DELETED, NOT_FOUND = 'updated', 'unchanged', 'deleted', 'not_found'
+
+
+def parse_ids(values):
+    """
+    Complaint ids from form or JSON values, in order, without repeats.
+    Raises ValueError unless `values` is a list of integers (or their strings):
+    a JSON string would otherwise be read digit by digit.
+    """
+    if not isinstance(values, list):
+        raise ValueError('ids must be a list')
+    ids = []
+    for value in values:
+        if isinstance(value, bool) or not isinstance(value, (int, str)):
+            raise ValueError(f'Invalid complaint id {value!r}')
+        value = int(value)
+        if value not in ids:
+            ids.append(value)
+    return ids
+
+
+def _chunks(ids):
+    for i in range(0, len(ids), CHUNK):
+        yield ids[i:i + CHUNK]
+
+
+def _select(query, scope, ids=None, where=None, with_reports=False):
+    """
+    Rows of `query()` (complaint id first) matching `ids` and/or `where`
+    inside `scope`, locked until commit where the database supports it.
+    With `with_reports`, also the reports filed under them.
+    """
+    def scoped():
+        return query().filter(*scope).with_for_update(of=Complaint)
+
+    matching = scoped() if where is None else scoped().filter(where)
+    if ids is None:
+        rows = matching.all()
+    else:
+        rows = [row for chunk in _chunks(ids) for row in matching.filter(Complaint.id.in_(chunk))]
+
+    if with_reports:
+        seen = {row[0] for row in rows}
+        for chunk in _chunks(list(seen)):
+            for row in scoped().filter(Complaint.parent_id.in_(chunk)):
+                if row[0] not in seen:
+                    seen.add(row[0])
+                    rows.append(row)
+    return rows
+
+
+def _results(ids, outcomes):
+    """
+    {id: outcome} for every requested id (or every matched one, for a filter).
+    """
+    if ids is None:
+        return outcomes
+    results = {i: outcomes.get(i, NOT_FOUND) for i in ids}
+    results.update(outcomes)  # reports that followed their parent
+    return results
+
+
+def update_complaints(scope, ids=None, where=None, status=None, comment=None,
+                      actor_id=None, action='complaint.bulk_update', by='warden'):
+    """
+    Sets `status` and/or the warden `comment` (None leaves it as is) on the
+    matching complaints, and commits. Returns {id: 'updated' | 'unchanged' | 'not_found'}.
+    """
+    now = datetime.utcnow()
+    rows = _select(lambda: db.session.query(Complaint.id, Complaint.hostel_id, Complaint.category, Complaint.status,
+                                            Complaint.created_at, Complaint.warden_comment),
+                   scope, ids, where, with_reports=True)
+
+    outcomes, moved, commented = {}, [], set()
+    for row in rows:
+        if status is not None and row.status != status:
+            moved.append(row)
+        if comment is not None and (comment or None) != (row.warden_comment or None):
+            commented.add(row.id)
+    moved_ids = {row.id for row in moved}
+    for row in rows:
+        outcomes[row.id] = UPDATED if row.id in moved_ids or row.id in commented else UNCHANGED
+    changed = [row for row in rows if outcomes[row.id] == UPDATED]
+
+    values = {'updated_at': now}
+    if status is not None:
+        values['status'] = status
+        if status == ComplaintStatus.RESOLVED:
+            # Rows that were already resolved keep their resolution time
+            values['resolved_at'] = db.case((Complaint.status == ComplaintStatus.RESOLVED, Complaint.resolved_at),
+                                            else_=now)
+    if comment is not None:
+        values['warden_comment'] = comment
+    for chunk in _chunks([row.id for row in changed]):
+        db.session.execute(db.update(Complaint).where(Complaint.id.in_(chunk), *scope).values(values)
+                           .execution_options(synchronize_session=False))
+
+    record_transitions(moved, status, now)
+    for row in changed:
+        if row.id in moved_ids:
+            tasks.enqueue('notify-status-change', complaint_id=row.id, status=status.value)
+        if row.id in commented:
+            tasks.enqueue('notify-comment', complaint_id=row.id, by=by)
+        new_status = status if row.id in moved_ids else row.status
+        tasks.enqueue('audit', action=action, complaint_id=row.id, actor_id=actor_id,
+                      detail={'from': row.status.value if row.status else None,
+                              'to': new_status.value if new_status else None})
+    db.session.commit()
+
+    for chunk in _chunks([row.id for row in changed]):
+        for complaint, mentor_id in db.session.query(Complaint, User.mentor_id) \
+                .join(User, Complaint.user_id == User.id).filter(Complaint.id.in_(chunk)):
+            publish_complaint(STATUS_CHANGED if complaint.id in moved_ids else COMMENT_UPDATED, complaint, mentor_id)
+    return _results(ids, outcomes)
+
+
+def delete_complaints(scope, ids=None, where=None, actor_id=None):
+    """
+    Deletes the matching complaints and commits. Reports filed under a
+    deleted complaint stay, as complaints of their own.
+    Returns {id: 'deleted' | 'not_found'}.
+    """
+    now = datetime.utcnow()
+    rows = _select(lambda: db.session.query(Complaint.id, Complaint, User.mentor_id)
+                   .join(User, Complaint.user_id == User.id), scope, ids, where)
+    if not rows:
+        return _results(ids, {})
+
+    doomed = [complaint_id for complaint_id, _, _ in rows]
+    notices = [complaint_event(COMPLAINT_DELETED, complaint, mentor_id) for _, complaint, mentor_id in rows]
+    parents = {complaint.parent_id for _, complaint, _ in rows if complaint.parent_id} - set(doomed)
+    for _, complaint, _ in rows:
+        tasks.enqueue('audit', action='complaint.deleted', complaint_id=complaint.id, actor_id=actor_id,
+                      detail={'heading': complaint.heading})
+
+    # What the foreign keys would do; SQLite does not enforce them by default
+    for chunk in _chunks(doomed):
+        db.session.execute(db.update(Notification).where(Notification.complaint_id.in_(chunk))
+                           .values(complaint_id=None).execution_options(synchronize_session=False))
+        db.session.execute(db.update(Complaint).where(Complaint.parent_id.in_(chunk))
+                           .values(parent_id=None, updated_at=now).execution_options(synchronize_session=False))
+        db.session.execute(db.delete(ComplaintBucket).where(ComplaintBucket.complaint_id.in_(chunk))
+                           .execution_options(synchronize_session=False))
+        db.session.execute(db.delete(Complaint).where(Complaint.id.in_(chunk), *scope)
+                           .execution_options(synchronize_session=False))
+
+    # Parents that lost some of their reports are recounted
+    if parents:
+        reports = db.aliased(Complaint)
+        remaining = db.select(db.func.count(reports.id)).where(reports.parent_id == Complaint.id).scalar_subquery()
+        db.session.execute(db.update(Complaint).where(Complaint.id.in_(parents))
+                           .values(duplicate_count=remaining, updated_at=now)
+                           .execution_options(synchronize_session=False))
+    db.session.commit()
+
+    for channels, event in notices:
+        publish(channels, event)
+    return _results(ids, {i: DELETED for i in doomed})
\ No newline at end of file
@@ -0,0 +1,141 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from flask import g, has_request_context
+
+
+# --- BACKENDS ---
+
+class MemoryBackend:
+    """
+    In-process LRU cache with a per-entry TTL.
+    Each worker process keeps its own copy.
+    """
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class RedisBackend:
+    """
+    Shared cache for all workers.
+    `client` is anything with Redis-style get/set(ex=)/delete, so a local
+    stand-in (e.g. fakeredis) can be passed in tests.
+    """
+    def __init__(self, client, prefix='univoice:'):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url, **kwargs):
+        import redis  # optional dependency, only needed for this backend
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        return pickle.loads(raw) if raw is not None else None
+
+    def set(self, key, value, ttl=None):
+        self.client.set(self.prefix + key, pickle.dumps(value), ex=ttl or None)
+
+    def delete(self, *keys):
+        if keys:
+            self.client.delete(*[self.prefix + k for k in keys])
+
+    def clear(self):
+        for key in self.client.scan_iter(self.prefix + '*'):
+            self.client.delete(key)
+
+
+# --- CACHE FRONT ---
+
+class ReferenceCache:
+    """
+    Small read-through cache for reference data (hostel and mentor lists).
+    Values are also memoised on flask.g, so one request never asks the
+    backend twice for the same key. A ttl of 0 skips the backend.
+    """
+    def __init__(self, backend=None, ttl=300):
+        self.backend = backend or MemoryBackend()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def init_app(self, app):
+        if app.config['CACHE_BACKEND'] == 'redis':
+            self.backend = RedisBackend.from_url(app.config['CACHE_REDIS_URL'])
+        self.ttl = app.config['CACHE_TTL']
+        app.extensions['reference_cache'] = self
+
+    def _request_store(self):
+        if not has_request_context():
+            return None
+        if 'reference_cache' not in g:
+            g.reference_cache = {}
+        return g.reference_cache
+
+    def get_or_set(self, key, loader, ttl=None):
+        store = self._request_store()
+        if store is not None and key in store:
+            return store[key]
+
+        ttl = self.ttl if ttl is None else ttl
+        value = self.backend.get(key) if ttl else None
+        if value is None:
+            self.misses += 1
+            value = loader()
+            if ttl:
+                self.backend.set(key, value, ttl)
+        else:
+            self.hits += 1
+
+        if store is not None:
+            store[key] = value
+        return value
+
+    def invalidate(self, *keys):
+        self.backend.delete(*keys)
+        store = self._request_store()
+        if store is not None:
+            for key in keys:
+                store.pop(key, None)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'backend': type(self.backend).__name__,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else None,
+        }
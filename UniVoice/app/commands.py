@@ -0,0 +1,138 @@
+import sys
+import time
+import click
+from app import tasks
+from app.importer import IMPORTABLE_ROLES, DEFAULT_BATCH_SIZE, import_users
+from app.rooms import rebuild_occupancy
+from app.search import install_search_index
+from app import analytics
+from app.archive import archive_complaints
+from app import duplicates
+from app import export
+from app.models import ComplaintStatus, Category
+
+
+def _write_export(kind, fmt, args, output):
+    """
+    Streams an export to `output` (gzipped if it ends in .gz) or stdout.
+    """
+    if fmt is None:
+        fmt = 'xlsx' if output and output.endswith('.xlsx') else 'csv'
+    try:
+        chunks = export.export(kind, fmt, args, compress=bool(output and output.endswith('.gz')))
+    except ValueError as e:
+        raise click.UsageError(str(e))
+    stream = open(output, 'wb') if output else sys.stdout.buffer
+    try:
+        for chunk in chunks:
+            stream.write(chunk)
+    finally:
+        if output:
+            stream.close()
+    if output:
+        click.echo(f"Exported {kind} to {output}.", err=True)
+
+
+def register_commands(app):
+    """
+    Attaches the project's `flask <command>` CLI commands to the app.
+    """
+
+    @app.cli.command('import-users')
+    @click.argument('csv_file', type=click.File('r', encoding='utf-8-sig'))
+    @click.option('--role', type=click.Choice(sorted(IMPORTABLE_ROLES)), default='student', show_default=True)
+    @click.option('--dry-run', is_flag=True, help='Validate every row without writing anything.')
+    @click.option('--batch-size', default=DEFAULT_BATCH_SIZE, show_default=True)
+    def import_users_command(csv_file, role, dry_run, batch_size):
+        """Bulk-create accounts from a CSV (email,name,password,hostel,mentor,room_number)."""
+        def progress(processed, created):
+            click.echo(f"  ...{processed} rows read, {created} {'valid' if dry_run else 'created'}")
+
+        result = import_users(csv_file, role, dry_run=dry_run, batch_size=batch_size, progress=progress)
+
+        for line_no, email, message in result.errors:
+            click.echo(f"Line {line_no} ({email or '-'}): {message}", err=True)
+        verb = 'would be created' if dry_run else 'created'
+        click.echo(f"{result.created} of {result.total} {role}s {verb}, {len(result.errors)} errors.")
+
+    @app.cli.command('rebuild-occupancy')
+    def rebuild_occupancy_command():
+        """Re-link students to rooms by room number and recount room occupancy."""
+        rebuild_occupancy()
+        click.echo("Room occupancy rebuilt.")
+
+    @app.cli.command('rebuild-search-index')
+    def rebuild_search_index_command():
+        """Create the complaint search index if missing and refill it."""
+        install_search_index()
+        click.echo("Search index rebuilt.")
+
+    @app.cli.command('rebuild-analytics')
+    @click.option('--batch-size', default=5000, show_default=True)
+    def rebuild_analytics_command(batch_size):
+        """Recompute the daily complaint rollup from the complaints table."""
+        rows = analytics.rebuild(batch_size=batch_size)
+        click.echo(f"Analytics rebuilt: {rows} daily rows.")
+
+    @app.cli.command('archive-complaints')
+    @click.option('--older-than', type=int, default=None, help='Days since resolution. [default: ARCHIVE_AFTER_DAYS]')
+    @click.option('--batch-size', default=1000, show_default=True)
+    @click.option('--dry-run', is_flag=True, help='Only count what would be archived.')
+    def archive_complaints_command(older_than, batch_size, dry_run):
+        """Move old resolved/rejected complaints to the archive table."""
+        days = older_than if older_than is not None else app.config['ARCHIVE_AFTER_DAYS']
+        count = archive_complaints(days, batch_size=batch_size, dry_run=dry_run,
+                                   progress=lambda n: click.echo(f"  ...{n} archived"))
+        verb = 'would be archived' if dry_run else 'archived'
+        click.echo(f"{count} complaints closed more than {days} days ago {verb}.")
+
+    @app.cli.command('export-complaints')
+    @click.option('--hostel-id', type=int)
+    @click.option('--status', type=click.Choice([s.value for s in ComplaintStatus]))
+    @click.option('--category', type=click.Choice([c.value for c in Category]))
+    @click.option('--from', 'since', metavar='YYYY-MM-DD', help='Filed on or after this day.')
+    @click.option('--to', 'until', metavar='YYYY-MM-DD', help='Filed on or before this day.')
+    @click.option('--archived', is_flag=True, help='Include archived complaints.')
+    @click.option('--format', 'fmt', type=click.Choice(sorted(export.FORMATS)), help='[default: from --output, else csv]')
+    @click.option('--output', '-o', help='File to write (.csv.gz is gzipped). [default: stdout]')
+    def export_complaints_command(hostel_id, status, category, since, until, archived, fmt, output):
+        """Stream complaints as CSV or XLSX."""
+        args = {'hostel_id': hostel_id, 'status': status, 'category': category,
+                'from': since, 'to': until, 'archived': archived}
+        _write_export('complaints', fmt, args, output)
+
+    @app.cli.command('export-students')
+    @click.option('--hostel-id', type=int)
+    @click.option('--format', 'fmt', type=click.Choice(sorted(export.FORMATS)), help='[default: from --output, else csv]')
+    @click.option('--output', '-o', help='File to write (.csv.gz is gzipped). [default: stdout]')
+    def export_students_command(hostel_id, fmt, output):
+        """Stream the student roster as CSV or XLSX."""
+        _write_export('students', fmt, {'hostel_id': hostel_id}, output)
+
+    @app.cli.command('rebuild-duplicate-index')
+    def rebuild_duplicate_index_command():
+        """Re-index open complaints for near-duplicate detection."""
+        click.echo(f"Duplicate index rebuilt: {duplicates.rebuild_index()} open complaints.")
+
+    @app.cli.command('run-tasks')
+    @click.option('--workers', default=2, show_default=True)
+    @click.option('--drain', is_flag=True, help='Run the jobs that are due now, then exit.')
+    def run_tasks_command(workers, drain):
+        """Process queued background jobs (use with TASK_WORKERS=0 on the web servers)."""
+        if drain:
+            click.echo(f"{tasks.drain()} jobs run.")
+            return
+        tasks.start(workers)
+        click.echo(f"Running {workers} task workers, Ctrl+C to stop.")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            tasks.stop()
+
+    @app.cli.command('task-status')
+    def task_status_command():
+        """Show how many background jobs are pending, running or failed."""
+        counts = tasks.queue.counts()
+        for status in ('pending', 'running', 'failed'):
+            click.echo(f"{status}: {counts.get(status, 0)}")
\ No newline at end of file
@@ -0,0 +1,166 @@
+import time
+from contextlib import contextmanager
+from flask import current_app, g, request, session, has_request_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.sql.dml import UpdateBase
+
+# Engine tuning shared by every entry point.
+#
+# PostgreSQL: a bounded connection pool per worker process. Size it so that
+# DB_POOL_SIZE + DB_MAX_OVERFLOW covers the gunicorn threads of one worker,
+# and keep (workers x that) under the server's max_connections.
+# SQLite: WAL journal + synchronous=NORMAL, so dashboard reads do not block
+# behind a writer and commits skip one fsync; busy_timeout makes concurrent
+# writers wait for the lock instead of failing with "database is locked".
+#
+# Read replica (REPLICA_DATABASE_URL): GET requests read from the replica
+# bind, everything else -- POSTs, flushes, INSERT/UPDATE/DELETE, CLI and
+# background jobs -- uses the primary. After a user's own commit their
+# requests stay on the primary for REPLICA_STICKY_SECONDS, so the redirect
+# that follows a POST shows what they just wrote even if the replica lags.
+# Loaders that fill a shared cache run under primary_reads(), or a lagging
+# replica would be cached for everyone for the whole CACHE_TTL.
+
+REPLICA_BIND = 'replica'
+STICKY_KEY = '_primary_until'
+
+
+def engine_options(config, uri=None):
+    """
+    Engine options for `uri` (default: the primary database). Options already
+    set in SQLALCHEMY_ENGINE_OPTIONS win over the DB_POOL_* settings.
+    """
+    url = make_url(uri or config['SQLALCHEMY_DATABASE_URI'])
+    options = {'pool_pre_ping': config['DB_POOL_PRE_PING']}
+    if url.get_backend_name() == 'sqlite':
+        # Connections are local files: sizing and recycling the pool buys nothing
+        options['connect_args'] = {'timeout': config['SQLITE_BUSY_TIMEOUT'] / 1000}
+    else:
+        options.update(
+            pool_size=config['DB_POOL_SIZE'],
+            max_overflow=config['DB_MAX_OVERFLOW'],
+            pool_timeout=config['DB_POOL_TIMEOUT'],
+            pool_recycle=config['DB_POOL_RECYCLE'],
+        )
+    options.update(config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    return options
+
+
+def init_engine(app, db):
+    """
+    db.init_app() with the tuned engine options, plus SQLite pragmas
+    on every new connection.
+    """
+    replica_url = app.config['REPLICA_DATABASE_URL']
+    if replica_url:
+        binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+        binds[REPLICA_BIND] = dict(engine_options(app.config, replica_url), url=replica_url)
+        app.config['SQLALCHEMY_BINDS'] = binds
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config)
+    db.init_app(app)
+
+    with app.app_context():
+        engines = list(db.engines.values())
+    for engine in engines:
+        if engine.dialect.name == 'sqlite':
+            event.listen(engine, 'connect', _sqlite_pragmas(app.config))
+
+    if replica_url:
+        app.before_request(_route_request)
+        event.listen(db.session, 'after_flush', _mark_write)
+        event.listen(db.session, 'do_orm_execute', _mark_bulk_write)
+        event.listen(db.session, 'after_commit', _stick_to_primary)
+        event.listen(db.session, 'after_rollback', _forget_write)
+
+
+def _sqlite_pragmas(config):
+    wal = config['SQLITE_WAL']
+    busy_timeout = int(config['SQLITE_BUSY_TIMEOUT'])
+
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if wal:
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute(f'PRAGMA busy_timeout={busy_timeout}')
+        cursor.close()
+    return on_connect
+
+
+# --- READ REPLICA ---
+
+class RoutingSession(Session):
+    """
+    Session that reads from the replica bind while the current request is
+    routed there. Writes always go to the primary.
+    """
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and not isinstance(clause, UpdateBase) and _on_replica():
+            replica = self._db.engines.get(REPLICA_BIND)
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def use_primary(view):
+    """
+    Keeps a GET view on the primary, e.g. one that must see rows the same
+    user wrote in another tab before the replica catches up.
+    """
+    view.use_primary = True
+    return view
+
+
+@contextmanager
+def primary_reads():
+    """
+    Reads inside the block (or decorated function) go to the primary, even
+    in a GET request routed to the replica.
+    """
+    if not has_request_context():
+        yield
+        return
+    routed = g.get('db_replica', False)
+    g.db_replica = False
+    try:
+        yield
+    finally:
+        g.db_replica = routed
+
+
+def _on_replica():
+    return has_request_context() and g.get('db_replica', False)
+
+
+def _route_request():
+    if request.method not in ('GET', 'HEAD'):
+        return
+    view = current_app.view_functions.get(request.endpoint)
+    if view is None or getattr(view, 'use_primary', False):
+        return
+    if session.get(STICKY_KEY, 0) > time.time():
+        return
+    g.db_replica = True
+
+
+# Only transactions that changed something make the user sticky
+# (a login that just reads the users table does not)
+
+def _mark_write(db_session, flush_context):
+    db_session.info['wrote'] = True
+
+
+def _mark_bulk_write(state):
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info['wrote'] = True
+
+
+def _forget_write(db_session):
+    db_session.info.pop('wrote', None)
+
+
+def _stick_to_primary(db_session):
+    if db_session.info.pop('wrote', False) and has_request_context():
+        session[STICKY_KEY] = time.time() + current_app.config['REPLICA_STICKY_SECONDS']
\ No newline at end of file
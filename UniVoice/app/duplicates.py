@@ -0,0 +1,216 @@
+import hashlib
+import re
+import struct
+from datetime import datetime, timedelta
+from flask import current_app
+from app import db
+from app.models import Category, Complaint, ComplaintBucket, ComplaintStatus
+
+# Near-duplicate detection for new complaints.
+#
+# Each complaint is reduced to a set of normalised words (no stopwords, no
+# room numbers) and summarised by a MinHash signature of NUM_HASHES values.
+# The signature is cut into BANDS bands; each band hashes to one bucket,
+# stored in complaint_lsh_buckets for open parent complaints, scoped by
+# hostel and category. Two complaints with word-set Jaccard similarity s
+# share at least one bucket with probability 1 - (1 - s^ROWS)^BANDS
+# (~0.9 at s = 0.5), so a new complaint's candidates are one indexed lookup.
+# Candidates are then compared exactly and the best one over
+# DUPLICATE_THRESHOLD becomes the parent.
+#
+# Only shared facilities are clustered: two personal complaints with the
+# same wording are still two students' own problems.
+
+NUM_HASHES = 16
+BANDS = 8
+ROWS = NUM_HASHES // BANDS
+
+_MERSENNE = (1 << 61) - 1
+# Fixed coefficients so buckets stay comparable across processes and restarts
+_COEFFICIENTS = [
+    (int.from_bytes(hashlib.blake2b(f'a{i}'.encode(), digest_size=8).digest(), 'big') % _MERSENNE | 1,
+     int.from_bytes(hashlib.blake2b(f'b{i}'.encode(), digest_size=8).digest(), 'big') % _MERSENNE)
+    for i in range(NUM_HASHES)
+]
+
+OPEN_STATUSES = (ComplaintStatus.PENDING, ComplaintStatus.IN_PROGRESS)
+
+SHARED_CATEGORIES = (Category.ELECTRIC, Category.TOILET, Category.WIFI, Category.MESS)
+
+STOPWORDS = frozenset('''
+    a an and are as at be been but by for from has have i in is it its me my of on or our
+    please pls sir madam maam so that the this to too very was we were with kindly also
+'''.split())
+
+
+def words(complaint):
+    """
+    The normalised word set compared between complaints.
+    """
+    text = f'{complaint.heading or ""} {complaint.description or ""}'.lower()
+    result = set()
+    for word in re.findall(r'[^\W\d_]+', text):  # letters only: room numbers differ per reporter
+        if word in STOPWORDS or len(word) < 2:
+            continue
+        if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        result.add(word)
+    return result
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+def signature(word_set):
+    hashes = [int.from_bytes(hashlib.blake2b(w.encode(), digest_size=8).digest(), 'big') for w in word_set]
+    return [min((a * h + b) % _MERSENNE for h in hashes) for a, b in _COEFFICIENTS]
+
+
+def buckets(word_set):
+    """
+    One signed 64-bit bucket id per band (band number included in the hash).
+    """
+    if not word_set:
+        return []
+    sig = signature(word_set)
+    result = []
+    for band in range(BANDS):
+        packed = struct.pack(f'>B{ROWS}Q', band, *sig[band * ROWS:(band + 1) * ROWS])
+        result.append(int.from_bytes(hashlib.blake2b(packed, digest_size=8).digest(), 'big', signed=True))
+    return result
+
+
+# --- SUBMISSION ---
+
+def find_parent(complaint, word_set=None, keys=None):
+    """
+    The open complaint `complaint` most likely duplicates, or None.
+    Only first reports are candidates, so clusters never chain.
+    """
+    if complaint.category not in SHARED_CATEGORIES:
+        return None
+    config = current_app.config
+    word_set = word_set if word_set is not None else words(complaint)
+    keys = keys if keys is not None else buckets(word_set)
+    if not keys:
+        return None
+
+    since = datetime.utcnow() - timedelta(hours=config['DUPLICATE_WINDOW_HOURS'])
+    candidates = Complaint.query \
+        .join(ComplaintBucket, ComplaintBucket.complaint_id == Complaint.id) \
+        .filter(ComplaintBucket.hostel_id == complaint.hostel_id,
+                ComplaintBucket.category == complaint.category.value,
+                ComplaintBucket.bucket.in_(keys),
+                Complaint.parent_id.is_(None),
+                Complaint.status.in_(OPEN_STATUSES),
+                Complaint.created_at >= since,
+                Complaint.id != complaint.id) \
+        .distinct().all()
+
+    best, best_score = None, config['DUPLICATE_THRESHOLD']
+    for candidate in candidates:
+        score = jaccard(word_set, words(candidate))
+        if score >= best_score:
+            best, best_score = candidate, score
+    return best
+
+
+def register(complaint):
+    """
+    Links a just-flushed complaint to the issue it duplicates, or indexes it
+    as a new issue. Returns the parent, if any. Same transaction as the insert.
+    """
+    if complaint.category not in SHARED_CATEGORIES:
+        return None
+    word_set = words(complaint)
+    keys = buckets(word_set)
+    parent = find_parent(complaint, word_set, keys)
+    if parent is not None:
+        complaint.parent_id = parent.id
+        # Atomic counter; updated_at moves so cached dashboard rows refresh
+        db.session.execute(
+            db.update(Complaint).where(Complaint.id == parent.id)
+            .values(duplicate_count=Complaint.duplicate_count + 1, updated_at=datetime.utcnow())
+        )
+        return parent
+
+    for key in keys:
+        db.session.add(ComplaintBucket(complaint_id=complaint.id, hostel_id=complaint.hostel_id,
+                                       category=complaint.category.value, bucket=key))
+    return None
+
+
+# --- WARDEN UPDATES ---
+
+def follow_parent(parent, now):
+    """
+    Copies the warden's status and comment on `parent` to its open duplicates.
+    Returns [(duplicate, old_status)] for the ones that changed.
+    """
+    changed = []
+    if parent.category not in SHARED_CATEGORIES:
+        return changed
+    for child in Complaint.query.filter_by(parent_id=parent.id).all():
+        if child.status == parent.status and child.warden_comment == parent.warden_comment:
+            continue
+        changed.append((child, child.status))
+        child.status = parent.status
+        child.warden_comment = parent.warden_comment
+        if parent.status == ComplaintStatus.RESOLVED:
+            child.resolved_at = parent.resolved_at
+        child.updated_at = now
+    return changed
+
+
+def report_comments(parent_ids):
+    """
+    {parent id: [(report id, mentor comment)]} for reports under `parent_ids`
+    that a mentor has commented on, in one query. The warden only sees the
+    parent row, so these are shown on it.
+    """
+    comments = {}
+    if not parent_ids:
+        return comments
+    rows = db.session.query(Complaint.parent_id, Complaint.id, Complaint.mentor_comment) \
+        .filter(Complaint.parent_id.in_(parent_ids), Complaint.mentor_comment.isnot(None),
+                Complaint.mentor_comment != '') \
+        .order_by(Complaint.id)
+    for parent_id, complaint_id, comment in rows:
+        comments.setdefault(parent_id, []).append((complaint_id, comment))
+    return comments
+
+
+# --- MENTOR UPDATES ---
+
+def escalate_to_parent(complaint, now):
+    """
+    Carries a mentor's update on a report over to the parent the warden sees:
+    a report marked urgent makes the parent urgent, and the parent's
+    updated_at moves so its cached row picks up the report's comment.
+    Returns the parent id, or None if `complaint` is not a report.
+    """
+    if complaint.parent_id is None:
+        return None
+    values = {'updated_at': now}
+    if complaint.is_urgent:
+        values['is_urgent'] = True
+    db.session.execute(db.update(Complaint).where(Complaint.id == complaint.parent_id).values(**values))
+    return complaint.parent_id
+
+def rebuild_index():
+    """
+    Re-indexes every open first report, e.g. after changing BANDS or ROWS.
+    Existing parent links are kept. Returns how many complaints were indexed.
+    """
+    db.session.execute(db.delete(ComplaintBucket))
+    open_parents = Complaint.query.filter(Complaint.parent_id.is_(None), Complaint.status.in_(OPEN_STATUSES),
+                                         Complaint.category.in_(SHARED_CATEGORIES))
+    count = 0
+    for complaint in open_parents.yield_per(1000):
+        for key in buckets(words(complaint)):
+            db.session.add(ComplaintBucket(complaint_id=complaint.id, hostel_id=complaint.hostel_id,
+                                           category=complaint.category.value, bucket=key))
+        count += 1
+    db.session.commit()
+    return count
\ No newline at end of file
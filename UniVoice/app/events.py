@@ -0,0 +1,151 @@
+import json
+import queue
+import threading
+
+# In-process publish/subscribe used to push updates to open pages.
+# Each worker process keeps its own subscriber list (EventBus). A broker
+# decides how a published event reaches the buses: LocalBroker delivers
+# in-process only, RedisBroker fans out to every worker through Redis pub/sub.
+
+# Slow subscribers drop events instead of growing without bound
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class Subscription:
+    def __init__(self, bus, channels):
+        self.bus = bus
+        self.channels = channels
+        self.queue = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def get(self, timeout):
+        """
+        Next (channel, event) or None after `timeout` seconds.
+        """
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+
+class EventBus:
+    def __init__(self):
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, channels):
+        sub = Subscription(self, list(channels))
+        with self._lock:
+            for channel in sub.channels:
+                self._subscribers.setdefault(channel, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub):
+        with self._lock:
+            for channel in sub.channels:
+                subs = self._subscribers.get(channel)
+                if subs:
+                    subs.discard(sub)
+                    if not subs:
+                        del self._subscribers[channel]
+
+    def deliver(self, channel, event):
+        with self._lock:
+            subs = list(self._subscribers.get(channel, ()))
+        for sub in subs:
+            try:
+                sub.queue.put_nowait((channel, event))
+            except queue.Full:
+                pass
+
+    @property
+    def subscriber_count(self):
+        with self._lock:
+            return len({s for subs in self._subscribers.values() for s in subs})
+
+
+# --- BROKERS ---
+
+class LocalBroker:
+    """
+    In-process only: fine for a single worker or development.
+    """
+    def start(self, bus):
+        self.bus = bus
+
+    def publish(self, channel, event):
+        self.bus.deliver(channel, event)
+
+
+class RedisBroker:
+    """
+    Publishes through Redis so every worker's subscribers get the event.
+    `client` is a Redis-style client; one listener thread per process.
+    """
+    def __init__(self, client, prefix='univoice:events:'):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url, **kwargs):
+        import redis  # optional dependency, only needed for this broker
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def start(self, bus):
+        self.bus = bus
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        pubsub.psubscribe(self.prefix + '*')
+        threading.Thread(target=self._listen, args=(pubsub,), daemon=True, name='event-broker').start()
+
+    def _listen(self, pubsub):
+        for message in pubsub.listen():
+            channel = message['channel']
+            if isinstance(channel, bytes):
+                channel = channel.decode()
+            self.bus.deliver(channel[len(self.prefix):], json.loads(message['data']))
+
+    def publish(self, channel, event):
+        self.client.publish(self.prefix + channel, json.dumps(event))
+
+
+class Events:
+    """
+    Flask extension tying the bus to the configured broker.
+    """
+    def __init__(self, broker=None):
+        self.bus = EventBus()
+        self.broker = broker or LocalBroker()
+        self.broker.start(self.bus)
+        self.max_streams = 0
+        self.streams = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        if app.config['EVENTS_BROKER'] == 'redis':
+            self.broker = RedisBroker.from_url(app.config['EVENTS_REDIS_URL'])
+            self.broker.start(self.bus)
+        self.max_streams = app.config['EVENTS_MAX_STREAMS']
+        app.extensions['events'] = self
+
+    def open_stream(self):
+        """
+        Takes one of this process's EVENTS_MAX_STREAMS stream slots (0 = no
+        limit). False when they are all in use.
+        """
+        with self._lock:
+            if self.max_streams and self.streams >= self.max_streams:
+                return False
+            self.streams += 1
+            return True
+
+    def close_stream(self):
+        with self._lock:
+            self.streams -= 1
+
+    def subscribe(self, channels):
+        return self.bus.subscribe(channels)
+
+    def publish(self, channel, event):
+        self.broker.publish(channel, event)
\ No newline at end of file
@@ -0,0 +1,267 @@
+import csv
+import io
+import zipfile
+import zlib
+from datetime import datetime, date, timedelta
+from itertools import chain
+from xml.sax.saxutils import escape
+from app import db
+from app.models import Complaint, ArchivedComplaint, ComplaintStatus, Category, User, UserRole, Hostel
+
+# Streaming exports of complaints and student rosters (CSV or XLSX).
+#
+# Rows come from column-only queries read with yield_per, so at most
+# BATCH_SIZE rows are in memory at a time (PostgreSQL uses a server-side
+# cursor for this). Writers are generators of bytes: the route hands them
+# to a streaming Response and the CLI writes them to a file, so memory use
+# doesn't depend on the size of the export. CSV can be gzipped as it goes.
+# XLSX is a zip of XML parts. It is written with inline strings and no
+# styles, so each row is encoded once and never held in memory.
+
+BATCH_SIZE = 1000
+
+FORMATS = {
+    'csv': 'text/csv',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+
+# --- ROWS ---
+
+COMPLAINT_HEADER = ['id', 'created_at', 'hostel', 'student', 'email', 'room', 'category', 'status', 'urgent',
+                    'heading', 'description', 'mentor_comment', 'warden_comment', 'resolved_at', 'archived']
+
+
+def complaint_rows(hostel_id=None, status=None, category=None, since=None, until=None, include_archived=False):
+    """
+    Complaint rows in COMPLAINT_HEADER order, oldest first. `until` is inclusive.
+    """
+    def query(model):
+        q = db.session.query(
+            model.id, model.created_at, Hostel.name, User.name, User.email, User.room_number,
+            model.category, model.status, model.is_urgent, model.heading, model.description,
+            model.mentor_comment, model.warden_comment, model.resolved_at,
+        ).join(User, model.user_id == User.id).join(Hostel, model.hostel_id == Hostel.id)
+        if hostel_id:
+            q = q.filter(model.hostel_id == hostel_id)
+        if status:
+            q = q.filter(model.status == status)
+        if category:
+            q = q.filter(model.category == category)
+        if since:
+            q = q.filter(model.created_at >= since)
+        if until:
+            q = q.filter(model.created_at < until + timedelta(days=1))
+        archived = model is ArchivedComplaint
+        return ((*row, archived) for row in q.order_by(model.created_at, model.id).yield_per(BATCH_SIZE))
+
+    models = (Complaint, ArchivedComplaint) if include_archived else (Complaint,)
+    return chain.from_iterable(query(model) for model in models)
+
+
+def complaint_filters(args):
+    """
+    complaint_rows() keyword arguments from request args or CLI options:
+    hostel_id, status, category, from, to (YYYY-MM-DD) and archived.
+    Raises ValueError on a malformed value.
+    """
+    return {
+        'hostel_id': int(args['hostel_id']) if args.get('hostel_id') else None,
+        'status': ComplaintStatus(args['status']) if args.get('status') else None,
+        'category': Category(args['category']) if args.get('category') else None,
+        'since': date.fromisoformat(args['from']) if args.get('from') else None,
+        'until': date.fromisoformat(args['to']) if args.get('to') else None,
+        'include_archived': str(args.get('archived')).lower() in ('1', 'true'),
+    }
+
+
+STUDENT_HEADER = ['id', 'name', 'email', 'hostel', 'room', 'mentor', 'mentor_email']
+
+
+def student_rows(hostel_id=None):
+    """
+    Student roster rows in STUDENT_HEADER order, by hostel and room.
+    """
+    mentor = db.aliased(User)
+    q = db.session.query(User.id, User.name, User.email, Hostel.name, User.room_number, mentor.name, mentor.email) \
+        .outerjoin(Hostel, User.hostel_id == Hostel.id) \
+        .outerjoin(mentor, User.mentor_id == mentor.id) \
+        .filter(User.role == UserRole.STUDENT)
+    if hostel_id:
+        q = q.filter(User.hostel_id == hostel_id)
+    return q.order_by(Hostel.name, User.room_number, User.id).yield_per(BATCH_SIZE)
+
+
+def _cell(value):
+    if value is None:
+        return ''
+    if isinstance(value, (datetime, date)):
+        return value.isoformat(sep=' ', timespec='seconds') if isinstance(value, datetime) else value.isoformat()
+    if isinstance(value, bool):
+        return 'yes' if value else 'no'
+    return getattr(value, 'value', value)  # enums
+
+
+# --- WRITERS ---
+
+# Spreadsheets run text starting with these as a formula (CSV injection)
+_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _csv_cell(value):
+    value = _cell(value)
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def csv_chunks(header, rows, batch_rows=500):
+    """
+    CSV as UTF-8 byte chunks of about `batch_rows` rows, with a BOM so Excel
+    detects the encoding. Text that a spreadsheet would run as a formula
+    gets a leading ' (XLSX inline strings are always text).
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write('\ufeff')
+    writer.writerow(header)
+    for i, row in enumerate(rows, 1):
+        writer.writerow([_csv_cell(value) for value in row])
+        if i % batch_rows == 0:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode('utf-8')
+
+
+def gzip_chunks(chunks, level=6):
+    """
+    Gzip-compresses a stream of byte chunks as they are produced.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class _Pipe(io.RawIOBase):
+    """
+    Write-only, unseekable file whose contents are taken with drain().
+    zipfile writes to it; the generator hands the bytes on.
+    """
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+_XLSX_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'),
+}
+
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets></workbook>'
+)
+
+# Characters XML 1.0 does not allow, even escaped
+_XML_ILLEGAL = dict.fromkeys(c for c in range(32) if c not in (9, 10, 13))
+
+
+def _xlsx_row(values):
+    cells = []
+    for value in values:
+        value = _cell(value)
+        if isinstance(value, (int, float)):
+            cells.append(f'<c t="n"><v>{value}</v></c>')
+        elif value != '':
+            text = escape(str(value).translate(_XML_ILLEGAL))
+            cells.append(f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+        else:
+            cells.append('<c/>')
+    return '<row>' + ''.join(cells) + '</row>'
+
+
+def xlsx_chunks(header, rows, sheet_name='Export', batch_rows=500):
+    """
+    A single-sheet XLSX workbook as byte chunks.
+    """
+    pipe = _Pipe()
+    with zipfile.ZipFile(pipe, 'w', compression=zipfile.ZIP_DEFLATED) as workbook:
+        for name, content in _XLSX_PARTS.items():
+            workbook.writestr(name, content)
+        workbook.writestr('xl/workbook.xml', _XLSX_WORKBOOK.format(name=escape(sheet_name[:31])))
+        yield pipe.drain()
+
+        with workbook.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+            sheet.write(b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                        b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>')
+            sheet.write(_xlsx_row(header).encode('utf-8'))
+            for i, row in enumerate(rows, 1):
+                sheet.write(_xlsx_row(row).encode('utf-8'))
+                if i % batch_rows == 0:
+                    yield pipe.drain()
+            sheet.write(b'</sheetData></worksheet>')
+    yield pipe.drain()
+
+
+WRITERS = {'csv': csv_chunks, 'xlsx': xlsx_chunks}
+
+
+def export_chunks(fmt, header, rows, compress=False):
+    """
+    The export as byte chunks in `fmt` ('csv' or 'xlsx'). `compress` gzips
+    CSV; XLSX is already a zip, so it is left as is.
+    """
+    chunks = WRITERS[fmt](header, rows)
+    return gzip_chunks(chunks) if compress and fmt == 'csv' else chunks
+
+
+EXPORTS = {
+    'complaints': (COMPLAINT_HEADER, lambda args: complaint_rows(**complaint_filters(args))),
+    'students': (STUDENT_HEADER, lambda args: student_rows(int(args['hostel_id']) if args.get('hostel_id') else None)),
+}
+
+
+def export(kind, fmt, args, compress=False):
+    """
+    Byte chunks of export `kind` ('complaints' or 'students') filtered by
+    `args`. Filters are parsed here, so a ValueError comes before any output.
+    """
+    header, rows = EXPORTS[kind]
+    return export_chunks(fmt, header, rows(args), compress)
\ No newline at end of file
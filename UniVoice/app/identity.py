@@ -0,0 +1,90 @@
+from collections import namedtuple
+from flask import current_app
+from flask_login import UserMixin
+from app import db, reference_cache as cache
+from app.database import primary_reads
+from app.models import User, Hostel, UserRole
+
+# What current_user needs on almost every request, kept out of the database.
+# Anything else (email, mentees, ...) falls back to the real User row.
+# Snapshots are cached only for IDENTITY_CACHE_TTL, which is 0 unless the
+# cache is shared: invalidate_identity() can't reach other workers' memory,
+# and they would go on authorizing an old role or hostel.
+HostelInfo = namedtuple('HostelInfo', ['id', 'name'])
+
+IDENTITY_FIELDS = ('id', 'name', 'role', 'hostel_id', 'mentor_id', 'room_number', 'hostel_name')
+
+
+def _identity_key(user_id):
+    return f'identity:{user_id}'
+
+
+class SessionUser(UserMixin):
+    """
+    Lightweight stand-in for User used as current_user.
+    """
+    def __init__(self, snapshot):
+        self.id = snapshot['id']
+        self.name = snapshot['name']
+        self.role = UserRole(snapshot['role'])
+        self.hostel_id = snapshot['hostel_id']
+        self.mentor_id = snapshot['mentor_id']
+        self.room_number = snapshot['room_number']
+        self.hostel_name = snapshot['hostel_name']
+        self._user = None
+
+    @property
+    def hostel(self):
+        if self.hostel_id is None:
+            return None
+        return HostelInfo(self.hostel_id, self.hostel_name)
+
+    @property
+    def user(self):
+        """
+        The full User row, loaded on first use.
+        """
+        if self._user is None:
+            self._user = db.session.get(User, self.id)
+        return self._user
+
+    def __getattr__(self, name):
+        # Only called for attributes not in the snapshot
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.user, name)
+
+
+@primary_reads()  # cached for every session, so never from a lagging replica
+def _load_snapshot(user_id):
+    row = db.session.query(
+        User.id, User.name, User.role, User.hostel_id, User.mentor_id, User.room_number, Hostel.name
+    ).outerjoin(Hostel, User.hostel_id == Hostel.id).filter(User.id == user_id).first()
+    if row is None:
+        return None
+    snapshot = dict(zip(IDENTITY_FIELDS, row))
+    snapshot['role'] = snapshot['role'].value
+    return snapshot
+
+
+def load_identity(user_id):
+    """
+    Returns a SessionUser for `user_id`, or None if the user no longer exists.
+    """
+    try:
+        user_id = int(user_id)
+    except (TypeError, ValueError):
+        return None
+    ttl = current_app.config['IDENTITY_CACHE_TTL']
+    if ttl:
+        snapshot = cache.get_or_set(_identity_key(user_id), lambda: _load_snapshot(user_id), ttl)
+    else:
+        snapshot = _load_snapshot(user_id)  # once per request; flask-login keeps current_user on g
+    return SessionUser(snapshot) if snapshot else None
+
+
+def invalidate_identity(user_id):
+    """
+    Call after committing any change to a user's identity fields.
+    """
+    cache.invalidate(_identity_key(user_id))
@@ -0,0 +1,224 @@
+import csv
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.models import User, Hostel, UserRole
+from app import reference
+from app.passwords import HashingPool
+from app.rooms import room_lookup, refresh_occupancy
+
+# CSV layout (header row required, extra columns are ignored):
+#   email,name,password,hostel,mentor,room_number
+# hostel is the hostel name, mentor is the mentor's email (or unique name).
+IMPORTABLE_ROLES = {
+    'student': UserRole.STUDENT,
+    'warden': UserRole.WARDEN,
+    'mentor': UserRole.MENTOR,
+}
+DEFAULT_BATCH_SIZE = 500
+
+
+class ImportResult:
+    def __init__(self, dry_run=False):
+        self.dry_run = dry_run
+        self.total = 0
+        self.created = 0
+        self.errors = []  # (line number, email, message)
+
+    def add_error(self, line_no, email, message):
+        self.errors.append((line_no, email, message))
+
+    @property
+    def ok(self):
+        return not self.errors
+
+
+def _hostel_lookup():
+    return {h.name.strip().lower(): h.id for h in Hostel.query.with_entities(Hostel.id, Hostel.name)}
+
+
+def _mentor_lookup():
+    """
+    Mentors can be referenced by email or by name; names that are shared
+    by several mentors map to None so they are reported as ambiguous.
+    """
+    by_key = {}
+    for m in User.query.with_entities(User.id, User.email, User.name).filter_by(role=UserRole.MENTOR):
+        by_key[m.email.strip().lower()] = m.id
+        if m.name:
+            name = m.name.strip().lower()
+            by_key[name] = None if name in by_key else m.id
+    return by_key
+
+
+class UserImporter:
+    """
+    Streams a CSV of accounts into the users table.
+    Rows are validated one by one but written in batches: one duplicate-email
+    query and one bulk INSERT per batch. Passwords are hashed on one process
+    pool for the whole import.
+    """
+    def __init__(self, role, dry_run=False, batch_size=DEFAULT_BATCH_SIZE, progress=None):
+        self.role = IMPORTABLE_ROLES[role] if isinstance(role, str) else role
+        self.dry_run = dry_run
+        self.batch_size = batch_size
+        self.progress = progress  # called with (rows processed, rows created)
+        self.hostels = _hostel_lookup()
+        self.mentors = _mentor_lookup()
+        self.seen_emails = set()
+        self.rooms = {}  # hostel_id -> {room_number: room_id}, loaded on first use
+        self.result = ImportResult(dry_run)
+        self.hashing = None
+
+    def _parse_row(self, line_no, row):
+        """
+        Returns (email, mapping, password) or records an error and returns None.
+        """
+        email = (row.get('email') or '').strip()
+        if not email or '@' not in email:
+            self.result.add_error(line_no, email, 'Missing or invalid email')
+            return None
+        if email.lower() in self.seen_emails:
+            self.result.add_error(line_no, email, 'Email appears more than once in the file')
+            return None
+        self.seen_emails.add(email.lower())
+
+        mapping = {
+            'email': email,
+            'name': (row.get('name') or '').strip() or None,
+            'role': self.role,
+            'password_hash': None,
+            'hostel_id': None,
+            'mentor_id': None,
+            'room_number': None,
+            'room_id': None,
+        }
+
+        if self.role in (UserRole.STUDENT, UserRole.WARDEN):
+            hostel = (row.get('hostel') or '').strip()
+            if hostel:
+                mapping['hostel_id'] = self.hostels.get(hostel.lower())
+                if mapping['hostel_id'] is None:
+                    self.result.add_error(line_no, email, f'Unknown hostel "{hostel}"')
+                    return None
+            elif self.role == UserRole.STUDENT:
+                self.result.add_error(line_no, email, 'Students need a hostel')
+                return None
+
+        if self.role == UserRole.STUDENT:
+            mentor = (row.get('mentor') or '').strip()
+            if mentor:
+                mapping['mentor_id'] = self.mentors.get(mentor.lower())
+                if mapping['mentor_id'] is None:
+                    reason = 'Ambiguous' if mentor.lower() in self.mentors else 'Unknown'
+                    self.result.add_error(line_no, email, f'{reason} mentor "{mentor}"')
+                    return None
+            mapping['room_number'] = (row.get('room_number') or '').strip() or None
+            if mapping['room_number']:
+                if mapping['hostel_id'] not in self.rooms:
+                    self.rooms[mapping['hostel_id']] = room_lookup(mapping['hostel_id'])
+                mapping['room_id'] = self.rooms[mapping['hostel_id']].get(mapping['room_number'])
+
+        password = row.get('password') or ''
+        return email, mapping, password
+
+    def _taken(self, emails):
+        """
+        Lowercased emails of `emails` that already have an account, ignoring case.
+        """
+        lowered = [email.lower() for email in emails]
+        return {e.lower() for (e,) in db.session.query(User.email).filter(db.func.lower(User.email).in_(lowered))}
+
+    def _flush(self, batch):
+        if not batch:
+            return
+        taken = self._taken(email for _, email, _, _ in batch)
+
+        rows = []
+        to_hash = []
+        for line_no, email, mapping, password in batch:
+            if email.lower() in taken:
+                self.result.add_error(line_no, email, 'Email already registered')
+                continue
+            if password and not self.dry_run:
+                to_hash.append((mapping, password))
+            rows.append((line_no, email, mapping))
+
+        # Hashing is the slow part of an import, so the whole batch goes through the pool
+        hashes = self.hashing.hash(password for _, password in to_hash)
+        for (mapping, _), password_hash in zip(to_hash, hashes):
+            mapping['password_hash'] = password_hash
+
+        if rows and not self.dry_run:
+            rows = self._insert(rows)
+        self.result.created += len(rows)
+
+    def _insert(self, rows):
+        """
+        Writes (line_no, email, mapping) rows and returns the ones saved.
+        An account created since the check (another import, a sign-up) fails
+        the whole INSERT; those rows are reported as duplicates and the rest
+        written again.
+        """
+        try:
+            db.session.bulk_insert_mappings(User, [mapping for _, _, mapping in rows])
+            # bulk inserts skip assign_room, so recount the rooms this batch touched
+            refresh_occupancy({mapping['room_id'] for _, _, mapping in rows if mapping['room_id']})
+            db.session.commit()
+            return rows
+        except IntegrityError:
+            db.session.rollback()
+
+        taken = self._taken(email for _, email, _ in rows)
+        remaining = []
+        for line_no, email, mapping in rows:
+            if email.lower() in taken:
+                self.result.add_error(line_no, email, 'Email already registered')
+            else:
+                remaining.append((line_no, email, mapping))
+        if remaining and len(remaining) < len(rows):
+            return self._insert(remaining)
+        for line_no, email, _ in remaining:
+            self.result.add_error(line_no, email, 'Could not be saved (conflicting change), try again')
+        return []
+
+    def run(self, stream):
+        """
+        `stream` is a text file object (or any iterable of CSV lines).
+        """
+        reader = csv.DictReader(stream)
+        missing = {'email'} - {f.strip().lower() for f in reader.fieldnames or []}
+        if missing:
+            self.result.add_error(1, '', 'CSV header must include an "email" column')
+            return self.result
+
+        with HashingPool() as self.hashing:
+            self._read(reader)
+
+        if self.role == UserRole.MENTOR and self.result.created and not self.dry_run:
+            reference.invalidate_mentors()
+        self.result.errors.sort()
+        return self.result
+
+    def _read(self, reader):
+        batch = []
+        for row in reader:
+            row = {(k or '').strip().lower(): v for k, v in row.items()}
+            self.result.total += 1
+            parsed = self._parse_row(reader.line_num, row)
+            if parsed:
+                email, mapping, password = parsed
+                batch.append((reader.line_num, email, mapping, password))
+
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = []
+                if self.progress:
+                    self.progress(self.result.total, self.result.created)
+
+        self._flush(batch)
+        if self.progress:
+            self.progress(self.result.total, self.result.created)
+
+
+def import_users(stream, role, dry_run=False, batch_size=DEFAULT_BATCH_SIZE, progress=None):
+    return UserImporter(role, dry_run, batch_size, progress).run(stream)
@@ -0,0 +1,58 @@
+import json
+from app import db, tasks
+from app.models import User, Complaint, AuditLog
+from app.notifications import notify
+
+# Side effects of complaint changes, run by the task workers after the
+# request has committed (see app/tasks.py). Each job commits on success
+# and is retried as a whole on failure.
+
+
+def _complaint_and_mentor(complaint_id):
+    """
+    (complaint, mentor_id) or (None, None) if the complaint is gone.
+    """
+    row = db.session.query(Complaint, User.mentor_id) \
+        .join(User, Complaint.user_id == User.id) \
+        .filter(Complaint.id == complaint_id).first()
+    return row if row else (None, None)
+
+
+@tasks.task('audit')
+def audit(action, complaint_id=None, actor_id=None, detail=None):
+    db.session.add(AuditLog(
+        action=action,
+        complaint_id=complaint_id,
+        actor_id=actor_id,
+        detail=json.dumps(detail) if detail is not None else None,
+    ))
+
+
+@tasks.task('complaint-flagged')
+def complaint_flagged(complaint_id, terms):
+    """
+    Moderation follow-up: record which terms matched and tell the mentor.
+    """
+    audit('complaint.flagged', complaint_id=complaint_id, detail={'terms': terms})
+    complaint, mentor_id = _complaint_and_mentor(complaint_id)
+    if complaint:
+        notify([mentor_id], f'A complaint by {complaint.author.name or "a mentee"} was flagged for review: "{complaint.heading}"', complaint_id)
+
+
+@tasks.task('notify-status-change')
+def notify_status_change(complaint_id, status):
+    complaint, mentor_id = _complaint_and_mentor(complaint_id)
+    if complaint:
+        label = status.replace('_', ' ')
+        notify([complaint.user_id, mentor_id], f'"{complaint.heading}" is now {label}', complaint_id)
+
+
+@tasks.task('notify-comment')
+def notify_comment(complaint_id, by):
+    """
+    `by` is 'warden' or 'mentor'. Mentors are only told about warden comments.
+    """
+    complaint, mentor_id = _complaint_and_mentor(complaint_id)
+    if complaint:
+        recipients = [complaint.user_id] + ([mentor_id] if by == 'warden' else [])
+        notify(recipients, f'The {by} commented on "{complaint.heading}"', complaint_id)
\ No newline at end of file
@@ -0,0 +1,96 @@
+import base64
+from datetime import datetime
+from flask import current_app
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import selectinload
+from app.models import Complaint
+
+DEFAULT_PER_PAGE = 50
+
+
+class ComplaintPage:
+    """
+    One page of a complaint listing.
+    `next_cursor` is None when there are no older complaints left.
+    """
+    def __init__(self, items, next_cursor=None):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def has_more(self):
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __bool__(self):
+        return bool(self.items)
+
+
+# --- CURSOR HELPERS ---
+# A cursor is the (created_at, id) of the last row on the previous page,
+# packed into a URL-safe token so it can travel as a query parameter.
+
+def encode_cursor(complaint):
+    raw = f"{complaint.created_at.isoformat()}|{complaint.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """
+    Returns (created_at, id) or None if the token is missing or malformed.
+    A bad cursor simply falls back to the first page.
+    """
+    if not token:
+        return None
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        created_at, complaint_id = base64.urlsafe_b64decode(padded).decode().split('|')
+        return datetime.fromisoformat(created_at), int(complaint_id)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def get_per_page():
+    return current_app.config.get('COMPLAINTS_PER_PAGE', DEFAULT_PER_PAGE)
+
+
+# --- MAIN ENTRY POINT ---
+
+def apply_keyset(query, cursor, per_page):
+    """
+    Adds the cursor filter, (created_at DESC, id DESC) ordering and a LIMIT
+    of per_page + 1 (the extra row tells whether another page exists).
+    Works for full Complaint queries and column-only ones alike.
+    """
+    position = decode_cursor(cursor)
+    if position:
+        created_at, complaint_id = position
+        query = query.filter(or_(
+            Complaint.created_at < created_at,
+            and_(Complaint.created_at == created_at, Complaint.id < complaint_id)
+        ))
+    return query.order_by(Complaint.created_at.desc(), Complaint.id.desc()).limit(per_page + 1)
+
+
+def paginate_complaints(query, cursor=None, per_page=None, with_authors=True):
+    """
+    Keyset pagination over (created_at DESC, id DESC).
+    Authors are loaded in one batched SELECT so templates can touch
+    c.author.name / c.author.room_number without a query per row.
+    """
+    per_page = per_page or get_per_page()
+    if with_authors:
+        query = query.options(selectinload(Complaint.author))
+    rows = apply_keyset(query, cursor, per_page).all()
+
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        next_cursor = encode_cursor(rows[-1])
+
+    return ComplaintPage(rows, next_cursor)
@@ -0,0 +1,128 @@
+import json
+import logging
+import time
+from flask import Response, current_app
+from werkzeug.exceptions import ServiceUnavailable
+from app import db, events
+from app.models import User, UserRole
+
+# Complaint deltas pushed to open dashboards over Server-Sent Events.
+#
+# Channels:
+#   hostel:<id>   everything in a hostel (wardens, admins)
+#   mentor:<id>   complaints filed by a mentor's mentees
+#   user:<id>     a student's own complaints
+
+COMPLAINT_CREATED = 'complaint-created'
+STATUS_CHANGED = 'status-changed'
+COMMENT_UPDATED = 'comment-updated'
+COMPLAINT_DELETED = 'complaint-deleted'
+
+_LOOKUP = object()
+
+logger = logging.getLogger(__name__)
+
+
+def complaint_delta(complaint):
+    """
+    The small payload sent to dashboards; enough to update a row or a counter.
+    """
+    return {
+        'id': str(complaint.id),
+        'heading': complaint.heading,
+        'category': complaint.category.value,
+        'status': complaint.status.value if complaint.status else None,
+        'isUrgent': bool(complaint.is_urgent),
+        'mentorComment': complaint.mentor_comment,
+        'wardenComment': complaint.warden_comment,
+        'userId': str(complaint.user_id),
+        'hostelId': str(complaint.hostel_id),
+        'updatedAt': complaint.updated_at.isoformat() if complaint.updated_at else None,
+    }
+
+
+def complaint_channels(complaint, mentor_id=_LOOKUP):
+    if mentor_id is _LOOKUP:
+        mentor_id = db.session.query(User.mentor_id).filter(User.id == complaint.user_id).scalar()
+    channels = [f'hostel:{complaint.hostel_id}', f'user:{complaint.user_id}']
+    if mentor_id:
+        channels.append(f'mentor:{mentor_id}')
+    return channels
+
+
+def complaint_event(kind, complaint, mentor_id=_LOOKUP):
+    """
+    (channels, event) for a change to `complaint`. Build it before a delete,
+    while the row is still loaded.
+    """
+    return complaint_channels(complaint, mentor_id), {'type': kind, 'complaint': complaint_delta(complaint)}
+
+
+def publish(channels, event):
+    for channel in channels:
+        events.publish(channel, event)
+
+
+def publish_complaint(kind, complaint, mentor_id=_LOOKUP):
+    """
+    Call after the change is committed, so listeners never see rolled-back data.
+    Pass mentor_id when the caller already knows it to skip the lookup.
+    """
+    publish(*complaint_event(kind, complaint, mentor_id))
+
+
+# --- STREAMS ---
+
+def channels_for(user):
+    """
+    What a user may listen to by default.
+    """
+    if user.role == UserRole.WARDEN and user.hostel_id:
+        return [f'hostel:{user.hostel_id}']
+    if user.role == UserRole.MENTOR:
+        return [f'mentor:{user.id}']
+    if user.role == UserRole.STUDENT:
+        return [f'user:{user.id}']
+    return []
+
+
+def format_sse(event):
+    return f"event: {event['type']}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
+
+
+def event_stream(channels):
+    """
+    text/event-stream response for `channels`.
+    The generator runs outside the request context and holds no database
+    connection; it sends a comment line as heartbeat and closes after
+    EVENTS_MAX_STREAM seconds so sync workers are released (browsers reconnect).
+    Each open stream holds a worker thread, so past EVENTS_MAX_STREAMS per
+    process the request gets 503 and the page simply goes without live updates.
+    """
+    heartbeat = current_app.config['EVENTS_HEARTBEAT']
+    max_stream = current_app.config['EVENTS_MAX_STREAM']
+    if not events.open_stream():
+        logger.warning('Event stream refused: %d streams open in this process', events.streams)
+        raise ServiceUnavailable('Too many live update streams.', retry_after=max_stream)
+
+    def generate():
+        # Subscribe on first iteration so an unsent response leaves nothing behind
+        subscription = events.subscribe(channels)
+        try:
+            yield 'retry: 3000\n\n'
+            deadline = time.monotonic() + max_stream
+            while time.monotonic() < deadline:
+                item = subscription.get(timeout=min(heartbeat, max(deadline - time.monotonic(), 0.1)))
+                if item is None:
+                    yield ': keep-alive\n\n'
+                else:
+                    yield format_sse(item[1])
+        finally:
+            subscription.close()
+
+    response = Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
+    response.call_on_close(events.close_stream)
+    return response
\ No newline at end of file
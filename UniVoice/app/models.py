@@ -1,7 +1,7 @@
 from datetime import datetime
-from app import db, login_manager
+from app import db
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
+from app.passwords import hash_password, verify_password, needs_rehash
 from datetime import datetime
 import enum
 
@@ -28,6 +28,9 @@ class Category(enum.Enum):
     PERSONAL = 'personal'
     OTHERS = 'others'
 
+# Beds per room when a hostel's rooms are generated
+DEFAULT_ROOM_CAPACITY = 2
+
 # --- MODELS ---
 
 class Hostel(db.Model):
@@ -42,32 +45,44 @@ class Hostel(db.Model):
     rooms = db.relationship('Room', backref='hostel', lazy=True, cascade="all, delete-orphan")
     students = db.relationship('User', backref='hostel', lazy=True)
 
-    def generate_rooms(self):
+    def generate_rooms(self, capacity=DEFAULT_ROOM_CAPACITY):
         """
-        Auto-fills rooms based on total_rooms.
+        Auto-fills rooms based on total_rooms, in one bulk INSERT.
         Example: If total_rooms=50, creates '101' to '150'.
         """
-        existing_rooms = Room.query.filter_by(hostel_id=self.id).count()
-        if existing_rooms == 0:
-            for i in range(1, self.total_rooms + 1):
-                # Simple logic: Room 101, 102, etc.
-                room_num = str(100 + i) 
-                new_room = Room(room_number=room_num, hostel=self)
-                db.session.add(new_room)
+        has_rooms = db.session.query(Room.query.filter_by(hostel_id=self.id).exists()).scalar()
+        if not has_rooms:
+            # Simple logic: Room 101, 102, etc.
+            db.session.execute(db.insert(Room), [
+                {'room_number': str(100 + i), 'hostel_id': self.id, 'capacity': capacity}
+                for i in range(1, self.total_rooms + 1)
+            ])
             db.session.commit()
 
 class Room(db.Model):
     __tablename__ = 'rooms'
+    __table_args__ = (
+        # (hostel, room_number) -> room lookups and per-hostel vacancy queries
+        db.Index('ix_rooms_hostel_number', 'hostel_id', 'room_number'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     room_number = db.Column(db.String(10), nullable=False)
     hostel_id = db.Column(db.Integer, db.ForeignKey('hostels.id'), nullable=False)
+
+    # Occupancy (kept in sync by app/rooms.py)
+    capacity = db.Column(db.Integer, nullable=False, default=DEFAULT_ROOM_CAPACITY, server_default=str(DEFAULT_ROOM_CAPACITY))
+    occupants = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     
     # Relationships
     students = db.relationship('User', backref='room', lazy=True)
 
 class User(UserMixin, db.Model):
     __tablename__ = 'users'
+    __table_args__ = (
+        # Admin student list: filter by role + hostel, sorted by room
+        db.Index('ix_users_role_hostel_room', 'role', 'hostel_id', 'room_number'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(120), unique=True, nullable=False)
@@ -82,9 +97,9 @@ class User(UserMixin, db.Model):
 
     # --- Foreign Keys ---
     # Nullable because Admin/Gatekeeper might not need a Room or Mentor
-    hostel_id = db.Column(db.Integer, db.ForeignKey('hostels.id'), nullable=True)
-    room_id = db.Column(db.Integer, db.ForeignKey('rooms.id'), nullable=True)
-    mentor_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
+    hostel_id = db.Column(db.Integer, db.ForeignKey('hostels.id'), nullable=True, index=True)
+    room_id = db.Column(db.Integer, db.ForeignKey('rooms.id'), nullable=True, index=True)
+    mentor_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True, index=True)
 
     room_number = db.Column(db.String(20), nullable=True)
 
@@ -95,13 +110,27 @@ class User(UserMixin, db.Model):
     complaints = db.relationship('Complaint', backref='author', lazy=True)
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = hash_password(password)
 
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        """
+        Verifies the password and, if the stored hash uses outdated
+        parameters, upgrades it in place (the caller commits).
+        """
+        if not verify_password(self.password_hash, password):
+            return False
+        if needs_rehash(self.password_hash):
+            self.password_hash = hash_password(password)
+        return True
 
 class Complaint(db.Model):
     __tablename__ = 'complaints'
+    __table_args__ = (
+        # Warden/admin listings and status counts for one hostel
+        db.Index('ix_complaints_hostel_status_created', 'hostel_id', 'status', 'created_at'),
+        # Student history and mentor views (complaints of given users)
+        db.Index('ix_complaints_user_created', 'user_id', 'created_at'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     heading = db.Column(db.String(100), nullable=False)
@@ -111,6 +140,8 @@ class Complaint(db.Model):
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     resolved_at = db.Column(db.DateTime, nullable=True)
+    # Bumped on every ORM update; set-based UPDATEs must set it explicitly
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Status
     status = db.Column(db.Enum(ComplaintStatus), default=ComplaintStatus.PENDING)
@@ -127,7 +158,116 @@ class Complaint(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     hostel_id = db.Column(db.Integer, db.ForeignKey('hostels.id'), nullable=False)
 
-# --- FLASK LOGIN LOADER ---
-@login_manager.user_loader
-def load_user(id):
-    return User.query.get(int(id))
\ No newline at end of file
+    # Near-duplicates (app/duplicates.py): a duplicate points at the first
+    # report of the issue, which counts them and carries the warden's updates
+    parent_id = db.Column(db.Integer, db.ForeignKey('complaints.id'), nullable=True, index=True)
+    duplicate_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+    duplicates = db.relationship('Complaint', backref=db.backref('parent', remote_side=[id]), lazy=True)
+    lsh_buckets = db.relationship('ComplaintBucket', cascade='all, delete-orphan', lazy=True)
+
+    is_archived = False
+
+class ArchivedComplaint(db.Model):
+    """
+    Cold storage for old resolved/rejected complaints, moved here by
+    app/archive.py so dashboards only scan the active set. Same columns and
+    ids as Complaint; rows are read-only once archived.
+    """
+    __tablename__ = 'archived_complaints'
+    __table_args__ = (
+        # Student history (admin student profile)
+        db.Index('ix_archived_complaints_user_created', 'user_id', 'created_at'),
+        db.Index('ix_archived_complaints_hostel_created', 'hostel_id', 'created_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)  # the original Complaint.id
+    heading = db.Column(db.String(100), nullable=False)
+    description = db.Column(db.Text, nullable=False)
+    category = db.Column(db.Enum(Category), nullable=False)
+
+    created_at = db.Column(db.DateTime)
+    resolved_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    status = db.Column(db.Enum(ComplaintStatus))
+    is_urgent = db.Column(db.Boolean, default=False)
+    is_abusive = db.Column(db.Boolean, default=False)
+    mentor_comment = db.Column(db.Text, nullable=True)
+    warden_comment = db.Column(db.Text, nullable=True)
+
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    hostel_id = db.Column(db.Integer, db.ForeignKey('hostels.id'), nullable=False)
+    parent_id = db.Column(db.Integer, nullable=True)
+    duplicate_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+    author = db.relationship('User')
+
+    is_archived = True
+
+class ComplaintBucket(db.Model):
+    """
+    MinHash LSH buckets of an open complaint (see app/duplicates.py).
+    A new complaint sharing any bucket with one of these, in the same hostel
+    and category, is a duplicate candidate.
+    """
+    __tablename__ = 'complaint_lsh_buckets'
+    __table_args__ = (
+        db.Index('ix_complaint_lsh_buckets_lookup', 'hostel_id', 'category', 'bucket'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    complaint_id = db.Column(db.Integer, db.ForeignKey('complaints.id', ondelete='CASCADE'), nullable=False, index=True)
+    hostel_id = db.Column(db.Integer, nullable=False)
+    category = db.Column(db.String(20), nullable=False)  # Category value
+    bucket = db.Column(db.BigInteger, nullable=False)
+
+class ComplaintDailyStat(db.Model):
+    """
+    Rollup maintained by app/analytics.py: what happened to complaints of one
+    (hostel, category) on one day, split by the status they were created in
+    or moved to. Analytics read this instead of the complaints table.
+    """
+    __tablename__ = 'complaint_daily_stats'
+    __table_args__ = (
+        # Upsert key; also serves per-hostel/category date-range queries
+        db.UniqueConstraint('hostel_id', 'category', 'status', 'day', name='uq_complaint_daily_stats_key'),
+        # Date-range queries across all hostels
+        db.Index('ix_complaint_daily_stats_day', 'day'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    hostel_id = db.Column(db.Integer, db.ForeignKey('hostels.id'), nullable=False)
+    category = db.Column(db.String(20), nullable=False)  # Category value
+    status = db.Column(db.String(20), nullable=False)  # ComplaintStatus value
+    day = db.Column(db.Date, nullable=False)
+
+    created_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # filed in this status
+    transition_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # moved into this status
+    age_seconds = db.Column(db.BigInteger, nullable=False, default=0, server_default='0')  # summed complaint age at the move
+
+class Notification(db.Model):
+    __tablename__ = 'notifications'
+    __table_args__ = (
+        # Unread notifications for one user, newest first
+        db.Index('ix_notifications_user_read_created', 'user_id', 'read_at', 'created_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    complaint_id = db.Column(db.Integer, db.ForeignKey('complaints.id', ondelete='SET NULL'), nullable=True)
+    message = db.Column(db.String(255), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    read_at = db.Column(db.DateTime, nullable=True)
+
+class AuditLog(db.Model):
+    __tablename__ = 'audit_log'
+
+    id = db.Column(db.Integer, primary_key=True)
+    # No foreign keys: entries outlive deleted users and complaints
+    actor_id = db.Column(db.Integer, nullable=True)
+    action = db.Column(db.String(50), nullable=False)
+    complaint_id = db.Column(db.Integer, nullable=True, index=True)
+    detail = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
\ No newline at end of file
@@ -0,0 +1,170 @@
+import os
+import re
+import threading
+import time
+import unicodedata
+
+# --- NORMALISATION ---
+# Complaint text and listed terms go through the same steps, so "Ṣtüpid",
+# "STUPID" and "stup1d" all compare equal to "stupid". Text is matched both
+# before and after the leet step, since that step also turns punctuation and
+# numbers next to a word into letters ("!stupid", "idiot1").
+
+LEET_DIGITS = str.maketrans({
+    '0': 'o', '1': 'i', '3': 'e', '4': 'a', '5': 's', '7': 't', '8': 'b',
+})
+LEET_SYMBOLS = {'@': 'a', '$': 's', '!': 'i', '|': 'l', '+': 't'}
+
+# Symbols only count as letters when a letter/digit follows ("sh!t", "@ss"),
+# so trailing punctuation like "stupid!" keeps its word boundary.
+_leet_symbol_re = re.compile(r'[@$!|+](?=\w)')
+_space_re = re.compile(r'\s+')
+
+
+def fold(text):
+    """
+    Case, accents and whitespace only.
+    """
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text)
+        text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return _space_re.sub(' ', text.casefold())
+
+
+def deleet(text):
+    """
+    Leet digits and symbols to letters. One character for one, so match
+    positions line up with the folded text.
+    """
+    text = _leet_symbol_re.sub(lambda m: LEET_SYMBOLS[m.group()], text)
+    return text.translate(LEET_DIGITS)
+
+
+def normalize(text):
+    return deleet(fold(text))
+
+
+# --- COMPILATION ---
+
+def _trie_pattern(node):
+    """
+    Turns a character trie into a regex without redundant alternation,
+    e.g. {hell, help} -> hel(?:l|p). The '' key marks the end of a term.
+    """
+    branches = []
+    for ch in sorted(k for k in node if k):
+        branches.append(re.escape(ch) + _trie_pattern(node[ch]))
+
+    if not branches:
+        return ''
+    pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        pattern = '(?:' + pattern + ')?'
+    return pattern
+
+
+def compile_terms(terms):
+    """
+    Compiles every term into one regex bounded by non-letters, so digits
+    and punctuation around a term ("stupid123") still end the word.
+    Returns (pattern, lookup) where lookup maps a normalised match back to the listed term.
+    """
+    lookup = {}
+    trie = {}
+    for term in terms:
+        key = normalize(term.strip())
+        if not key or key in lookup:
+            continue
+        lookup[key] = term.strip()
+        node = trie
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    if not lookup:
+        return None, lookup
+    return re.compile(r'(?<![^\W\d_])' + _trie_pattern(trie) + r'(?![^\W\d_])'), lookup
+
+
+class ModerationEngine:
+    """
+    Matches whole words/phrases from a term list against free text.
+    """
+    def __init__(self, terms):
+        self.pattern, self.lookup = compile_terms(terms)
+
+    @staticmethod
+    def _variants(text):
+        folded = fold(text)
+        normalized = deleet(folded)
+        return (normalized,) if normalized == folded else (normalized, folded)
+
+    def find(self, text):
+        """
+        Returns the listed terms found in `text`, in order of first appearance.
+        """
+        if not text or self.pattern is None:
+            return []
+        matches = sorted(
+            (match.start(), self.lookup[match.group()])
+            for variant in self._variants(text)
+            for match in self.pattern.finditer(variant)
+        )
+        found = []
+        for _, term in matches:
+            if term not in found:
+                found.append(term)
+        return found
+
+    def contains(self, text):
+        if not text or self.pattern is None:
+            return False
+        return any(self.pattern.search(variant) for variant in self._variants(text))
+
+
+class WordListModerator:
+    """
+    ModerationEngine backed by a word-list file.
+    The file's mtime is checked at most every `check_interval` seconds and the
+    engine is rebuilt when it changes, so edits apply without a restart.
+    """
+    def __init__(self, path, check_interval=5.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._checked_at = 0.0
+        self._engine = ModerationEngine([])
+        self._reload()
+
+    def _read_terms(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return [line.strip() for line in f if line.strip()]
+
+    def _reload(self):
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except FileNotFoundError:
+            if self._mtime is None:
+                print(f"Warning: {os.path.basename(self.path)} not found.")
+            self._mtime = -1
+            return
+        if mtime != self._mtime:
+            self._engine = ModerationEngine(self._read_terms())
+            self._mtime = mtime
+
+    @property
+    def engine(self):
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_interval:
+            with self._lock:
+                if now - self._checked_at >= self.check_interval:
+                    self._checked_at = now
+                    self._reload()
+        return self._engine
+
+    def find(self, text):
+        return self.engine.find(text)
+
+    def contains(self, text):
+        return self.engine.contains(text)
@@ -0,0 +1,32 @@
+from datetime import datetime
+from app import db
+from app.models import Notification
+
+# In-app notifications shown on the student and mentor dashboards.
+# Written by background jobs (app/jobs.py), never inline in a request.
+UNREAD_SHOWN = 5
+
+
+def notify(user_ids, message, complaint_id=None):
+    """
+    One notification per distinct user; the caller commits.
+    """
+    rows = [
+        {'user_id': user_id, 'message': message[:255], 'complaint_id': complaint_id}
+        for user_id in sorted(set(user_ids) - {None})
+    ]
+    if rows:
+        db.session.execute(db.insert(Notification), rows)
+
+
+def unread_for(user_id, limit=UNREAD_SHOWN):
+    return Notification.query.filter_by(user_id=user_id, read_at=None) \
+        .order_by(Notification.created_at.desc()).limit(limit).all()
+
+
+def mark_all_read(user_id):
+    db.session.execute(
+        db.update(Notification)
+        .where(Notification.user_id == user_id, Notification.read_at.is_(None))
+        .values(read_at=datetime.utcnow())
+    )
\ No newline at end of file
@@ -0,0 +1,114 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from flask import current_app, has_app_context
+from werkzeug.security import generate_password_hash, check_password_hash
+
+# Werkzeug method strings, e.g. 'scrypt', 'scrypt:32768:8:1' or 'pbkdf2:sha256:600000'
+DEFAULT_METHOD = 'scrypt'
+
+# Below this many passwords a process pool costs more than it saves
+PARALLEL_THRESHOLD = 8
+
+
+def get_method():
+    if has_app_context():
+        return current_app.config.get('PASSWORD_HASH_METHOD', DEFAULT_METHOD)
+    return DEFAULT_METHOD
+
+
+@lru_cache(maxsize=8)
+def canonical_method(method):
+    """
+    The parameter prefix werkzeug writes for `method`, with defaults filled in
+    ('pbkdf2:sha256' -> 'pbkdf2:sha256:1000000'), so stored hashes can be compared.
+    """
+    return generate_password_hash('probe', method).split('$', 1)[0]
+
+
+def hash_password(password, method=None):
+    return generate_password_hash(password, method or get_method())
+
+
+def verify_password(stored_hash, password):
+    if not stored_hash or password is None:
+        return False
+    return check_password_hash(stored_hash, password)
+
+
+def needs_rehash(stored_hash, method=None):
+    """
+    True when `stored_hash` was made with different parameters than the configured ones.
+    """
+    if not stored_hash:
+        return False
+    return stored_hash.split('$', 1)[0] != canonical_method(method or get_method())
+
+
+def _hash_one(password, method):
+    # Module-level so it can be pickled into worker processes
+    return generate_password_hash(password, method)
+
+
+def _worker_count(workers):
+    if workers is None and has_app_context():
+        workers = current_app.config.get('PASSWORD_HASH_WORKERS')
+    return workers or os.cpu_count() or 1
+
+
+def _map(pool, passwords, method, workers):
+    chunksize = max(1, len(passwords) // (workers * 4))
+    return list(pool.map(_hash_one, passwords, repeat(method), chunksize=chunksize))
+
+
+def hash_passwords(passwords, method=None, workers=None):
+    """
+    Hashes a batch of passwords across a process pool, preserving order.
+    Falls back to hashing inline for small batches or workers=1.
+    The pool lives for this one call; for repeated batches, or inside a web
+    request, use HashingPool.
+    """
+    passwords = list(passwords)
+    method = method or get_method()
+    workers = _worker_count(workers)
+
+    if workers == 1 or len(passwords) < PARALLEL_THRESHOLD:
+        return [_hash_one(p, method) for p in passwords]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _map(pool, passwords, method, workers)
+
+
+class HashingPool:
+    """
+    hash_passwords() for many batches (e.g. an import) over one process pool,
+    started by the first batch big enough to need it and shut down on exit.
+    Workers are spawned, not forked: a web worker already runs task, broker
+    and event threads, and a forked child inherits their locks mid-use.
+    """
+    def __init__(self, workers=None):
+        self.workers = _worker_count(workers)
+        self._pool = None
+
+    def hash(self, passwords, method=None):
+        passwords = list(passwords)
+        method = method or get_method()
+        if self.workers == 1 or len(passwords) < PARALLEL_THRESHOLD:
+            return [_hash_one(p, method) for p in passwords]
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                             mp_context=multiprocessing.get_context('spawn'))
+        return _map(self._pool, passwords, method, self.workers)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
\ No newline at end of file
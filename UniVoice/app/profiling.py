@@ -0,0 +1,171 @@
+import json
+import logging
+import os
+import time
+import traceback
+from collections import Counter, deque
+from flask import g, request, has_request_context
+from sqlalchemy import event
+
+log = logging.getLogger(__name__)
+
+# Per-request database instrumentation.
+#
+# Every request gets a RequestProfile on flask.g, filled from SQLAlchemy
+# engine and session events: statement count, total DB time, the slowest
+# statements and where each lazy load was triggered from. When the request
+# ends the profile becomes a Server-Timing header and one JSON log line and,
+# if PROFILE_PAGE is on, shows up on /admin/_profile.
+#
+# NPLUSONE = 'warn' logs and 'raise' fails the request when the same lazy load
+# or statement repeats NPLUSONE_THRESHOLD times, so N+1 regressions break tests.
+
+APP_ROOT = os.path.dirname(os.path.abspath(__file__))
+SLOWEST_KEPT = 5
+SQL_PREVIEW = 300
+
+
+class NPlusOneError(AssertionError):
+    pass
+
+
+def _call_site():
+    """
+    Innermost frame in app code or a template: where a lazy load came from.
+    """
+    for frame in reversed(traceback.extract_stack()):
+        filename = frame.filename
+        if filename == __file__:
+            continue
+        if filename.endswith('.html'):
+            return os.path.relpath(filename, APP_ROOT)
+        if filename.startswith(APP_ROOT) and 'site-packages' not in filename:
+            return f'{os.path.relpath(filename, APP_ROOT)}:{frame.lineno}'
+    return 'unknown'
+
+
+class RequestProfile:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.slowest = []  # (seconds, sql)
+        self.statements = Counter()
+        self.lazy_loads = Counter()  # (relationship, call site) -> count
+
+    def add_query(self, statement, elapsed):
+        self.queries += 1
+        self.db_time += elapsed
+        self.statements[statement] += 1
+        if len(self.slowest) < SLOWEST_KEPT or elapsed > self.slowest[-1][0]:
+            self.slowest.append((elapsed, statement))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[SLOWEST_KEPT:]
+
+    def add_lazy_load(self, relationship, site):
+        self.lazy_loads[(relationship, site)] += 1
+
+    def repeated(self, threshold):
+        """
+        Lazy loads and statements run at least `threshold` times: likely N+1 patterns.
+        """
+        found = [f'{count}x lazy load {rel} from {site}'
+                 for (rel, site), count in self.lazy_loads.items() if count >= threshold]
+        found += [f'{count}x {" ".join(sql.split())[:120]}'
+                  for sql, count in self.statements.items() if count >= threshold]
+        return found
+
+    def as_dict(self, slow_ms):
+        return {
+            'total_ms': round((time.perf_counter() - self.started) * 1000, 2),
+            'db_ms': round(self.db_time * 1000, 2),
+            'queries': self.queries,
+            'slow_queries': [
+                {'ms': round(seconds * 1000, 2), 'sql': ' '.join(sql.split())[:SQL_PREVIEW]}
+                for seconds, sql in self.slowest if seconds * 1000 >= slow_ms
+            ],
+            'lazy_loads': [
+                {'relationship': rel, 'source': site, 'count': count}
+                for (rel, site), count in self.lazy_loads.most_common()
+            ],
+        }
+
+
+class Profiler:
+    """
+    Flask extension wiring RequestProfile to the engine, the session and the request.
+    """
+    def __init__(self):
+        self.history = deque(maxlen=100)
+
+    def init_app(self, app, db):
+        if not app.config['PROFILING']:
+            return
+
+        self.app = app
+        self.history = deque(maxlen=app.config['PROFILE_HISTORY'])
+        app.extensions['profiler'] = self
+
+        with app.app_context():
+            engines = list(db.engines.values())  # primary and, if configured, the replica
+        for engine in engines:
+            event.listen(engine, 'before_cursor_execute', self._before_cursor)
+            event.listen(engine, 'after_cursor_execute', self._after_cursor)
+        event.listen(db.session, 'do_orm_execute', self._on_orm_execute)
+        app.before_request(self._start)
+        app.after_request(self._finish)
+
+    # --- EVENTS ---
+
+    @staticmethod
+    def _current():
+        if has_request_context():
+            return g.get('sql_profile')
+        return None
+
+    def _before_cursor(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('profile_started', []).append(time.perf_counter())
+
+    def _after_cursor(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info['profile_started'].pop()
+        profile = self._current()
+        if profile is not None:
+            profile.add_query(statement, time.perf_counter() - started)
+
+    def _on_orm_execute(self, state):
+        profile = self._current()
+        if profile is None or not state.is_relationship_load or state.lazy_loaded_from is None:
+            return
+        target = state.bind_mapper.class_.__name__ if state.bind_mapper else '?'
+        relationship = f'{state.lazy_loaded_from.class_.__name__} -> {target}'
+        profile.add_lazy_load(relationship, _call_site())
+
+    # --- REQUEST HOOKS ---
+
+    def _start(self):
+        g.sql_profile = RequestProfile()
+
+    def _finish(self, response):
+        profile = g.pop('sql_profile', None)
+        if profile is None:
+            return response
+        config = self.app.config
+        record = profile.as_dict(config['SLOW_QUERY_MS'])
+        record.update(method=request.method, path=request.full_path.rstrip('?'),
+                      endpoint=request.endpoint, status=response.status_code)
+
+        response.headers.add('Server-Timing', f'db;dur={record["db_ms"]};desc="{record["queries"]} queries"')
+        response.headers.add('Server-Timing', f'app;dur={record["total_ms"]}')
+
+        log.info(json.dumps(record, default=str))
+        if config['PROFILE_PAGE']:
+            self.history.appendleft(record)
+
+        if config['NPLUSONE'] != 'off':
+            repeated = profile.repeated(config['NPLUSONE_THRESHOLD'])
+            if repeated:
+                message = f'Possible N+1 queries in {request.method} {request.path}:\n  ' + '\n  '.join(repeated)
+                if config['NPLUSONE'] == 'raise':
+                    raise NPlusOneError(message)
+                log.warning(message)
+        return response
\ No newline at end of file
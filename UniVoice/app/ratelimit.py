@@ -0,0 +1,181 @@
+import logging
+import math
+import re
+import threading
+import time
+from functools import wraps
+from flask import current_app, request, session
+from werkzeug.exceptions import TooManyRequests
+
+# Request throttling for expensive or abusable endpoints.
+#
+# Each limited view names the keys it is counted by ('ip', 'email', 'user');
+# the limit for every (view, key) pair comes from config, e.g.
+# RATELIMIT_LOGIN_EMAIL = '5/minute'. Counting uses a sliding window
+# approximated from two fixed windows: the previous window's count is
+# weighted by how much of it still overlaps the last `period` seconds.
+# That needs only one counter per key per window, so it works the same on
+# the in-process backend and on Redis (INCR + EXPIRE).
+#
+# The check runs before the view, so an over-limit request is answered
+# with 429 before any password hashing or database work.
+
+logger = logging.getLogger(__name__)
+
+# (view, key) pairs; each limit is the RATELIMIT_<VIEW>_<KEY> setting, '' to disable
+LIMITS = [('login', 'ip'), ('login', 'email'), ('complaint', 'user')]
+
+_PERIODS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+_LIMIT_RE = re.compile(r'^\s*(\d+)\s*/\s*(\d*)\s*(second|minute|hour|day)s?\s*$')
+
+
+def parse_limit(text):
+    """
+    '5/minute' or '20/15minutes' -> (count, period_seconds); None when empty.
+    """
+    if not text:
+        return None
+    match = _LIMIT_RE.match(text.lower())
+    if not match:
+        raise ValueError(f'Invalid rate limit {text!r}, expected e.g. "5/minute" or "20/15minutes"')
+    count, multiplier, unit = match.groups()
+    return int(count), int(multiplier or 1) * _PERIODS[unit]
+
+
+# --- KEYS ---
+
+def _ip():
+    # Behind a reverse proxy this is the proxy unless PROXY_FIX is set (see create_app)
+    return request.remote_addr
+
+
+def _email():
+    # Every attempt counts, successful or not, so anyone who knows an address
+    # can hold that account at its limit (bounded by the per-IP limit)
+    return (request.form.get('email') or '').strip().lower() or None
+
+
+def _user():
+    # From the session cookie, so no user row has to be loaded
+    return session.get('_user_id')
+
+
+KEY_FUNCTIONS = {'ip': _ip, 'email': _email, 'user': _user}
+
+
+# --- BACKENDS ---
+
+class MemoryCounters:
+    """
+    Per-process counters with expiry. Each worker counts on its own, so the
+    effective limit is multiplied by the number of processes.
+    """
+    def __init__(self, sweep_every=1000):
+        self._data = {}
+        self._lock = threading.Lock()
+        self._ops = 0
+        self.sweep_every = sweep_every
+
+    def incr(self, key, ttl):
+        now = time.monotonic()
+        with self._lock:
+            self._ops += 1
+            if self._ops % self.sweep_every == 0:
+                self._data = {k: v for k, v in self._data.items() if v[0] > now}
+            expires_at, count = self._data.get(key, (0, 0))
+            if expires_at <= now:
+                expires_at, count = now + ttl, 0
+            self._data[key] = (expires_at, count + 1)
+            return count + 1
+
+    def get(self, key):
+        with self._lock:
+            expires_at, count = self._data.get(key, (0, 0))
+            return count if expires_at > time.monotonic() else 0
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class RedisCounters:
+    """
+    Counters shared by every worker.
+    `client` is anything with Redis-style pipeline/incr/expire/get.
+    """
+    def __init__(self, client, prefix='univoice:ratelimit:'):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url, **kwargs):
+        import redis  # optional dependency, only needed for this backend
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def incr(self, key, ttl):
+        pipe = self.client.pipeline()
+        pipe.incr(self.prefix + key)
+        pipe.expire(self.prefix + key, ttl)
+        return int(pipe.execute()[0])
+
+    def get(self, key):
+        return int(self.client.get(self.prefix + key) or 0)
+
+    def clear(self):
+        for key in self.client.scan_iter(self.prefix + '*'):
+            self.client.delete(key)
+
+
+# --- LIMITER ---
+
+class RateLimiter:
+    def __init__(self, backend=None):
+        self.backend = backend or MemoryCounters()
+        self.rejected = 0
+
+    def init_app(self, app):
+        for view, key in LIMITS:
+            parse_limit(app.config[f'RATELIMIT_{view}_{key}'.upper()])  # fail at startup, not per request
+        if app.config['RATELIMIT_BACKEND'] == 'redis':
+            self.backend = RedisCounters.from_url(app.config['RATELIMIT_REDIS_URL'])
+        app.extensions['ratelimit'] = self
+
+    def hit(self, name, limit):
+        """
+        Counts one request for `name` against `limit` = (count, period).
+        Returns None if allowed, else seconds until it would be.
+        """
+        count, period = limit
+        now = time.time()
+        window = int(now // period)
+        current = self.backend.incr(f'{name}:{period}:{window}', ttl=2 * period)
+        previous = self.backend.get(f'{name}:{period}:{window - 1}')
+        elapsed = now - window * period
+        if previous * (period - elapsed) / period + current <= count:
+            return None
+        return max(1, math.ceil(period - elapsed))
+
+    def limit(self, view, *keys, methods=('POST',)):
+        """
+        Decorator: 429 once any of `keys` ('ip', 'email', 'user') is over
+        its RATELIMIT_<VIEW>_<KEY> limit. Only `methods` are counted.
+        """
+        def decorator(f):
+            @wraps(f)
+            def wrapper(*args, **kwargs):
+                config = current_app.config
+                if config['RATELIMIT_ENABLED'] and request.method in methods:
+                    for key in keys:
+                        limit = parse_limit(config[f'RATELIMIT_{view}_{key}'.upper()])
+                        value = KEY_FUNCTIONS[key]() if limit else None
+                        if value is None:
+                            continue
+                        retry_after = self.hit(f'{view}:{key}:{value}', limit)
+                        if retry_after is not None:
+                            self.rejected += 1
+                            logger.warning('Rate limit hit: %s by %s (%s)', view, key, value)
+                            raise TooManyRequests(f'Too many attempts. Try again in {retry_after} seconds.',
+                                                  retry_after=retry_after)
+                return f(*args, **kwargs)
+            return wrapper
+        return decorator
\ No newline at end of file
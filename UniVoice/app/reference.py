@@ -0,0 +1,58 @@
+from collections import namedtuple
+from app import reference_cache as cache
+from app.database import primary_reads
+from app.models import User, Hostel, UserRole
+
+# Plain snapshots instead of ORM objects, so they can outlive the session
+# that loaded them and be pickled into a shared cache.
+HostelRef = namedtuple('HostelRef', ['id', 'name', 'gender', 'total_rooms'])
+MentorRef = namedtuple('MentorRef', ['id', 'name', 'email'])
+
+HOSTELS_KEY = 'ref:hostels'
+MENTORS_KEY = 'ref:mentors'
+
+
+# Cache fills read the primary: a stale replica row would be served until CACHE_TTL
+
+@primary_reads()
+def _load_hostels():
+    rows = Hostel.query.with_entities(Hostel.id, Hostel.name, Hostel.gender, Hostel.total_rooms) \
+        .order_by(Hostel.id).all()
+    return [HostelRef(*row) for row in rows]
+
+
+@primary_reads()
+def _load_mentors():
+    rows = User.query.with_entities(User.id, User.name, User.email) \
+        .filter_by(role=UserRole.MENTOR).order_by(User.id).all()
+    return [MentorRef(*row) for row in rows]
+
+
+def get_hostels():
+    return cache.get_or_set(HOSTELS_KEY, _load_hostels)
+
+
+def get_hostel(hostel_id):
+    """
+    Looks a hostel up in the cached list; None if it does not exist.
+    """
+    try:
+        hostel_id = int(hostel_id)
+    except (TypeError, ValueError):
+        return None
+    return next((h for h in get_hostels() if h.id == hostel_id), None)
+
+
+def get_mentors():
+    return cache.get_or_set(MENTORS_KEY, _load_mentors)
+
+
+# --- INVALIDATION HOOKS ---
+# Call after committing a change to a hostel or mentor.
+
+def invalidate_hostels():
+    cache.invalidate(HOSTELS_KEY)
+
+
+def invalidate_mentors():
+    cache.invalidate(MENTORS_KEY)
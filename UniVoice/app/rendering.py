@@ -0,0 +1,72 @@
+import os
+from jinja2 import FileSystemBytecodeCache
+from app.cache import MemoryBackend
+
+# Template rendering caches.
+#
+# Fragment cache: rendered complaint-table rows, reused across requests.
+# A row only changes when its complaint does, and every change moves
+# Complaint.updated_at, so (row name, id, updated_at) never needs explicit
+# invalidation -- an edited complaint simply gets a new key and the old entry
+# falls out of the LRU. Anything else a row shows (the author's name and
+# room, the dashboard section) is passed in as extra key parts. Entries are
+# per process: a hit is a dict lookup, where a shared backend would cost a
+# round trip per row.
+#
+# Bytecode cache: compiled templates are written to JINJA_BYTECODE_CACHE,
+# so new workers load them instead of compiling every template from source.
+#
+# Templates use it as a call block:
+#     {% call cached_row('warden', c, section, c.author.name) %} <tr>...</tr> {% endcall %}
+
+
+class RenderCache:
+    def __init__(self, maxsize=5000):
+        self.backend = MemoryBackend(maxsize=maxsize)
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+
+    def init_app(self, app):
+        self.enabled = app.config['FRAGMENT_CACHE']
+        self.backend = MemoryBackend(maxsize=app.config['FRAGMENT_CACHE_SIZE'])
+        app.extensions['render_cache'] = self
+        app.jinja_env.globals['cached_row'] = self.cached_row
+
+        directory = app.config['JINJA_BYTECODE_CACHE']
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory)
+
+    @staticmethod
+    def key(name, complaint, parts):
+        version = complaint.updated_at.timestamp() if complaint.updated_at else ''
+        return ':'.join(str(part) for part in (name, complaint.id, version) + parts)
+
+    def cached_row(self, name, complaint, *parts, caller):
+        """
+        The block's HTML for `complaint`, rendered once per version.
+        """
+        if not self.enabled:
+            return caller()
+        key = self.key(name, complaint, parts)
+        html = self.backend.get(key)
+        if html is None:
+            self.misses += 1
+            html = caller()
+            self.backend.set(key, html)
+        else:
+            self.hits += 1
+        return html
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else None,
+        }
\ No newline at end of file
@@ -0,0 +1,113 @@
+from app import db
+from app.models import User, Room, UserRole
+
+# Students keep their free-text room_number, but are also linked to the
+# matching Room through users.room_id. Each Room carries an `occupants`
+# counter, so occupancy and vacancy questions are answered from the
+# rooms table (or the users.room_id index) instead of scanning users.
+
+
+def room_lookup(hostel_id):
+    """
+    {room_number: room_id} for one hostel, from a single query.
+    """
+    rows = db.session.query(Room.room_number, Room.id).filter_by(hostel_id=hostel_id)
+    return {number: room_id for number, room_id in rows}
+
+
+def resolve_room_id(hostel_id, room_number):
+    if not hostel_id or not room_number:
+        return None
+    return db.session.query(Room.id) \
+        .filter_by(hostel_id=hostel_id, room_number=room_number.strip()).scalar()
+
+
+def _bump(room_id, delta):
+    if room_id:
+        db.session.execute(
+            db.update(Room).where(Room.id == room_id).values(occupants=Room.occupants + delta)
+        )
+
+
+def assign_room(user, hostel_id, room_number):
+    """
+    Moves `user` to (hostel_id, room_number) and keeps both rooms' counters right.
+    The caller commits.
+    """
+    old_room_id = user.room_id
+    user.hostel_id = hostel_id
+    user.room_number = room_number or None
+    user.room_id = resolve_room_id(hostel_id, room_number) if user.role == UserRole.STUDENT else None
+
+    if user.room_id != old_room_id:
+        _bump(old_room_id, -1)
+        _bump(user.room_id, +1)
+
+
+def refresh_occupancy(room_ids=None):
+    """
+    Recounts `occupants` from users.room_id, for the given rooms or all of them.
+    Used after bulk inserts that bypass assign_room.
+    """
+    count = db.select(db.func.count(User.id)).where(User.room_id == Room.id).scalar_subquery()
+    stmt = db.update(Room).values(occupants=count)
+    if room_ids is not None:
+        room_ids = list(room_ids)
+        if not room_ids:
+            return
+        stmt = stmt.where(Room.id.in_(room_ids))
+    db.session.execute(stmt)
+
+
+def rebuild_occupancy():
+    """
+    Links every student to its Room by (hostel_id, room_number), then recounts.
+    One UPDATE each; safe to re-run.
+    """
+    match = db.select(Room.id).where(
+        Room.hostel_id == User.hostel_id, Room.room_number == User.room_number
+    ).order_by(Room.id).limit(1).scalar_subquery()
+    db.session.execute(db.update(User).where(User.role == UserRole.STUDENT).values(room_id=match))
+    refresh_occupancy()
+    db.session.commit()
+
+
+# --- QUERIES ---
+
+def occupants_of(hostel_id, room_number):
+    """
+    Student ids in a room, via the users.room_id index.
+    """
+    room_id = resolve_room_id(hostel_id, room_number)
+    if room_id is None:
+        return []
+    return [uid for (uid,) in db.session.query(User.id).filter_by(room_id=room_id)]
+
+
+def vacant_rooms(hostel_id):
+    """
+    Rooms in a hostel with at least one free bed, with the number of free beds.
+    """
+    return db.session.query(Room.room_number, Room.capacity - Room.occupants) \
+        .filter(Room.hostel_id == hostel_id, Room.occupants < Room.capacity) \
+        .order_by(Room.room_number).all()
+
+
+def occupancy_by_hostel():
+    """
+    {hostel_id: (capacity, occupied)} for every hostel, from one GROUP BY.
+    """
+    rows = db.session.query(Room.hostel_id, db.func.sum(Room.capacity), db.func.sum(Room.occupants)) \
+        .group_by(Room.hostel_id).all()
+    return {hostel_id: (capacity or 0, occupied or 0) for hostel_id, capacity, occupied in rows}
+
+
+def hostel_occupancy(hostel_id):
+    """
+    (capacity, occupied, vacancies) for a hostel from one aggregate over its rooms.
+    """
+    capacity, occupied = db.session.query(
+        db.func.coalesce(db.func.sum(Room.capacity), 0),
+        db.func.coalesce(db.func.sum(Room.occupants), 0),
+    ).filter(Room.hostel_id == hostel_id).one()
+    return capacity, occupied, max(capacity - occupied, 0)
@@ -4,4 +4,4 @@ from flask import Blueprint
 main = Blueprint('main', __name__)
 
 # Import the routes so they get registered with the Blueprint
-from . import auth, admin, student, warden, mentor
\ No newline at end of file
+from . import auth, admin, student, warden, mentor, events, notifications
\ No newline at end of file
@@ -1,15 +1,37 @@
-from flask import render_template, redirect, url_for, flash, request
+import io
+from datetime import datetime
+from flask import render_template, redirect, url_for, flash, request, jsonify, abort, current_app, \
+    Response, stream_with_context
 from flask_login import login_required, current_user
-from app import db
-from app.models import User, Hostel, UserRole, Complaint, ComplaintStatus
+from app import db, reference_cache, profiler, render_cache
+from app.models import User, Hostel, UserRole, Complaint, ComplaintStatus, Category
+from app.listing import paginate_complaints
+from app.stats import complaint_stats
+from app import reference
+from app.identity import invalidate_identity
+from app.importer import IMPORTABLE_ROLES, import_users
+from app.rooms import assign_room, occupancy_by_hostel
+from app.bulk import parse_ids, update_complaints, delete_complaints
+from app.search import search_complaints
+from app.archive import student_history
+from app import analytics
+from app import export
 from . import main
+from .utils import bulk_args, bulk_error, bulk_response, is_set
 
 # 1. MAIN HUB
 @main.route('/admin/dashboard')
 @login_required
 def admin_dashboard():
     if current_user.role != UserRole.ADMIN: return redirect(url_for('main.login'))
-    return render_template('admin/dashboard.html')
+
+    # Read from the daily rollup, not the complaints table
+    days = 30
+    metrics = analytics.summary(*analytics.default_range(days), group_by='hostel')
+    return render_template('admin/dashboard.html',
+                           metrics=metrics,
+                           metrics_days=days,
+                           hostels=reference.get_hostels())
 
 # 2. HOSTEL MANAGEMENT
 @main.route('/admin/hostels', methods=['GET', 'POST'])
@@ -30,11 +52,12 @@ def admin_hostels():
             db.session.add(new_hostel)
             db.session.commit()
             new_hostel.generate_rooms()
+            reference.invalidate_hostels()
             flash(f'Hostel {name} created!', 'success')
         return redirect(url_for('main.admin_hostels'))
 
-    hostels = Hostel.query.all()
-    return render_template('admin/manage_hostels.html', hostels=hostels)
+    hostels = reference.get_hostels()
+    return render_template('admin/manage_hostels.html', hostels=hostels, occupancy=occupancy_by_hostel())
 
 # 3. WARDEN MANAGEMENT
 @main.route('/admin/wardens', methods=['GET', 'POST'])
@@ -61,7 +84,7 @@ def admin_wardens():
         return redirect(url_for('main.admin_wardens'))
 
     wardens = User.query.filter_by(role=UserRole.WARDEN).all()
-    hostels = Hostel.query.all()
+    hostels = reference.get_hostels()
     return render_template('admin/manage_wardens.html', wardens=wardens, hostels=hostels)
 
 # 4. MENTOR MANAGEMENT
@@ -82,10 +105,11 @@ def admin_mentors():
             new_user.set_password(password)
             db.session.add(new_user)
             db.session.commit()
+            reference.invalidate_mentors()
             flash(f'Mentor {name} created!', 'success')
         return redirect(url_for('main.admin_mentors'))
 
-    mentors = User.query.filter_by(role=UserRole.MENTOR).all()
+    mentors = reference.get_mentors()
     return render_template('admin/manage_mentors.html', mentors=mentors)
 
 # 5. STUDENT MANAGEMENT (List & Create)
@@ -108,9 +132,9 @@ def admin_students():
         else:
             new_user = User(email=email, name=name, role=UserRole.STUDENT)
             new_user.set_password(password)
-            if hostel_id: new_user.hostel_id = int(hostel_id)
             if mentor_id: new_user.mentor_id = int(mentor_id)
-            if room_number: new_user.room_number = room_number 
+            # Links the matching Room and updates its occupancy
+            assign_room(new_user, int(hostel_id) if hostel_id else None, room_number)
             
             db.session.add(new_user)
             db.session.commit()
@@ -123,11 +147,11 @@ def admin_students():
     selected_hostel = None
 
     if hostel_id:
-        selected_hostel = Hostel.query.get(hostel_id)
+        selected_hostel = reference.get_hostel(hostel_id)
         students = User.query.filter_by(role=UserRole.STUDENT, hostel_id=hostel_id).order_by(User.room_number).all()
 
-    hostels = Hostel.query.all()
-    mentors = User.query.filter_by(role=UserRole.MENTOR).all()
+    hostels = reference.get_hostels()
+    mentors = reference.get_mentors()
     
     return render_template('admin/manage_students.html', 
                            students=students, 
@@ -142,7 +166,7 @@ def admin_student_profile(user_id):
     if current_user.role != UserRole.ADMIN: return redirect(url_for('main.login'))
     
     student = User.query.get_or_404(user_id)
-    all_complaints = Complaint.query.filter_by(user_id=student.id).order_by(Complaint.created_at.desc()).all()
+    all_complaints = student_history(student.id)  # includes archived complaints
     
     flagged_complaints = [c for c in all_complaints if c.status == ComplaintStatus.FLAGGED]
     history_complaints = [c for c in all_complaints if c.status != ComplaintStatus.FLAGGED]
@@ -165,12 +189,15 @@ def edit_user(user_id):
         user.email = request.form.get('email')
         
         h_id = request.form.get('hostel_id')
-        user.hostel_id = int(h_id) if h_id else None
+        assign_room(user, int(h_id) if h_id else None, user.room_number)
         
         m_id = request.form.get('mentor_id')
         user.mentor_id = int(m_id) if m_id else None
         
         db.session.commit()
+        invalidate_identity(user.id)
+        if user.role == UserRole.MENTOR:
+            reference.invalidate_mentors()
         flash(f'Updated profile for {user.name}', 'success')
         
         # Redirect back to context
@@ -182,8 +209,8 @@ def edit_user(user_id):
              return redirect(url_for('main.admin_mentors'))
         return redirect(url_for('main.admin_dashboard'))
         
-    hostels = Hostel.query.all()
-    mentors = User.query.filter_by(role=UserRole.MENTOR).all()
+    hostels = reference.get_hostels()
+    mentors = reference.get_mentors()
     return render_template('admin/edit_user.html', user=user, hostels=hostels, mentors=mentors)
 
 # 8. COMPLAINTS MANAGER
@@ -195,16 +222,14 @@ def admin_view_complaints():
     hostel_id = request.args.get('hostel_id')
     status_filter = request.args.get('status')
     
-    hostels = Hostel.query.all()
+    hostels = reference.get_hostels()
     complaints = []
     selected_hostel = None
     counts = {}
 
     if hostel_id:
-        selected_hostel = Hostel.query.get(hostel_id)
-        for s in ComplaintStatus:
-            count = Complaint.query.filter_by(hostel_id=hostel_id, status=s).count()
-            counts[s.value] = count
+        selected_hostel = reference.get_hostel(hostel_id)
+        counts = complaint_stats(hostel_id=hostel_id).by_status
             
         query = Complaint.query.filter_by(hostel_id=hostel_id)
         if status_filter:
@@ -212,7 +237,7 @@ def admin_view_complaints():
         else:
             query = query.filter_by(status=ComplaintStatus.PENDING)
             status_filter = 'pending'
-        complaints = query.order_by(Complaint.created_at.desc()).all()
+        complaints = paginate_complaints(query, cursor=request.args.get('cursor'))
     
     return render_template('admin/complaints.html', 
                            complaints=complaints, 
@@ -227,11 +252,144 @@ def admin_view_complaints():
 def admin_delete_complaint(complaint_id):
     if current_user.role != UserRole.ADMIN: return redirect(url_for('main.login'))
         
-    complaint = Complaint.query.get_or_404(complaint_id)
-    hostel_id = complaint.hostel_id 
-    
-    db.session.delete(complaint)
-    db.session.commit()
+    hostel_id = db.session.query(Complaint.hostel_id).filter_by(id=complaint_id).scalar()
+    if hostel_id is None:
+        abort(404)
+    delete_complaints([], ids=[complaint_id], actor_id=current_user.id)
     
     flash('Complaint deleted permanently.', 'info')
-    return redirect(url_for('main.admin_view_complaints', hostel_id=hostel_id))
\ No newline at end of file
+    return redirect(url_for('main.admin_view_complaints', hostel_id=hostel_id))
+
+# 9b. BULK STATUS / DELETE
+@main.route('/admin/bulk_complaints', methods=['POST'])
+@login_required
+def admin_bulk_complaints():
+    """
+    `action` is 'delete' or a status, applied to the ticked complaints, or
+    with `all` to every complaint of `hostel_id` in the `status` tab.
+    """
+    if current_user.role != UserRole.ADMIN: return redirect(url_for('main.login'))
+
+    args, as_json = bulk_args()
+    hostel_id, tab = args.get('hostel_id'), args.get('status')
+    back = url_for('main.admin_view_complaints', hostel_id=hostel_id, status=tab)
+    action = args.get('action')
+    try:
+        ids = parse_ids(args['ids'])
+        status = None if action == 'delete' else ComplaintStatus(action)
+    except (TypeError, ValueError):
+        return bulk_error('Invalid complaint ids or action.', as_json, back)
+
+    where = None
+    if is_set(args.get('all')):
+        try:
+            ids, where = None, (Complaint.hostel_id == int(hostel_id)) & (Complaint.status == ComplaintStatus(tab))
+        except (TypeError, ValueError):
+            return bulk_error('Pick a hostel and a status tab first.', as_json, back)
+    elif not ids:
+        return bulk_error('No complaints selected.', as_json, back)
+
+    if status is None:
+        results = delete_complaints([], ids=ids, where=where, actor_id=current_user.id)
+    else:
+        results = update_complaints([], ids=ids, where=where, status=status, actor_id=current_user.id,
+                                    action='complaint.admin_update', by='admin')
+    return bulk_response(results, as_json, back)
+
+# 10. CACHE STATS
+@main.route('/admin/cache_stats')
+@login_required
+def admin_cache_stats():
+    if current_user.role != UserRole.ADMIN: return redirect(url_for('main.login'))
+    return jsonify(dict(reference_cache.stats(), fragments=render_cache.stats()))
+
+# 11. BULK IMPORT (CSV)
+@main.route('/admin/import', methods=['GET', 'POST'])
+@login_required
+def admin_import_users():
+    if current_user.role != UserRole.ADMIN: return redirect(url_for('main.login'))
+
+    result = None
+    role = request.form.get('role', 'student')
+
+    if request.method == 'POST':
+        upload = request.files.get('csv_file')
+        if not upload or not upload.filename:
+            flash('Please choose a CSV file.', 'danger')
+            return redirect(url_for('main.admin_import_users'))
+        if role not in IMPORTABLE_ROLES:
+            flash('Invalid role.', 'danger')
+            return redirect(url_for('main.admin_import_users'))
+
+        # Read the upload as a text stream instead of loading it into memory
+        stream = io.TextIOWrapper(upload.stream, encoding='utf-8-sig')
+        result = import_users(stream, role, dry_run=request.form.get('dry_run') == 'on')
+
+        verb = 'would be created (dry run)' if result.dry_run else 'created'
+        flash(f'{result.created} of {result.total} accounts {verb}.', 'success' if result.ok else 'warning')
+
+    return render_template('admin/import_users.html', result=result, role=role, roles=sorted(IMPORTABLE_ROLES))
+
+# 12. SEARCH
+@main.route('/admin/search')
+@login_required
+def admin_search():
+    if current_user.role != UserRole.ADMIN: return redirect(url_for('main.login'))
+
+    q = request.args.get('q', '').strip()
+    filters = {
+        'category': request.args.get('category') or None,
+        'status': request.args.get('status') or None,
+        'hostel_id': request.args.get('hostel_id') or None,
+    }
+    try:
+        results = search_complaints(q, page=request.args.get('page', 1, type=int), **filters)
+    except ValueError:
+        flash('Invalid search filter.', 'danger')
+        return redirect(url_for('main.admin_search', q=q))
+
+    return render_template('admin/search.html',
+                           q=q,
+                           filters=filters,
+                           results=results,
+                           hostels={h.id: h.name for h in reference.get_hostels()},
+                           Category=Category,
+                           ComplaintStatus=ComplaintStatus)
+
+# 13. REQUEST PROFILES (opt-in with PROFILE_PAGE=1)
+@main.route('/admin/_profile')
+@login_required
+def admin_profile():
+    if current_user.role != UserRole.ADMIN: return redirect(url_for('main.login'))
+    if not current_app.config.get('PROFILE_PAGE'):
+        abort(404)
+    return render_template('admin/profile.html', requests=list(profiler.history),
+                           slow_ms=current_app.config['SLOW_QUERY_MS'])
+
+# 14. EXPORTS (streamed CSV / XLSX)
+@main.route('/admin/export/<kind>.<fmt>')
+@login_required
+def admin_export(kind, fmt):
+    """
+    Streams complaints (?hostel_id, status, category, from, to, archived=1)
+    or the student roster (?hostel_id). CSV is gzipped when the client accepts it.
+    """
+    if current_user.role != UserRole.ADMIN: return redirect(url_for('main.login'))
+    if kind not in export.EXPORTS or fmt not in export.FORMATS:
+        abort(404)
+
+    compress = fmt == 'csv' and 'gzip' in request.accept_encodings
+    try:
+        chunks = export.export(kind, fmt, request.args, compress=compress)
+    except ValueError:
+        flash('Invalid export filter.', 'danger')
+        return redirect(url_for('main.admin_view_complaints' if kind == 'complaints' else 'main.admin_students'))
+
+    # Rows are read while the response is sent, inside the request context
+    response = Response(stream_with_context(chunks), mimetype=export.FORMATS[fmt])
+    filename = f"{kind}-{datetime.utcnow():%Y%m%d-%H%M}.{fmt}"
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response.vary.add('Accept-Encoding')
+    if compress:
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
\ No newline at end of file
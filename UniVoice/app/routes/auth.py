@@ -1,12 +1,13 @@
 from flask import render_template, redirect, url_for, flash, request
 from flask_login import login_user, logout_user, login_required, current_user
 from app.models import User, UserRole
-from app import oauth  # <--- Import oauth
+from app import db, oauth, limiter  # <--- Import oauth
 from . import main
 
 # --- STANDARD ROUTES ---
 
 @main.route('/', methods=['GET', 'POST'])
+@limiter.limit('login', 'ip', 'email')  # before the password hash is checked
 def login():
     if current_user.is_authenticated:
         return redirect_based_on_role(current_user)
@@ -17,6 +18,7 @@ def login():
         password = request.form.get('password')
         user = User.query.filter_by(email=email).first()
         if user and user.check_password(password):
+            db.session.commit()  # persists a rehashed password, if any
             login_user(user)
             return redirect_based_on_role(user)
         else:
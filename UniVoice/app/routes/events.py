@@ -0,0 +1,29 @@
+from flask import abort
+from flask_login import login_required, current_user
+from app.models import UserRole
+from app.live import event_stream, channels_for
+from . import main
+
+# Live updates for open dashboards. Pages keep one EventSource open
+# instead of reloading to find out whether anything changed.
+
+@main.route('/events')
+@login_required
+def my_events():
+    """
+    Stream for the caller's own scope: hostel for wardens, mentees for mentors,
+    own complaints for students.
+    """
+    channels = channels_for(current_user)
+    if not channels:
+        abort(403)
+    return event_stream(channels)
+
+
+@main.route('/events/hostel/<int:hostel_id>')
+@login_required
+def hostel_events(hostel_id):
+    own_hostel = current_user.role == UserRole.WARDEN and current_user.hostel_id == hostel_id
+    if current_user.role != UserRole.ADMIN and not own_hostel:
+        abort(403)
+    return event_stream([f'hostel:{hostel_id}'])
\ No newline at end of file
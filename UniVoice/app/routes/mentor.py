@@ -1,7 +1,13 @@
 from flask import render_template, redirect, url_for, flash, request
 from flask_login import login_required, current_user
-from app import db
-from app.models import UserRole, Complaint
+from app import db, tasks
+from app.models import UserRole, Complaint, User
+from app.listing import paginate_complaints
+from app.stats import mentee_ids, caseload
+from app.notifications import unread_for
+from app.live import publish_complaint, COMMENT_UPDATED
+from app.duplicates import escalate_to_parent
+from datetime import datetime
 from . import main
 
 @main.route('/mentor/dashboard', methods=['GET', 'POST'])
@@ -16,23 +22,37 @@ def mentor_dashboard():
         comment = request.form.get('mentor_comment')
         is_urgent = request.form.get('is_urgent') == 'on'
         
-        complaint = Complaint.query.get(complaint_id)
+        # Ownership is part of the lookup, so the author row is never loaded
+        complaint = Complaint.query.join(User, Complaint.user_id == User.id) \
+            .filter(Complaint.id == complaint_id, User.mentor_id == current_user.id).first()
         
-        if complaint and complaint.author.mentor_id == current_user.id:
+        if complaint:
+            if (comment or None) != (complaint.mentor_comment or None):
+                tasks.enqueue('notify-comment', complaint_id=complaint.id, by='mentor')
+            tasks.enqueue('audit', action='complaint.mentor_update', complaint_id=complaint.id, actor_id=current_user.id,
+                          detail={'is_urgent': is_urgent})
             complaint.mentor_comment = comment
             complaint.is_urgent = is_urgent
+            # Reports are folded into their parent on the warden dashboard
+            parent_id = escalate_to_parent(complaint, datetime.utcnow())
             db.session.commit()
+            publish_complaint(COMMENT_UPDATED, complaint, mentor_id=current_user.id)
+            if parent_id:
+                publish_complaint(COMMENT_UPDATED, db.session.get(Complaint, parent_id))
             flash('Complaint updated successfully!', 'success')
         else:
             flash('Permission denied: Not your mentee.', 'danger')
         return redirect(url_for('main.mentor_dashboard'))
 
-    mentee_ids = [student.id for student in current_user.mentees]
-    if mentee_ids:
-        my_mentee_complaints = Complaint.query.filter(
-            Complaint.user_id.in_(mentee_ids)
-        ).order_by(Complaint.created_at.desc()).all()
-    else:
-        my_mentee_complaints = []
+    query = Complaint.query.filter(Complaint.user_id.in_(mentee_ids(current_user.id)))
+    # ?mentee=<id> narrows to one student; the mentee filter above still applies
+    mentee = request.args.get('mentee', type=int)
+    if mentee:
+        query = query.filter(Complaint.user_id == mentee)
+    my_mentee_complaints = paginate_complaints(query, cursor=request.args.get('cursor'))
     
-    return render_template('mentor/dashboard.html', complaints=my_mentee_complaints)
\ No newline at end of file
+    return render_template('mentor/dashboard.html', complaints=my_mentee_complaints,
+                           caseload=caseload(current_user.id),
+                           mentee=mentee,
+                           now=datetime.utcnow(),
+                           notifications=unread_for(current_user.id))
\ No newline at end of file
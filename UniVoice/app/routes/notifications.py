@@ -0,0 +1,12 @@
+from flask import redirect, url_for, request
+from flask_login import login_required, current_user
+from app import db
+from app.notifications import mark_all_read
+from . import main
+
+@main.route('/notifications/read', methods=['POST'])
+@login_required
+def notifications_read():
+    mark_all_read(current_user.id)
+    db.session.commit()
+    return redirect(request.referrer or url_for('main.login'))
\ No newline at end of file
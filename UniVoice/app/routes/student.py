@@ -1,11 +1,17 @@
-from flask import render_template, redirect, url_for, flash, request
+from flask import render_template, redirect, url_for, flash, request, current_app
 from flask_login import login_required, current_user
-from app import db
+from app import db, tasks, limiter
 from app.models import UserRole, Complaint, Category, ComplaintStatus
 from . import main
-from .utils import contains_bad_words
+from .utils import find_bad_words
+from app.listing import paginate_complaints
+from app.notifications import unread_for
+from app.analytics import record_created
+from app.live import publish_complaint, COMPLAINT_CREATED
+from app import duplicates
 
 @main.route('/student/dashboard', methods=['GET', 'POST'])
+@limiter.limit('complaint', 'user')  # only POSTs (new complaints) are counted
 @login_required
 def student_dashboard():
     if current_user.role != UserRole.STUDENT:
@@ -16,7 +22,9 @@ def student_dashboard():
         description = request.form.get('description')
         category = request.form.get('category')
         
-        is_abusive = contains_bad_words(heading) or contains_bad_words(description)
+        # One pass over both fields; the newline keeps them as separate words
+        flagged_terms = find_bad_words(f"{heading or ''}\n{description or ''}")
+        is_abusive = bool(flagged_terms)
         initial_status = ComplaintStatus.FLAGGED if is_abusive else ComplaintStatus.PENDING
         
         new_complaint = Complaint(
@@ -30,14 +38,31 @@ def student_dashboard():
         )
         
         db.session.add(new_complaint)
+        db.session.flush()
+        record_created(new_complaint)
+        parent = None
+        if not is_abusive and current_app.config['DUPLICATE_DETECTION']:
+            parent = duplicates.register(new_complaint)
+        # Follow-ups run in the background once the complaint is committed
+        tasks.enqueue('audit', action='complaint.created', complaint_id=new_complaint.id, actor_id=current_user.id)
+        if is_abusive:
+            tasks.enqueue('complaint-flagged', complaint_id=new_complaint.id, terms=flagged_terms)
         db.session.commit()
+        publish_complaint(COMPLAINT_CREATED, new_complaint, mentor_id=current_user.mentor_id)
         
         if is_abusive:
             flash('Your complaint was flagged for inappropriate language and sent for review.', 'warning')
+        elif parent is not None:
+            flash(f'Complaint filed! {parent.duplicate_count} other student(s) reported the same issue, '
+                  'so the warden will handle them together.', 'success')
         else:
             flash('Complaint filed successfully!', 'success')
             
         return redirect(url_for('main.student_dashboard'))
 
-    my_complaints = Complaint.query.filter_by(user_id=current_user.id).order_by(Complaint.created_at.desc()).all()
-    return render_template('student/dashboard.html', complaints=my_complaints, Category=Category)
\ No newline at end of file
+    my_complaints = paginate_complaints(
+        Complaint.query.filter_by(user_id=current_user.id),
+        cursor=request.args.get('cursor')
+    )
+    return render_template('student/dashboard.html', complaints=my_complaints, Category=Category,
+                           notifications=unread_for(current_user.id))
\ No newline at end of file
@@ -1,23 +1,56 @@
 import os
+from collections import Counter
+from flask import request, jsonify, flash, redirect
+from app.moderation import WordListModerator
 
-def load_bad_words():
-    try:
-        # Go up two levels to find the root folder
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        file_path = os.path.join(base_dir, 'bad_words.txt')
-        
-        with open(file_path, 'r') as f:
-            return [line.strip().lower() for line in f if line.strip()]
-    except FileNotFoundError:
-        print("Warning: bad_words.txt not found.")
-        return []
+# Go up two levels to find the root folder
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BAD_WORDS_PATH = os.path.join(BASE_DIR, 'bad_words.txt')
 
-BAD_WORDS = load_bad_words()
+# Compiled once per worker; picks up edits to bad_words.txt on its own
+moderator = WordListModerator(BAD_WORDS_PATH)
 
 def contains_bad_words(text):
-    if not text: return False
-    text_lower = text.lower()
-    for word in BAD_WORDS:
-        if word in text_lower:
-            return True
-    return False
\ No newline at end of file
+    return moderator.contains(text)
+
+def find_bad_words(text):
+    """
+    Returns the listed terms that appear in `text` (whole words only).
+    """
+    return moderator.find(text)
+
+# --- BULK ACTIONS ---
+
+def bulk_args():
+    """
+    (fields, as_json) for a bulk action posted as JSON ({"ids": [...], ...})
+    or as a form (ticked `complaint_ids` checkboxes). JSON `ids` is passed on
+    as sent, so parse_ids() can reject anything that isn't a list.
+    """
+    payload = request.get_json(silent=True)
+    if isinstance(payload, dict):
+        return dict(payload, ids=payload.get('ids', [])), True
+    return dict(request.form.items(), ids=request.form.getlist('complaint_ids')), False
+
+
+def is_set(value):
+    return str(value).lower() in ('1', 'true', 'on')
+
+
+def bulk_error(message, as_json, back):
+    if as_json:
+        return jsonify({'error': message}), 400
+    flash(message, 'danger')
+    return redirect(back)
+
+
+def bulk_response(results, as_json, back):
+    """
+    Per-id outcomes as JSON, or a one-line summary flashed on the page.
+    """
+    counts = Counter(results.values())
+    if as_json:
+        return jsonify({'results': {str(i): outcome for i, outcome in results.items()}, 'counts': counts})
+    summary = ', '.join(f'{n} {outcome.replace("_", " ")}' for outcome, n in counts.items())
+    flash(f'Bulk action done: {summary or "nothing matched"}.', 'success' if counts else 'info')
+    return redirect(back)
\ No newline at end of file
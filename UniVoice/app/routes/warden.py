@@ -1,7 +1,14 @@
 from flask import render_template, redirect, url_for, flash, request
 from flask_login import login_required, current_user
-from app import db
+from app import db, tasks
 from app.models import UserRole, Complaint, ComplaintStatus
+from app.listing import paginate_complaints
+from app.stats import BUCKETS, complaint_stats
+from app.live import publish_complaint, STATUS_CHANGED, COMMENT_UPDATED
+from app.analytics import record_transition
+from app.duplicates import follow_parent, report_comments
+from app.bulk import parse_ids, update_complaints
+from .utils import bulk_args, bulk_error, bulk_response, is_set
 from datetime import datetime
 from . import main
 
@@ -20,6 +27,8 @@ def warden_dashboard():
         complaint = Complaint.query.get(complaint_id)
         
         if complaint and complaint.hostel_id == current_user.hostel_id:
+            old_status = complaint.status
+            old_comment = complaint.warden_comment
 
             try:
                 complaint.status = ComplaintStatus(new_status)
@@ -27,37 +36,89 @@ def warden_dashboard():
                 flash('Invalid status update.', 'danger')
                 return redirect(url_for('main.warden_dashboard'))
             
+            now = datetime.utcnow()
             complaint.warden_comment = comment
             if complaint.status == ComplaintStatus.RESOLVED:
-                complaint.resolved_at = datetime.utcnow()
+                complaint.resolved_at = now
+
+            if complaint.status != old_status:
+                record_transition(complaint, complaint.status, now)
+                tasks.enqueue('notify-status-change', complaint_id=complaint.id, status=complaint.status.value)
+            if (comment or None) != (old_comment or None):
+                tasks.enqueue('notify-comment', complaint_id=complaint.id, by='warden')
+            tasks.enqueue('audit', action='complaint.warden_update', complaint_id=complaint.id, actor_id=current_user.id,
+                          detail={'from': old_status.value if old_status else None, 'to': complaint.status.value})
+
+            # Reports clustered under this one get the same update
+            followers = follow_parent(complaint, now) if complaint.duplicate_count else []
+            for child, child_old_status in followers:
+                if child.status != child_old_status:
+                    record_transition(child, child.status, now)
+                    tasks.enqueue('notify-status-change', complaint_id=child.id, status=child.status.value)
+                elif (comment or None) != (old_comment or None):
+                    tasks.enqueue('notify-comment', complaint_id=child.id, by='warden')
                 
             db.session.commit()
+            publish_complaint(STATUS_CHANGED if complaint.status != old_status else COMMENT_UPDATED, complaint)
+            for child, child_old_status in followers:
+                publish_complaint(STATUS_CHANGED if child.status != child_old_status else COMMENT_UPDATED, child)
             flash('Complaint updated!', 'success')
         else:
             flash('Permission Denied', 'danger')
-        return redirect(url_for('main.warden_dashboard'))
+        return redirect(url_for('main.warden_dashboard', section=request.form.get('section')))
 
-    all_complaints = Complaint.query.filter_by(
-        hostel_id=current_user.hostel_id
-    ).order_by(Complaint.created_at.desc()).all()
-    
-    pending = []
-    mentor_forwarded = []
-    in_progress = []
-    archived = []
-    completed = []
-
-    for c in all_complaints:
-        if c.status == ComplaintStatus.FLAGGED: archived.append(c)
-        elif c.status in [ComplaintStatus.RESOLVED, ComplaintStatus.REJECTED]: completed.append(c)
-        elif c.is_urgent: mentor_forwarded.append(c)
-        elif c.status == ComplaintStatus.IN_PROGRESS: in_progress.append(c)
-        elif c.status == ComplaintStatus.PENDING: pending.append(c)
+    # Counts for every section come from one GROUP BY;
+    # rows are only fetched for the section being viewed.
+    # Duplicates are folded into their parent issue (see app/duplicates.py)
+    stats = complaint_stats(hostel_id=current_user.hostel_id, parent_id=None)
+
+    section = request.args.get('section')
+    if section not in BUCKETS:
+        section = 'urgent' if stats.by_bucket['urgent'] else 'pending'
+
+    query = Complaint.query.filter_by(hostel_id=current_user.hostel_id, parent_id=None).filter(BUCKETS[section])
+    complaints = paginate_complaints(query, cursor=request.args.get('cursor'))
 
     return render_template('warden/dashboard.html', 
-                           pending=pending,
-                           mentor_forwarded=mentor_forwarded,
-                           in_progress=in_progress,
-                           archived=archived,
-                           completed=completed,
-                           ComplaintStatus=ComplaintStatus)
\ No newline at end of file
+                           complaints=complaints,
+                           section=section,
+                           counts=stats.by_bucket,
+                           report_comments=report_comments([c.id for c in complaints if c.duplicate_count]),
+                           ComplaintStatus=ComplaintStatus)
+
+@main.route('/warden/bulk_update', methods=['POST'])
+@login_required
+def warden_bulk_update():
+    """
+    One status and/or comment for the ticked complaints, or with `all` for
+    every complaint in `section`. A blank comment leaves comments as they are.
+    """
+    if current_user.role != UserRole.WARDEN:
+        flash('Access Denied: You do not have permission to view this page.', 'danger')
+        return redirect(url_for('main.logout'))
+
+    args, as_json = bulk_args()
+    section = args.get('section')
+    back = url_for('main.warden_dashboard', section=section)
+    try:
+        ids = parse_ids(args['ids'])
+        status = ComplaintStatus(args['status']) if args.get('status') else None
+    except (TypeError, ValueError):
+        return bulk_error('Invalid complaint ids or status.', as_json, back)
+    comment = args.get('warden_comment') or None
+    if status is None and comment is None:
+        return bulk_error('Choose a status or write a comment.', as_json, back)
+
+    where = None
+    if is_set(args.get('all')):
+        if section not in BUCKETS:
+            return bulk_error('Unknown section.', as_json, back)
+        ids, where = None, BUCKETS[section] & Complaint.parent_id.is_(None)
+    elif not ids:
+        return bulk_error('No complaints selected.', as_json, back)
+
+    # The hostel check is part of every statement, not a per-row test
+    results = update_complaints([Complaint.hostel_id == current_user.hostel_id], ids=ids, where=where,
+                                status=status, comment=comment, actor_id=current_user.id,
+                                action='complaint.warden_update')
+    return bulk_response(results, as_json, back)
\ No newline at end of file
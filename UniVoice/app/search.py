@@ -0,0 +1,231 @@
+import re
+from collections import Counter
+from markupsafe import Markup, escape
+from sqlalchemy.orm import selectinload
+from app import db
+from app.models import Complaint, ArchivedComplaint, Category, ComplaintStatus
+
+# Full-text search over complaint heading + description.
+#
+# SQLite: an external-content FTS5 table (complaints_fts) kept in sync by
+#         triggers, ranked with bm25().
+# PostgreSQL: a generated tsvector column (complaints.search_vector) with a
+#         GIN index, ranked with ts_rank_cd().
+#
+# Both are created by migration 0006; install_search_index() does the same
+# for databases made with db.create_all() (e.g. testseed.py).
+#
+# archived_complaints (see app/archive.py) has its own index of the same kind
+# (migration 0008); searches cover both tables and merge the results.
+
+SEARCH_PER_PAGE = 20
+MAX_PAGE = 50
+
+# Headings weigh more than descriptions when ranking
+HEADING_WEIGHT = 4.0
+
+# Sentinels wrapped around matches in snippets; swapped for <mark> after escaping
+_HL_START, _HL_END = '\x02', '\x03'
+
+SQLITE_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS complaints_fts USING fts5(
+        heading, description, content='complaints', content_rowid='id', tokenize='porter unicode61')""",
+    """CREATE TRIGGER IF NOT EXISTS complaints_fts_ai AFTER INSERT ON complaints BEGIN
+        INSERT INTO complaints_fts(rowid, heading, description) VALUES (new.id, new.heading, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS complaints_fts_ad AFTER DELETE ON complaints BEGIN
+        INSERT INTO complaints_fts(complaints_fts, rowid, heading, description)
+        VALUES ('delete', old.id, old.heading, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS complaints_fts_au AFTER UPDATE OF heading, description ON complaints BEGIN
+        INSERT INTO complaints_fts(complaints_fts, rowid, heading, description)
+        VALUES ('delete', old.id, old.heading, old.description);
+        INSERT INTO complaints_fts(rowid, heading, description) VALUES (new.id, new.heading, new.description);
+    END""",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS archived_complaints_fts USING fts5(
+        heading, description, content='archived_complaints', content_rowid='id', tokenize='porter unicode61')""",
+    """CREATE TRIGGER IF NOT EXISTS archived_complaints_fts_ai AFTER INSERT ON archived_complaints BEGIN
+        INSERT INTO archived_complaints_fts(rowid, heading, description) VALUES (new.id, new.heading, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS archived_complaints_fts_ad AFTER DELETE ON archived_complaints BEGIN
+        INSERT INTO archived_complaints_fts(archived_complaints_fts, rowid, heading, description)
+        VALUES ('delete', old.id, old.heading, old.description);
+    END""",
+]
+SQLITE_REBUILD = [
+    "INSERT INTO complaints_fts(complaints_fts) VALUES ('rebuild')",
+    "INSERT INTO archived_complaints_fts(archived_complaints_fts) VALUES ('rebuild')",
+]
+
+POSTGRES_DDL = [
+    """ALTER TABLE complaints ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(heading, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_complaints_search ON complaints USING gin (search_vector)",
+    """ALTER TABLE archived_complaints ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(heading, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_archived_complaints_search ON archived_complaints USING gin (search_vector)",
+]
+
+
+def _dialect():
+    return db.session.get_bind().dialect.name
+
+
+def install_search_index():
+    """
+    Creates the search index if missing and (re)fills it. Safe to re-run.
+    """
+    if _dialect() == 'postgresql':
+        for stmt in POSTGRES_DDL:
+            db.session.execute(db.text(stmt))
+    else:
+        for stmt in SQLITE_DDL + SQLITE_REBUILD:
+            db.session.execute(db.text(stmt))
+    db.session.commit()
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """
+    Keeps Alembic autogenerate from dropping the search objects,
+    which are managed here rather than by the models.
+    """
+    if type_ == 'table' and name.startswith(('complaints_fts', 'archived_complaints_fts')):
+        return False
+    if type_ == 'column' and name == 'search_vector':
+        return False
+    if type_ == 'index' and name in ('ix_complaints_search', 'ix_archived_complaints_search'):
+        return False
+    return True
+
+
+# --- QUERY PARSING ---
+
+def fts5_query(text):
+    """
+    User input -> FTS5 MATCH expression: every word must match, `word*` is a
+    prefix search. Words are quoted, so FTS5 operators in the input are inert.
+    """
+    terms = []
+    for word, star in re.findall(r'(\w+)(\*?)', text or ''):
+        terms.append(f'"{word}"{star}')
+    return ' '.join(terms)
+
+
+def highlight(snippet):
+    """
+    Escapes a snippet and turns the match sentinels into <mark> tags.
+    """
+    if not snippet:
+        return Markup('')
+    html = str(escape(snippet))
+    return Markup(html.replace(_HL_START, '<mark>').replace(_HL_END, '</mark>'))
+
+
+class SearchHit:
+    def __init__(self, complaint, rank, snippet):
+        self.complaint = complaint
+        self.rank = rank
+        self.snippet = highlight(snippet)
+
+
+class SearchResults:
+    def __init__(self, query, hits, total, facets, page, per_page):
+        self.query = query
+        self.hits = hits
+        self.total = total
+        self.facets = facets  # {'category': {value: n}, 'status': {...}, 'hostel_id': {...}}
+        self.page = page
+        self.per_page = per_page
+
+    @property
+    def has_more(self):
+        return self.page * self.per_page < self.total
+
+    def __iter__(self):
+        return iter(self.hits)
+
+    def __len__(self):
+        return len(self.hits)
+
+
+# --- SEARCH ---
+
+def _match(text, model):
+    """
+    (FROM list, filter clause, rank, snippet) over `model`'s table for the
+    current database. Lower rank sorts first on both (bm25 is negative-better,
+    ts_rank is negated).
+    """
+    table = model.__tablename__
+    if _dialect() == 'postgresql':
+        tsquery = db.func.websearch_to_tsquery('english', text)
+        vector = db.literal_column(f'{table}.search_vector')
+        rank = -db.func.ts_rank_cd(vector, tsquery)
+        snippet = db.func.ts_headline(
+            'english', model.heading + ' — ' + model.description, tsquery,
+            f'StartSel={_HL_START}, StopSel={_HL_END}, MaxWords=25, MinWords=10, MaxFragments=1'
+        )
+        return [model], vector.op('@@')(tsquery), rank, snippet
+
+    fts = db.table(f'{table}_fts', db.column('rowid'))
+    fts_ref = db.literal_column(f'{table}_fts')
+    match = db.and_(fts_ref.op('MATCH')(fts5_query(text)), fts.c.rowid == model.id)
+    rank = db.func.bm25(fts_ref, HEADING_WEIGHT, 1.0)
+    snippet = db.func.snippet(fts_ref, -1, _HL_START, _HL_END, '…', 16)
+    return [model, fts], match, rank, snippet
+
+
+def search_complaints(text, category=None, status=None, hostel_id=None, page=1, per_page=SEARCH_PER_PAGE,
+                      include_archived=True):
+    """
+    Ranked matches for `text` with optional filters, one page at a time.
+    Facet counts for each filter are computed with the other filters applied,
+    so the UI can show how many results selecting a value would give.
+    Archived complaints are searched too unless `include_archived` is off.
+    """
+    page = min(max(int(page or 1), 1), MAX_PAGE)
+    if not text or not text.strip() or (_dialect() != 'postgresql' and not fts5_query(text)):
+        return SearchResults(text, [], 0, {'category': {}, 'status': {}, 'hostel_id': {}}, page, per_page)
+
+    rows = []
+    facets = {'category': Counter(), 'status': Counter(), 'hostel_id': Counter()}
+    for model in (Complaint, ArchivedComplaint) if include_archived else (Complaint,):
+        sources, match, rank, snippet = _match(text, model)
+
+        filters = {
+            'category': model.category == Category(category) if category else None,
+            'status': model.status == ComplaintStatus(status) if status else None,
+            'hostel_id': model.hostel_id == int(hostel_id) if hostel_id else None,
+        }
+
+        def base(*columns, skip=None):
+            query = db.session.query(*columns).select_from(*sources).filter(match)
+            for key, clause in filters.items():
+                if clause is not None and key != skip:
+                    query = query.filter(clause)
+            return query
+
+        # Enough of each table's best matches to fill this page after merging
+        rows += base(model, rank.label('rank'), snippet.label('snippet')) \
+            .options(selectinload(model.author)) \
+            .order_by(rank, model.id.desc()) \
+            .limit(page * per_page).all()
+
+        for key, column in (('category', model.category), ('status', model.status), ('hostel_id', model.hostel_id)):
+            counts = base(column, db.func.count(model.id), skip=key).group_by(column).all()
+            for value, n in counts:
+                facets[key][getattr(value, 'value', value)] += n
+
+    rows.sort(key=lambda row: (row[1], -row[0].id))
+    hits = [SearchHit(c, r, s) for c, r, s in rows[(page - 1) * per_page:page * per_page]]
+
+    facets = {key: dict(counts) for key, counts in facets.items()}
+    total = sum(facets['status'].values()) if status is None else \
+        facets['status'].get(status, 0)
+    return SearchResults(text, hits, total, facets, page, per_page)
\ No newline at end of file
@@ -0,0 +1,86 @@
+from app import db
+from app.models import Complaint, ComplaintStatus, User
+
+# --- WARDEN BUCKETS ---
+# How the warden dashboard groups a hostel's complaints, as SQL filters.
+# "urgent" is any open complaint a mentor has forwarded (is_urgent),
+# so pending/progress only hold the ones that were not forwarded.
+_not_urgent = db.or_(Complaint.is_urgent.is_(False), Complaint.is_urgent.is_(None))
+_open = Complaint.status.in_([ComplaintStatus.PENDING, ComplaintStatus.IN_PROGRESS])
+
+BUCKETS = {
+    'urgent': _open & Complaint.is_urgent.is_(True),
+    'pending': (Complaint.status == ComplaintStatus.PENDING) & _not_urgent,
+    'progress': (Complaint.status == ComplaintStatus.IN_PROGRESS) & _not_urgent,
+    'completed': Complaint.status.in_([ComplaintStatus.RESOLVED, ComplaintStatus.REJECTED]),
+    'archived': Complaint.status == ComplaintStatus.FLAGGED,
+}
+
+bucket_expr = db.case(*[(condition, name) for name, condition in BUCKETS.items()])
+
+
+class ComplaintStats:
+    """
+    Per-status and per-bucket complaint counts.
+    Every status and bucket is present, with 0 when there are no rows.
+    """
+    def __init__(self, by_status, by_bucket):
+        self.by_status = by_status
+        self.by_bucket = by_bucket
+
+    @property
+    def total(self):
+        return sum(self.by_status.values())
+
+
+def complaint_stats(**filters):
+    """
+    Counts complaints matching `filters` (e.g. hostel_id=3) in one GROUP BY query.
+    """
+    rows = db.session.query(Complaint.status, bucket_expr, db.func.count(Complaint.id)) \
+        .select_from(Complaint) \
+        .filter_by(**filters) \
+        .group_by(Complaint.status, bucket_expr) \
+        .all()
+
+    by_status = {s.value: 0 for s in ComplaintStatus}
+    by_bucket = {name: 0 for name in BUCKETS}
+    for status, bucket, count in rows:
+        if status is not None:
+            by_status[status.value] += count
+        if bucket is not None:
+            by_bucket[bucket] += count
+
+    return ComplaintStats(by_status, by_bucket)
+
+
+
+# --- MENTOR CASELOAD ---
+
+def mentee_ids(mentor_id):
+    """
+    A mentor's mentees as a subquery, for Complaint.user_id.in_(...):
+    the database resolves it, so no id list is loaded or sent back.
+    """
+    return db.select(User.id).where(User.mentor_id == mentor_id)
+
+
+def caseload(mentor_id):
+    """
+    One row per mentee (id, name, room_number, total, open, urgent,
+    oldest_pending), in one GROUP BY. Mentees with urgent, then open
+    complaints come first; mentees with none are included.
+    """
+    open_count = db.func.sum(db.case((_open, 1), else_=0)).label('open')
+    urgent_count = db.func.sum(db.case((_open & Complaint.is_urgent.is_(True), 1), else_=0)).label('urgent')
+    oldest_pending = db.func.min(
+        db.case((Complaint.status == ComplaintStatus.PENDING, Complaint.created_at))).label('oldest_pending')
+
+    return db.session.query(
+        User.id, User.name, User.room_number,
+        db.func.count(Complaint.id).label('total'), open_count, urgent_count, oldest_pending,
+    ).outerjoin(Complaint, Complaint.user_id == User.id) \
+        .filter(User.mentor_id == mentor_id) \
+        .group_by(User.id, User.name, User.room_number) \
+        .order_by(urgent_count.desc(), open_count.desc(), oldest_pending, User.name) \
+        .all()
\ No newline at end of file
@@ -0,0 +1,244 @@
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+import traceback
+from sqlalchemy import event
+
+log = logging.getLogger(__name__)
+
+# Background jobs that run after the request's transaction commits.
+#
+#   @tasks.task('notify-status-change')
+#   def notify_status_change(complaint_id, status): ...
+#
+#   tasks.enqueue('notify-status-change', complaint_id=c.id, status='resolved')
+#   db.session.commit()   # the job is queued here, or dropped on rollback
+#
+# Jobs are stored in a small SQLite file next to the app (no broker needed),
+# claimed by a pool of worker threads and retried with exponential backoff.
+# Arguments must be JSON-serialisable.
+
+PENDING = 'pending'
+RUNNING = 'running'
+FAILED = 'failed'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    run_at REAL NOT NULL,
+    locked_until REAL,
+    last_error TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_jobs_status_run_at ON jobs (status, run_at);
+"""
+
+
+class SQLiteQueue:
+    """
+    Durable job queue in its own SQLite file, shared by every worker process.
+    Finished jobs are deleted; jobs that ran out of attempts stay as 'failed'.
+    """
+    def __init__(self, path, lease=300):
+        self.path = path
+        self.lease = lease  # seconds before a crashed worker's job is picked up again
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    def push_many(self, jobs, delay=0):
+        now = time.time()
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        conn.executemany(
+            'INSERT INTO jobs (name, payload, run_at, created_at) VALUES (?, ?, ?, ?)',
+            [(name, json.dumps(kwargs), now + delay, now) for name, kwargs in jobs]
+        )
+        conn.execute('COMMIT')
+
+    def claim(self):
+        """
+        Atomically takes the next due job: (id, name, kwargs, attempts) or None.
+        """
+        now = time.time()
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute(
+                'SELECT id, name, payload, attempts FROM jobs '
+                'WHERE (status = ? AND run_at <= ?) OR (status = ? AND locked_until < ?) '
+                'ORDER BY run_at LIMIT 1',
+                (PENDING, now, RUNNING, now)
+            ).fetchone()
+            if row:
+                conn.execute(
+                    'UPDATE jobs SET status = ?, attempts = attempts + 1, locked_until = ? WHERE id = ?',
+                    (RUNNING, now + self.lease, row[0])
+                )
+        finally:
+            conn.execute('COMMIT')
+        if row is None:
+            return None
+        return row[0], row[1], json.loads(row[2]), row[3] + 1
+
+    def done(self, job_id):
+        self._connect().execute('DELETE FROM jobs WHERE id = ?', (job_id,))
+
+    def retry(self, job_id, delay, error):
+        self._connect().execute(
+            'UPDATE jobs SET status = ?, run_at = ?, locked_until = NULL, last_error = ? WHERE id = ?',
+            (PENDING, time.time() + delay, error, job_id)
+        )
+
+    def fail(self, job_id, error):
+        self._connect().execute(
+            'UPDATE jobs SET status = ?, locked_until = NULL, last_error = ? WHERE id = ?',
+            (FAILED, error, job_id)
+        )
+
+    def counts(self):
+        rows = self._connect().execute('SELECT status, COUNT(*) FROM jobs GROUP BY status')
+        return {status: count for status, count in rows}
+
+
+class TaskRunner:
+    """
+    Flask extension: task registry, after-commit hook and worker pool.
+    """
+    def __init__(self):
+        self.registry = {}
+        self.queue = None
+        self.app = None
+        self.db = None
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._threads = []
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app, db):
+        os.makedirs(os.path.dirname(app.config['TASK_QUEUE_PATH']) or '.', exist_ok=True)
+        self.app = app
+        self.db = db
+        self.queue = SQLiteQueue(app.config['TASK_QUEUE_PATH'])
+        app.extensions['tasks'] = self
+
+        event.listen(db.session, 'after_commit', self._after_commit)
+        event.listen(db.session, 'after_soft_rollback', self._after_rollback)
+
+    def task(self, name):
+        def decorator(fn):
+            self.registry[name] = fn
+            return fn
+        return decorator
+
+    # --- ENQUEUEING ---
+
+    def enqueue(self, name, **kwargs):
+        """
+        Queues `name` to run once the current transaction commits.
+        """
+        if name not in self.registry:
+            raise KeyError(f'Unknown task {name!r}')
+        session = self.db.session()
+        if not session.in_transaction():
+            # so a rollback before the next commit discards the job too
+            session.begin()
+        session.info.setdefault('pending_tasks', []).append((name, kwargs))
+
+    def _after_commit(self, session):
+        jobs = session.info.pop('pending_tasks', None)
+        if jobs:
+            self.queue.push_many(jobs)
+            self._ensure_workers()
+            self._wakeup.set()
+
+    def _after_rollback(self, session, previous_transaction):
+        if previous_transaction.parent is None:
+            session.info.pop('pending_tasks', None)
+
+    # --- WORKERS ---
+
+    def _ensure_workers(self):
+        # Started lazily so each forked server process gets its own threads
+        if self._pid == os.getpid() or not self.app.config['TASK_WORKERS']:
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self.start(self.app.config['TASK_WORKERS'])
+
+    def start(self, workers):
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._work, daemon=True, name=f'task-worker-{i}')
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join()
+
+    def _work(self):
+        while not self._stop.is_set():
+            if not self.run_next():
+                self._wakeup.wait(timeout=1.0)
+                self._wakeup.clear()
+
+    def run_next(self):
+        """
+        Runs one due job. Returns False when the queue had nothing to do.
+        """
+        job = self.queue.claim()
+        if job is None:
+            return False
+        job_id, name, kwargs, attempts = job
+
+        db = self.db
+        with self.app.app_context():
+            try:
+                self.registry[name](**kwargs)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                error = traceback.format_exc(limit=5)
+                if attempts >= self.app.config['TASK_MAX_ATTEMPTS']:
+                    log.error('Task %s (#%s) failed after %s attempts:\n%s', name, job_id, attempts, error)
+                    self.queue.fail(job_id, error)
+                else:
+                    delay = self.app.config['TASK_RETRY_DELAY'] * 2 ** (attempts - 1)
+                    self.queue.retry(job_id, delay * random.uniform(0.8, 1.2), error)
+                return True
+            finally:
+                db.session.remove()
+        self.queue.done(job_id)
+        return True
+
+    def drain(self):
+        """
+        Runs due jobs in the calling thread until none are left; returns how many ran.
+        """
+        ran = 0
+        while self.run_next():
+            ran += 1
+        return ran
\ No newline at end of file
@@ -0,0 +1,195 @@
+"""
+Latency and query-count benchmark for the role dashboards.
+
+Usage:
+    python -m benchmarks.dashboards --generate --students 2000 --complaints 50000
+    python -m benchmarks.dashboards --db sqlite:///bench.db --output results.json
+    python -m benchmarks.dashboards --output new.json --compare old.json
+
+Each scenario is requested through the Flask test client, logged in as a
+generated account (see benchmarks/datagen.py). Results are written as JSON
+so runs from different commits can be compared with --compare.
+"""
+import argparse
+import json
+import math
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from sqlalchemy import event
+from app import db
+from app.models import Hostel, User, Complaint
+from benchmarks import datagen
+
+# (name, account role, method, url); {hostel_id} is the first generated hostel
+SCENARIOS = [
+    ('login', 'student', 'post', '/'),
+    ('student_dashboard', 'student', 'get', '/student/dashboard'),
+    ('warden_dashboard', 'warden', 'get', '/warden/dashboard'),
+    ('mentor_dashboard', 'mentor', 'get', '/mentor/dashboard'),
+    ('admin_view_complaints', 'admin', 'get', '/admin/complaints?hostel_id={hostel_id}'),
+    ('admin_students', 'admin', 'get', '/admin/students?hostel_id={hostel_id}'),
+]
+
+
+class QueryCounter:
+    """
+    Counts statements sent to the database while attached to an engine.
+    """
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, 'before_cursor_execute', self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+
+def percentile(sorted_values, pct):
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_values:
+        return None
+    rank = min(len(sorted_values), max(1, math.ceil(pct / 100 * len(sorted_values)))) - 1
+    return sorted_values[rank]
+
+
+def summarize(timings, queries):
+    timings = sorted(timings)
+    queries = sorted(queries)
+    return {
+        'n': len(timings),
+        'p50_ms': round(percentile(timings, 50) * 1000, 2),
+        'p95_ms': round(percentile(timings, 95) * 1000, 2),
+        'p99_ms': round(percentile(timings, 99) * 1000, 2),
+        'mean_ms': round(sum(timings) / len(timings) * 1000, 2),
+        'queries': percentile(queries, 50),
+        'queries_max': queries[-1],
+    }
+
+
+def login(client, role):
+    response = client.post('/', data={'email': datagen.email(role, 1), 'password': datagen.PASSWORD})
+    if response.status_code != 302:
+        raise RuntimeError(f'Could not log in as {datagen.email(role, 1)}; generate data first (--generate)')
+
+
+def run_scenario(app, counter, role, method, url, iterations, warmup):
+    if method == 'post':
+        # The login scenario itself: a fresh (logged-out) client per iteration
+        data = {'email': datagen.email(role, 1), 'password': datagen.PASSWORD}
+        request = lambda: app.test_client().post(url, data=data)
+    else:
+        client = app.test_client()
+        login(client, role)
+        request = lambda: client.get(url)
+
+    timings, queries = [], []
+    for i in range(warmup + iterations):
+        counter.count = 0
+        start = time.perf_counter()
+        response = request()
+        elapsed = time.perf_counter() - start
+        if response.status_code >= 400:
+            raise RuntimeError(f'{method.upper()} {url} returned {response.status_code}')
+        if i >= warmup:
+            timings.append(elapsed)
+            queries.append(counter.count)
+    return summarize(timings, queries)
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def dataset_size():
+    return {
+        'hostels': db.session.query(db.func.count(Hostel.id)).scalar(),
+        'users': db.session.query(db.func.count(User.id)).scalar(),
+        'complaints': db.session.query(db.func.count(Complaint.id)).scalar(),
+    }
+
+
+def run(app, iterations=30, warmup=3, only=None, log=print):
+    with app.app_context():
+        counter = QueryCounter(db.engine)
+        hostel_id = db.session.query(db.func.min(Hostel.id)).scalar()
+        meta = {
+            'commit': git_commit(),
+            'timestamp': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+            'python': platform.python_version(),
+            'database': db.engine.dialect.name,
+            'iterations': iterations,
+            'dataset': dataset_size(),
+        }
+        db.session.remove()
+
+    results = {}
+    for name, role, method, url in SCENARIOS:
+        if only and name not in only:
+            continue
+        results[name] = run_scenario(app, counter, role, method, url.format(hostel_id=hostel_id), iterations, warmup)
+        r = results[name]
+        log(f"  {name:<24} p50 {r['p50_ms']:8.1f} ms  p95 {r['p95_ms']:8.1f} ms  "
+            f"p99 {r['p99_ms']:8.1f} ms  queries {r['queries']}")
+    return {'meta': meta, 'results': results}
+
+
+def compare(current, baseline, threshold, log=print):
+    """
+    Prints p95 and query-count changes against `baseline`; returns the
+    names of scenarios that got slower by more than `threshold` or run more queries.
+    """
+    regressions = []
+    log(f"Compared with {baseline['meta'].get('commit') or 'baseline'}:")
+    for name, now in current['results'].items():
+        before = baseline['results'].get(name)
+        if not before:
+            continue
+        ratio = now['p95_ms'] / before['p95_ms'] if before['p95_ms'] else 1.0
+        slower = ratio > 1 + threshold
+        more_queries = now['queries'] > before['queries']
+        flag = '  <-- regression' if slower or more_queries else ''
+        log(f"  {name:<24} p95 {before['p95_ms']:8.1f} -> {now['p95_ms']:8.1f} ms ({ratio - 1:+.0%})  "
+            f"queries {before['queries']} -> {now['queries']}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--db', default='sqlite:///bench.db', help='Database URL to benchmark against.')
+    parser.add_argument('--generate', action='store_true', help='(Re)create the synthetic dataset first.')
+    parser.add_argument('--iterations', type=int, default=30)
+    parser.add_argument('--warmup', type=int, default=3)
+    parser.add_argument('--only', nargs='+', choices=[s[0] for s in SCENARIOS])
+    parser.add_argument('--output', help='Write results as JSON to this file.')
+    parser.add_argument('--compare', help='Baseline JSON from an earlier run.')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Allowed p95 slowdown before failing (0.2 = 20%%).')
+    datagen.add_arguments(parser)
+    args = parser.parse_args()
+
+    app = datagen.create_bench_app(args.db)
+    if args.generate:
+        datagen.generate(app, **datagen.generator_kwargs(args))
+
+    print(f'Benchmarking {args.db} ({args.iterations} iterations per scenario)')
+    report = run(app, iterations=args.iterations, warmup=args.warmup, only=args.only)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'Results written to {args.output}')
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(report, baseline, args.threshold):
+            sys.exit(1)
\ No newline at end of file
@@ -0,0 +1,228 @@
+"""
+Fills a database with synthetic hostels, users and complaints for benchmarks.
+
+Usage:
+    python -m benchmarks.datagen --db sqlite:///bench.db
+    python -m benchmarks.datagen --db postgresql://... --hostels 50 --students 100000 --complaints 5000000
+
+Everything is written with multi-row INSERTs in batches. One password hash
+is shared by all accounts (password: "bench"), so generation is not bound
+by scrypt. Existing tables in the target database are dropped.
+"""
+import argparse
+import math
+import random
+import time
+from datetime import datetime, timedelta
+from app import create_app, db, analytics
+from config import Config
+from app.models import Hostel, User, Complaint, UserRole, ComplaintStatus, Category
+from app.passwords import hash_password
+from app.rooms import rebuild_occupancy
+from app.search import install_search_index
+
+PASSWORD = 'bench'
+DOMAIN = 'univoice.test'
+STUDENTS_PER_MENTOR = 25
+
+# Rough shape of a real complaint table
+STATUS_WEIGHTS = {
+    ComplaintStatus.RESOLVED: 55,
+    ComplaintStatus.REJECTED: 8,
+    ComplaintStatus.IN_PROGRESS: 12,
+    ComplaintStatus.PENDING: 22,
+    ComplaintStatus.FLAGGED: 3,
+}
+CATEGORY_WEIGHTS = {
+    Category.ELECTRIC: 20,
+    Category.TOILET: 15,
+    Category.WIFI: 25,
+    Category.MESS: 20,
+    Category.PERSONAL: 5,
+    Category.OTHERS: 15,
+}
+WORDS = ('fan light switch socket tap leak flush water wifi router signal slow mess food '
+         'cold late broken not working since morning floor corridor room door lock window '
+         'noise please fix urgent again still').split()
+
+
+def email(role, n):
+    return f'bench-{role}-{n}@{DOMAIN}'
+
+
+class Generator:
+    def __init__(self, hostels=50, students=100000, complaints=5000000, days=365,
+                 batch_size=20000, seed=42, search_index=True, log=print):
+        self.n_hostels = hostels
+        self.n_students = students
+        self.n_complaints = complaints
+        self.days = days
+        self.batch_size = batch_size
+        self.rng = random.Random(seed)
+        self.search_index = search_index
+        self.log = log
+        self.now = datetime.utcnow()
+
+    def _insert(self, model, rows):
+        for i in range(0, len(rows), self.batch_size):
+            db.session.execute(db.insert(model), rows[i:i + self.batch_size])
+        db.session.commit()
+
+    def _timed(self, label, fn):
+        start = time.perf_counter()
+        result = fn()
+        self.log(f'  {label:<22} {time.perf_counter() - start:8.1f}s')
+        return result
+
+    # --- STEPS ---
+
+    def reset_schema(self):
+        db.drop_all()
+        db.create_all()
+        if db.engine.dialect.name == 'sqlite':
+            # Bulk load speed over durability; the file is throwaway
+            db.session.execute(db.text('PRAGMA journal_mode=WAL'))
+            db.session.execute(db.text('PRAGMA synchronous=OFF'))
+
+    def hostels(self):
+        rooms_each = max(1, math.ceil(self.n_students / self.n_hostels / 2))
+        self._insert(Hostel, [
+            {'name': f'Bench Hostel {i}', 'gender': 'Boys' if i % 2 else 'Girls', 'total_rooms': rooms_each}
+            for i in range(1, self.n_hostels + 1)
+        ])
+        self.hostel_ids = [h.id for h in Hostel.query.order_by(Hostel.id)]
+        for hostel in Hostel.query:
+            hostel.generate_rooms()
+        db.session.commit()
+
+    def users(self):
+        password_hash = hash_password(PASSWORD)
+
+        staff = [{'email': email('admin', 1), 'name': 'Bench Admin', 'role': UserRole.ADMIN,
+                  'password_hash': password_hash}]
+        for i, hostel_id in enumerate(self.hostel_ids, 1):
+            staff.append({'email': email('warden', i), 'name': f'Warden {i}', 'role': UserRole.WARDEN,
+                          'password_hash': password_hash, 'hostel_id': hostel_id})
+        n_mentors = max(1, self.n_students // STUDENTS_PER_MENTOR)
+        for i in range(1, n_mentors + 1):
+            staff.append({'email': email('mentor', i), 'name': f'Mentor {i}', 'role': UserRole.MENTOR,
+                          'password_hash': password_hash})
+        self._insert(User, staff)
+        mentor_ids = [uid for (uid,) in db.session.query(User.id).filter_by(role=UserRole.MENTOR).order_by(User.id)]
+
+        students = []
+        per_hostel = math.ceil(self.n_students / len(self.hostel_ids))
+        for n in range(self.n_students):
+            hostel_id = self.hostel_ids[n // per_hostel]
+            room = 101 + (n % per_hostel) // 2
+            students.append({
+                'email': email('student', n + 1), 'name': f'Student {n + 1}', 'role': UserRole.STUDENT,
+                'password_hash': password_hash, 'hostel_id': hostel_id,
+                'mentor_id': mentor_ids[n // STUDENTS_PER_MENTOR % len(mentor_ids)],
+                'room_number': str(room),
+            })
+        self._insert(User, students)
+        self.students = db.session.query(User.id, User.hostel_id) \
+            .filter_by(role=UserRole.STUDENT).order_by(User.id).all()
+
+    def _complaint(self, user_id, hostel_id, statuses, categories):
+        rng = self.rng
+        status = statuses[rng.randrange(len(statuses))]
+        created_at = self.now - timedelta(seconds=rng.randrange(self.days * 86400))
+        updated_at = created_at
+        resolved_at = None
+        if status not in (ComplaintStatus.PENDING, ComplaintStatus.FLAGGED):
+            updated_at = min(created_at + timedelta(hours=rng.expovariate(1 / 48)), self.now)
+            if status == ComplaintStatus.RESOLVED:
+                resolved_at = updated_at
+        words = rng.choices(WORDS, k=rng.randint(8, 40))
+        return {
+            'heading': ' '.join(words[:4])[:100],
+            'description': ' '.join(words),
+            'category': categories[rng.randrange(len(categories))],
+            'status': status,
+            'is_urgent': rng.random() < 0.05,
+            'is_abusive': status == ComplaintStatus.FLAGGED,
+            'created_at': created_at,
+            'updated_at': updated_at,
+            'resolved_at': resolved_at,
+            'user_id': user_id,
+            'hostel_id': hostel_id,
+        }
+
+    def complaints(self):
+        # Weighted lookup lists: picking an index is much cheaper than rng.choices per row
+        statuses = [s for s, weight in STATUS_WEIGHTS.items() for _ in range(weight)]
+        categories = [c for c, weight in CATEGORY_WEIGHTS.items() for _ in range(weight)]
+
+        table = Complaint.__table__
+        written = 0
+        while written < self.n_complaints:
+            rows = []
+            for _ in range(min(self.batch_size, self.n_complaints - written)):
+                user_id, hostel_id = self.students[self.rng.randrange(len(self.students))]
+                rows.append(self._complaint(user_id, hostel_id, statuses, categories))
+            db.session.execute(table.insert(), rows)
+            db.session.commit()
+            written += len(rows)
+            if written % (self.batch_size * 25) == 0 or written == self.n_complaints:
+                self.log(f'    ...{written} complaints')
+
+    def derived(self):
+        rebuild_occupancy()
+        analytics.rebuild()
+        if self.search_index:
+            install_search_index()
+
+    def run(self):
+        self.log(f'Generating {self.n_hostels} hostels, {self.n_students} students, {self.n_complaints} complaints')
+        self._timed('schema', self.reset_schema)
+        self._timed('hostels + rooms', self.hostels)
+        self._timed('users', self.users)
+        self._timed('complaints', self.complaints)
+        self._timed('occupancy/analytics', self.derived)
+
+
+def generate(app, **kwargs):
+    with app.app_context():
+        Generator(**kwargs).run()
+
+
+def add_arguments(parser):
+    parser.add_argument('--hostels', type=int, default=50)
+    parser.add_argument('--students', type=int, default=100000)
+    parser.add_argument('--complaints', type=int, default=5000000)
+    parser.add_argument('--days', type=int, default=365, help='Spread complaints over this many past days.')
+    parser.add_argument('--batch-size', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-search-index', action='store_true', help='Skip building the full-text index.')
+
+
+def generator_kwargs(args):
+    return {
+        'hostels': args.hostels, 'students': args.students, 'complaints': args.complaints,
+        'days': args.days, 'batch_size': args.batch_size, 'seed': args.seed,
+        'search_index': not args.no_search_index,
+    }
+
+
+def create_bench_app(db_url):
+    """
+    The app pointed at the benchmark database, with background workers and
+    rate limits off (the login scenario posts the same account repeatedly).
+    """
+    class BenchConfig(Config):
+        SECRET_KEY = 'benchmark'
+        SQLALCHEMY_DATABASE_URI = db_url
+        TASK_WORKERS = 0
+        RATELIMIT_ENABLED = False
+
+    return create_app(BenchConfig)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--db', default='sqlite:///bench.db', help='Database URL (its tables are dropped!).')
+    add_arguments(parser)
+    args = parser.parse_args()
+    generate(create_bench_app(args.db), **generator_kwargs(args))
\ No newline at end of file
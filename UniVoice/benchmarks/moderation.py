@@ -0,0 +1,108 @@
+"""
+Compares the compiled moderation engine with the old linear bad-word scan,
+after checking it still flags (and passes) the texts in CASES.
+
+Usage:
+    python -m benchmarks.moderation
+    python -m benchmarks.moderation --terms 50000 --texts 500
+"""
+import argparse
+import random
+import string
+import sys
+import time
+from app.moderation import ModerationEngine
+
+# (text, terms the engine must find) for CASE_TERMS
+CASE_TERMS = ['stupid', 'idiot', 'trash', 'shit', 'ass', 'hell']
+CASES = [
+    ('you are stupid', ['stupid']),
+    ('STUPID!', ['stupid']),
+    ('Ṣtüpid warden', ['stupid']),
+    ('stup1d', ['stupid']),
+    ('sh!t food', ['shit']),
+    ('@ss', ['ass']),
+    ('1d10t', ['idiot']),
+    ('!stupid', ['stupid']),
+    ('!!!stupid', ['stupid']),
+    ('stupid123', ['stupid']),
+    ('idiot1', ['idiot']),
+    ('trash2', ['trash']),
+    ('trash food, idiot staff', ['trash', 'idiot']),
+    ('hello, the class in room 204 has a shell', []),
+    ('passage light not working', []),
+]
+
+
+def legacy_contains_bad_words(text, bad_words):
+    # The original implementation: one substring check per listed word
+    if not text: return False
+    text_lower = text.lower()
+    for word in bad_words:
+        if word in text_lower:
+            return True
+    return False
+
+
+def random_word(rng, min_len=4, max_len=10):
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(min_len, max_len)))
+
+
+def make_complaint(rng, vocabulary, words=60):
+    return ' '.join(rng.choice(vocabulary) for _ in range(words))
+
+
+def check_cases():
+    """
+    Prints every case the engine gets wrong. Returns how many there were.
+    """
+    engine = ModerationEngine(CASE_TERMS)
+    failures = 0
+    for text, expected in CASES:
+        found = engine.find(text)
+        if found != expected:
+            print(f"  FAIL {text!r}: expected {expected}, got {found}")
+            failures += 1
+    print(f"cases: {len(CASES) - failures}/{len(CASES)} passed")
+    return failures
+
+
+def timed(fn, texts):
+    start = time.perf_counter()
+    hits = sum(1 for t in texts if fn(t))
+    return time.perf_counter() - start, hits
+
+
+def run(n_terms, n_texts, seed=42):
+    rng = random.Random(seed)
+    terms = list({random_word(rng, 6, 12) for _ in range(n_terms)})
+    vocabulary = ['fan', 'room', 'wifi', 'router', 'floor', 'water', 'mess', 'food',
+                  'broken', 'not', 'working', 'since', 'morning', 'please', 'fix']
+    texts = [make_complaint(rng, vocabulary) for _ in range(n_texts)]
+    # Roughly one in ten complaints contains a listed term
+    for i in range(0, n_texts, 10):
+        texts[i] += ' ' + rng.choice(terms)
+
+    start = time.perf_counter()
+    engine = ModerationEngine(terms)
+    compile_time = time.perf_counter() - start
+
+    legacy_time, legacy_hits = timed(lambda t: legacy_contains_bad_words(t, terms), texts)
+    engine_time, engine_hits = timed(engine.contains, texts)
+
+    print(f"terms={len(terms)} texts={n_texts}")
+    print(f"  compile (once per worker): {compile_time * 1000:8.2f} ms")
+    print(f"  legacy linear scan:        {legacy_time / n_texts * 1e6:8.1f} us/complaint  ({legacy_hits} flagged)")
+    print(f"  compiled engine:           {engine_time / n_texts * 1e6:8.1f} us/complaint  ({engine_hits} flagged)")
+    print(f"  speedup:                   {legacy_time / engine_time:8.1f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--terms', type=int, default=10000)
+    parser.add_argument('--texts', type=int, default=200)
+    args = parser.parse_args()
+    if check_cases():
+        sys.exit(1)
+    for n in sorted({1000, args.terms}):
+        run(n, args.texts)
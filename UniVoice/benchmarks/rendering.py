@@ -0,0 +1,134 @@
+"""
+Template load and render time for the complaint tables, with and without caching.
+
+Usage:
+    python -m benchmarks.rendering --db sqlite:///bench.db
+    python -m benchmarks.rendering --db sqlite:///bench.db --iterations 100 --output render.json
+
+Needs a dataset from benchmarks/datagen.py. Two measurements:
+  load   -- every template loaded into an empty environment, as a fresh
+            worker does: compiled from source vs read from the bytecode cache
+  render -- render_template() time of each page (signal to signal, so query
+            time is excluded): rows rendered every time vs from the fragment cache
+"""
+import argparse
+import json
+import time
+from flask import before_render_template, template_rendered
+from app import db, render_cache
+from app.models import Hostel
+from benchmarks import datagen
+from benchmarks.dashboards import login, percentile
+
+# (name, account role, url); {hostel_id} is the first generated hostel
+PAGES = [
+    ('warden_completed', 'warden', '/warden/dashboard?section=completed'),
+    ('warden_pending', 'warden', '/warden/dashboard?section=pending'),
+    ('mentor_dashboard', 'mentor', '/mentor/dashboard'),
+    ('admin_view_complaints', 'admin', '/admin/complaints?hostel_id={hostel_id}&status=resolved'),
+]
+
+
+class RenderTimer:
+    """
+    Time spent inside render_template() while connected to `app`.
+    """
+    def __init__(self, app):
+        self.elapsed = 0.0
+        self._started = None
+        before_render_template.connect(self._start, app)
+        template_rendered.connect(self._stop, app)
+
+    def _start(self, sender, **extra):
+        self._started = time.perf_counter()
+
+    def _stop(self, sender, **extra):
+        self.elapsed += time.perf_counter() - self._started
+
+
+def p50_ms(samples):
+    return round(percentile(sorted(samples), 50) * 1000, 3)
+
+
+def time_loads(env, names, iterations):
+    samples = []
+    for _ in range(iterations):
+        env.cache.clear()
+        start = time.perf_counter()
+        for name in names:
+            env.get_template(name)
+        samples.append(time.perf_counter() - start)
+    return p50_ms(samples)
+
+
+def bench_load(app, iterations):
+    env = app.jinja_env
+    names = [n for n in env.list_templates() if n.endswith('.html')]
+    bytecode_cache = env.bytecode_cache
+
+    env.bytecode_cache = None
+    source = time_loads(env, names, iterations)
+    env.bytecode_cache = bytecode_cache
+    if bytecode_cache is None:
+        return {'templates': len(names), 'source_ms': source, 'bytecode_ms': None}
+    time_loads(env, names, 1)  # make sure every template is in the cache
+    return {'templates': len(names), 'source_ms': source, 'bytecode_ms': time_loads(env, names, iterations)}
+
+
+def time_renders(client, timer, url, iterations):
+    samples = []
+    for _ in range(iterations):
+        timer.elapsed = 0.0
+        response = client.get(url)
+        if response.status_code >= 400:
+            raise RuntimeError(f'GET {url} returned {response.status_code}')
+        samples.append(timer.elapsed)
+    return p50_ms(samples)
+
+
+def bench_render(app, timer, role, url, iterations):
+    client = app.test_client()
+    login(client, role)
+    client.get(url)  # warm up the compiled templates and the fragment cache
+
+    render_cache.enabled = False
+    uncached = time_renders(client, timer, url, iterations)
+    render_cache.enabled = True
+    cached = time_renders(client, timer, url, iterations)
+    return {'uncached_ms': uncached, 'fragments_ms': cached,
+            'speedup': round(uncached / cached, 2) if cached else None}
+
+
+def run(app, iterations=50, log=print):
+    with app.app_context():
+        hostel_id = db.session.query(db.func.min(Hostel.id)).scalar()
+        db.session.remove()
+
+    load = bench_load(app, max(3, iterations // 10))
+    log(f"  template load ({load['templates']} templates)   source {load['source_ms']:8.2f} ms  "
+        f"bytecode {load['bytecode_ms'] or 0:8.2f} ms")
+
+    timer = RenderTimer(app)
+    renders = {}
+    for name, role, url in PAGES:
+        r = renders[name] = bench_render(app, timer, role, url.format(hostel_id=hostel_id), iterations)
+        log(f"  {name:<24} render {r['uncached_ms']:8.2f} ms  with fragments {r['fragments_ms']:8.2f} ms  "
+            f"({r['speedup']}x)")
+    return {'load': load, 'render': renders}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--db', default='sqlite:///bench.db', help='Database URL of a generated dataset.')
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--output', help='Write results as JSON to this file.')
+    args = parser.parse_args()
+
+    app = datagen.create_bench_app(args.db)
+    print(f'Rendering benchmark on {args.db} ({args.iterations} iterations)')
+    report = run(app, iterations=args.iterations)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'Results written to {args.output}')
\ No newline at end of file
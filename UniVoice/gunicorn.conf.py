@@ -0,0 +1,43 @@
+import multiprocessing
+import os
+
+# gunicorn -c gunicorn.conf.py wsgi:app
+#
+# gthread workers: each process serves requests from a pool of threads.
+# Dashboard traffic is short reads and writes that mostly wait on the
+# database, so threads overlap well. The Server-Sent Events streams
+# (/events, opened by warden, mentor and admin dashboards) each hold a
+# thread while open, for up to EVENTS_MAX_STREAM seconds. A process accepts
+# at most EVENTS_MAX_STREAMS (24) of them and answers further ones with 503,
+# so GUNICORN_THREADS - EVENTS_MAX_STREAMS threads (8 by default) are always
+# left for page requests. The deployment therefore holds
+# workers x EVENTS_MAX_STREAMS live dashboards; raise both settings together
+# for more. Streams hold no database connection, so keep
+# DB_POOL_SIZE + DB_MAX_OVERFLOW >= GUNICORN_THREADS - EVENTS_MAX_STREAMS.
+#
+# With more than one worker, set EVENTS_BROKER=redis so live updates reach
+# streams held by other processes.
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+worker_class = 'gthread'
+workers = int(os.getenv('WEB_CONCURRENCY', min(multiprocessing.cpu_count() * 2 + 1, 8)))
+threads = int(os.getenv('GUNICORN_THREADS', 32))
+
+# Engines, the task runner and broker threads are created per worker, after fork
+preload_app = False
+
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers now and then; open event streams just reconnect
+max_requests = 2000
+max_requests_jitter = 200
+
+# Heartbeat file in memory rather than on a (possibly slow) container disk
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('LOG_LEVEL', 'info')
\ No newline at end of file
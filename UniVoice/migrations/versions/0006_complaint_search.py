@@ -0,0 +1,76 @@
+"""complaint full-text search
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 09:02:41.118402
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+# Kept in step with app/search.py. On SQLite, a later batch migration that
+# recreates `complaints` drops the triggers: run `flask rebuild-search-index` after it.
+
+SQLITE_UPGRADE = [
+    """CREATE VIRTUAL TABLE complaints_fts USING fts5(
+        heading, description, content='complaints', content_rowid='id', tokenize='porter unicode61')""",
+    """CREATE TRIGGER complaints_fts_ai AFTER INSERT ON complaints BEGIN
+        INSERT INTO complaints_fts(rowid, heading, description) VALUES (new.id, new.heading, new.description);
+    END""",
+    """CREATE TRIGGER complaints_fts_ad AFTER DELETE ON complaints BEGIN
+        INSERT INTO complaints_fts(complaints_fts, rowid, heading, description)
+        VALUES ('delete', old.id, old.heading, old.description);
+    END""",
+    """CREATE TRIGGER complaints_fts_au AFTER UPDATE OF heading, description ON complaints BEGIN
+        INSERT INTO complaints_fts(complaints_fts, rowid, heading, description)
+        VALUES ('delete', old.id, old.heading, old.description);
+        INSERT INTO complaints_fts(rowid, heading, description) VALUES (new.id, new.heading, new.description);
+    END""",
+    "INSERT INTO complaints_fts(complaints_fts) VALUES ('rebuild')",
+]
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS complaints_fts_au",
+    "DROP TRIGGER IF EXISTS complaints_fts_ad",
+    "DROP TRIGGER IF EXISTS complaints_fts_ai",
+    "DROP TABLE IF EXISTS complaints_fts",
+]
+
+POSTGRES_UPGRADE = [
+    # Generated column: kept in sync by the database on every insert/update
+    """ALTER TABLE complaints ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(heading, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        ) STORED""",
+    "CREATE INDEX ix_complaints_search ON complaints USING gin (search_vector)",
+]
+POSTGRES_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_complaints_search",
+    "ALTER TABLE complaints DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def _statements(sqlite, postgres):
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        return postgres
+    if dialect == 'sqlite':
+        return sqlite
+    return []
+
+
+def upgrade():
+    for stmt in _statements(SQLITE_UPGRADE, POSTGRES_UPGRADE):
+        op.execute(stmt)
+
+
+def downgrade():
+    for stmt in _statements(SQLITE_DOWNGRADE, POSTGRES_DOWNGRADE):
+        op.execute(stmt)
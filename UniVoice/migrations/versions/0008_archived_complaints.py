@@ -0,0 +1,107 @@
+"""archived complaints
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 09:06:42.536030
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+# The enum types already exist on PostgreSQL (created with `complaints`)
+category = postgresql.ENUM('ELECTRIC', 'TOILET', 'WIFI', 'MESS', 'PERSONAL', 'OTHERS',
+                           name='category', create_type=False)
+complaintstatus = postgresql.ENUM('PENDING', 'IN_PROGRESS', 'RESOLVED', 'FLAGGED', 'REJECTED',
+                                  name='complaintstatus', create_type=False)
+
+# Search index over the archive, kept in step with app/search.py
+SQLITE_UPGRADE = [
+    """CREATE VIRTUAL TABLE archived_complaints_fts USING fts5(
+        heading, description, content='archived_complaints', content_rowid='id', tokenize='porter unicode61')""",
+    """CREATE TRIGGER archived_complaints_fts_ai AFTER INSERT ON archived_complaints BEGIN
+        INSERT INTO archived_complaints_fts(rowid, heading, description) VALUES (new.id, new.heading, new.description);
+    END""",
+    """CREATE TRIGGER archived_complaints_fts_ad AFTER DELETE ON archived_complaints BEGIN
+        INSERT INTO archived_complaints_fts(archived_complaints_fts, rowid, heading, description)
+        VALUES ('delete', old.id, old.heading, old.description);
+    END""",
+]
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS archived_complaints_fts_ad",
+    "DROP TRIGGER IF EXISTS archived_complaints_fts_ai",
+    "DROP TABLE IF EXISTS archived_complaints_fts",
+]
+
+POSTGRES_UPGRADE = [
+    """ALTER TABLE archived_complaints ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(heading, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        ) STORED""",
+    "CREATE INDEX ix_archived_complaints_search ON archived_complaints USING gin (search_vector)",
+]
+POSTGRES_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_archived_complaints_search",
+]
+
+
+def _statements(sqlite, postgres):
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        return postgres
+    if dialect == 'sqlite':
+        return sqlite
+    return []
+
+
+def upgrade():
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table('archived_complaints',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('heading', sa.String(length=100), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('category', category, nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('resolved_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.Column('status', complaintstatus, nullable=True),
+    sa.Column('is_urgent', sa.Boolean(), nullable=True),
+    sa.Column('is_abusive', sa.Boolean(), nullable=True),
+    sa.Column('mentor_comment', sa.Text(), nullable=True),
+    sa.Column('warden_comment', sa.Text(), nullable=True),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('hostel_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['hostel_id'], ['hostels.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('archived_complaints', schema=None) as batch_op:
+        batch_op.create_index('ix_archived_complaints_hostel_created', ['hostel_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_archived_complaints_user_created', ['user_id', 'created_at'], unique=False)
+
+    # ### end Alembic commands ###
+
+    for stmt in _statements(SQLITE_UPGRADE, POSTGRES_UPGRADE):
+        op.execute(stmt)
+
+
+def downgrade():
+    for stmt in _statements(SQLITE_DOWNGRADE, POSTGRES_DOWNGRADE):
+        op.execute(stmt)
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table('archived_complaints', schema=None) as batch_op:
+        batch_op.drop_index('ix_archived_complaints_user_created')
+        batch_op.drop_index('ix_archived_complaints_hostel_created')
+
+    op.drop_table('archived_complaints')
+    # ### end Alembic commands ###
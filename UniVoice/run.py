@@ -1,7 +1,9 @@
 from app import create_app
+from config import DevelopmentConfig
 
-app = create_app()
+app = create_app(DevelopmentConfig)
 
+# Development server. In production use:  gunicorn -c gunicorn.conf.py wsgi:app
 if __name__ == '__main__':
     # Host='0.0.0.0' is required for Docker to expose the port
     app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
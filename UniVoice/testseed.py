@@ -1,6 +1,9 @@
 import random
 from app import create_app, db
 from app.models import User, UserRole, Hostel, Room, Complaint
+from app.passwords import hash_passwords
+from app.rooms import rebuild_occupancy
+from app.search import install_search_index
 
 app = create_app()
 
@@ -11,9 +14,13 @@ def seed_test_data():
         db.drop_all()
         db.create_all()
 
+        # Hash every account's password up front in parallel:
+        # 1 admin + 5 wardens + 5 mentors + 20 students
+        password_hashes = iter(hash_passwords(['12345'] * 31))
+
         # 2. Create Super Admin
         admin = User(email='admin@kiit.ac.in', name='Super Admin', role=UserRole.ADMIN)
-        admin.set_password('12345')
+        admin.password_hash = next(password_hashes)
         db.session.add(admin)
 
         # 3. Create 4 Hostels
@@ -41,7 +48,7 @@ def seed_test_data():
                 role=UserRole.WARDEN,
                 hostel_id=h_id
             )
-            w.set_password('12345')
+            w.password_hash = next(password_hashes)
             db.session.add(w)
             wardens.append(w)
 
@@ -53,7 +60,7 @@ def seed_test_data():
                 name=f"Mentor Name {i}",
                 role=UserRole.MENTOR
             )
-            m.set_password('12345')
+            m.password_hash = next(password_hashes)
             db.session.add(m)
             mentors.append(m)
 
@@ -82,10 +89,14 @@ def seed_test_data():
                 mentor_id=m_id,
                 room_number=r_num
             )
-            s.set_password('12345')
+            s.password_hash = next(password_hashes)
             db.session.add(s)
 
         db.session.commit()
+        # Link students to their generated rooms and count occupancy
+        rebuild_occupancy()
+        # create_all() doesn't know about the full-text index
+        install_search_index()
         print("✅ Test Data Seeded Successfully!")
         print("Logins: student1@gmail.com, warden1@gmail.com, mentor1@gmail.com")
         print("Password for all: 12345")
@@ -0,0 +1,18 @@
+import logging
+import os
+from app import create_app
+from config import Config
+
+# Production entry point:  gunicorn -c gunicorn.conf.py wsgi:app
+# Settings come from config.Config (i.e. environment variables);
+# run.py starts the development server instead.
+
+logging.basicConfig(level=os.getenv('LOG_LEVEL', 'info').upper(),
+                    format='%(asctime)s %(levelname)s [%(process)d] %(name)s: %(message)s')
+
+# Sessions are signed with SECRET_KEY; never fall back to a key that is in the repo
+if not os.environ.get('SECRET_KEY'):
+    raise RuntimeError('SECRET_KEY is not set. Generate one with: '
+                       'python -c "import secrets; print(secrets.token_hex(32))"')
+
+app = create_app(Config)
\ No newline at end of file